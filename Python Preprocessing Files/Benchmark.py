@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Times each stage of PolicyToCSV.py (listing, reading, comment stripping,
+column extraction, hash lookup, df build, metrics and csv write) on synthetic
+corpora from PolicyGenerator.py, along with the VectorizedRuleParser that
+replaces column extraction and hash lookup, and end to end runs of
+BNFdfWithMeatadata, streamed and with a df.  The df build stage collects our
+rows in a RuleBuffer and fills the df of a BNFdf from it, as BNFdf does.
+Results are written as JSON, and can be compared against an earlier run so
+regressions are caught.
+
+Stages are timed over the whole corpus one after another, so each stage holds
+the output of the stage before it in memory.  Corpora of 10 million rules need
+several GB.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import numpy
+import pandas
+import PolicyToCSV
+import PolicyMetrics
+import PolicyGenerator
+import VectorizedRuleParser
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+DEFAULT_SIZES = (1000, 100000, 10000000)
+# each doubling, so a linear build takes twice as long at each size
+DEFAULT_SCALING_SIZES = (12500, 25000, 50000, 100000, 200000)
+DEFAULT_SEED = 0
+# a stage this much slower than in our compared run is a regression
+DEFAULT_TOLERANCE = 0.10
+# stages quicker than this are mostly timer noise, so they are never regressions
+MIN_COMPARED_SECONDS = 0.05
+
+STAGES = ("listing", "reading", "comment stripping", "column extraction", "hash lookup", "vectorized parse",
+          "df build", "metrics", "csv write", "end to end stream", "end to end df")
+
+
+def get_corpus(corpus_location, rules, seed, rules_per_file=PolicyGenerator.DEFAULT_RULES_PER_FILE):
+    """
+    Gets a directory of synthetic policy files, generating it unless a complete one is already there.
+
+    :param corpus_location: String.  Directory path our corpora are kept in.
+    :param rules: Integer.  Number of rules in our corpus.
+    :param seed: Integer.  Seed of our corpus.
+    :param rules_per_file: Integer.  Number of rules in each policy file.
+    :return: String.  Directory path of our corpus.
+    """
+    location = os.path.join(corpus_location, str(rules) + "_rules_seed" + str(seed))
+    # our metadata is written last, so a corpus without it was interrupted
+    if not os.path.exists(os.path.join(location, PolicyGenerator.METADATA_NAME)):
+        shutil.rmtree(location, ignore_errors=True)
+        PolicyGenerator.PolicyGenerator(seed).write_corpus(location, rules, rules_per_file)
+
+    return location
+
+
+def run_stages(files_location, out_location, workers=1):
+    """
+    Times each of our stages on a corpus.
+
+    :param files_location: String.  Directory path of our corpus.
+    :param out_location: String.  Directory path our csvs are written to.
+    :param workers: Integer.  Number of worker processes of our end to end runs.
+    :return: Tupple.  Dict of our seconds per stage, and our number of files.
+    """
+    seconds = {}
+
+    start = time.perf_counter()
+    completed_files = sorted(name for name in os.listdir(files_location) if not name.endswith(".txt"))
+    seconds["listing"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    completed_files_imported = []
+    for name in completed_files:
+        with open(os.path.join(files_location, name)) as completed_file:
+            completed_files_imported.append(completed_file.read())
+    seconds["reading"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    policies = [PolicyToCSV.get_completed_policies(imported) for imported in completed_files_imported]
+    seconds["comment stripping"] = time.perf_counter() - start
+    del completed_files_imported
+
+    rule_parser = PolicyToCSV.RuleParser.RuleParser()
+    start = time.perf_counter()
+    parsed_rules = [rule_parser.parse_rule(rule) for file_policies in policies for rule in file_policies]
+    seconds["column extraction"] = time.perf_counter() - start
+
+    hash_table = PolicyToCSV.TreeStructureHash.HashTable()
+    start = time.perf_counter()
+    children = VectorizedRuleParser.get_children_columns([parsed_rule[4] for parsed_rule in parsed_rules], hash_table)
+    seconds["hash lookup"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized_parser = VectorizedRuleParser.VectorizedRuleParser(hash_table)
+    vectorized_parser.parse_rules([rule for file_policies in policies for rule in file_policies])
+    seconds["vectorized parse"] = time.perf_counter() - start
+
+    # the rows of parse_completed_file, in the order of ROW_COLUMNS, not timed
+    children_rows = zip(*(children[column] for column in VectorizedRuleParser.ROW_COLUMNS[:7]))
+    del children
+    rows = [children_row + (rule + ".",) + parsed_rule[4:] + parsed_rule[:4]
+            for children_row, rule, parsed_rule in zip(children_rows, (rule for file_policies in policies
+                                                                       for rule in file_policies), parsed_rules)]
+    rules_per_file = [len(file_policies) for file_policies in policies]
+    del policies, parsed_rules
+
+    # a streamed BNFdf has our enricher and columns, and nothing parsed
+    BNF_df = PolicyToCSV.BNFdfWithMeatadata(files_location, stream=True)
+    start = time.perf_counter()
+    offset = 0
+    for file_rules in rules_per_file:
+        BNF_df.rules.add_file(rows[offset:offset + file_rules])
+        offset += file_rules
+    df = BNF_df._fill_BNFdf()
+    seconds["df build"] = time.perf_counter() - start
+    del rows
+
+    start = time.perf_counter()
+    PolicyMetrics.get_columns(BNF_df.rules)
+    seconds["metrics"] = time.perf_counter() - start
+    del BNF_df
+
+    start = time.perf_counter()
+    PolicyToCSV.export_df(df, out_location, "stages")
+    seconds["csv write"] = time.perf_counter() - start
+    del df
+
+    start = time.perf_counter()
+    BNF_df = PolicyToCSV.BNFdfWithMeatadata(files_location, stream=True, workers=workers)
+    BNF_df.export_BNFdf(out_location, "end_to_end_stream")
+    seconds["end to end stream"] = time.perf_counter() - start
+    del BNF_df
+
+    start = time.perf_counter()
+    BNF_df = PolicyToCSV.BNFdfWithMeatadata(files_location, workers=workers)
+    BNF_df.export_BNFdf(out_location, "end_to_end_df")
+    seconds["end to end df"] = time.perf_counter() - start
+
+    return seconds, len(completed_files)
+
+
+def run_benchmark(sizes, corpus_location, workers=1, seed=DEFAULT_SEED):
+    """
+    Benchmarks each of our corpus sizes.
+
+    :param sizes: List of integers.  Number of rules in each of our corpora.
+    :param corpus_location: String.  Directory path our corpora are kept in.
+    :param workers: Integer.  Number of worker processes of our end to end runs.
+    :param seed: Integer.  Seed of our corpora.
+    :return: Dict.  Our results.
+    """
+    results = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+               "python": platform.python_version(),
+               "pandas": pandas.__version__,
+               "platform": platform.platform(),
+               "cpus": os.cpu_count(),
+               "workers": workers,
+               "seed": seed,
+               "runs": []}
+
+    for rules in sizes:
+        files_location = get_corpus(corpus_location, rules, seed)
+        out_location = tempfile.mkdtemp(prefix="benchmark_")
+        try:
+            seconds, files = run_stages(files_location, out_location, workers)
+        finally:
+            shutil.rmtree(out_location, ignore_errors=True)
+
+        results["runs"].append({"rules": rules,
+                                "files": files,
+                                "seconds": seconds,
+                                "rules_per_second": {stage: rules / max(seconds[stage], 1e-9) for stage in seconds}})
+        print_run(results["runs"][-1])
+
+    return results
+
+
+def run_scaling(sizes, corpus_location, seed=DEFAULT_SEED):
+    """
+    Times building a BNFdf for each of our corpus sizes, and fits the exponent of our build time in our number of
+    rules.  An exponent near 1 is linear, near 2 is quadratic.
+
+    :param sizes: List of integers.  Number of rules in each of our corpora.
+    :param corpus_location: String.  Directory path our corpora are kept in.
+    :param seed: Integer.  Seed of our corpora.
+    :return: Dict.  Our runs and our exponent.
+    """
+    scaling = {"runs": [], "exponent": None}
+
+    for rules in sizes:
+        files_location = get_corpus(corpus_location, rules, seed)
+        start = time.perf_counter()
+        BNF_df = PolicyToCSV.BNFdfWithMeatadata(files_location)
+        seconds = time.perf_counter() - start
+
+        scaling["runs"].append({"rules": len(BNF_df.rules),
+                                "files": len(BNF_df.completed_file_names),
+                                "seconds": seconds,
+                                "microseconds_per_rule": seconds / max(rules, 1) * 1e6})
+        print("%10d rules %10.3fs %8.2f us/rule" % (rules, seconds, scaling["runs"][-1]["microseconds_per_rule"]))
+
+    if len(sizes) > 1:
+        # slope of log(seconds) against log(rules)
+        scaling["exponent"] = float(numpy.polyfit(numpy.log([run["rules"] for run in scaling["runs"]]),
+                                                  numpy.log([run["seconds"] for run in scaling["runs"]]), 1)[0])
+        print("Build time grows as rules^%.2f" % scaling["exponent"])
+
+    return scaling
+
+
+def print_run(run):
+    """
+    Prints the seconds and rules/sec of each stage of a run.
+
+    :param run: Dict.  One of our runs.
+    :return: VOID
+    """
+    print(str(run["rules"]) + " rules in " + str(run["files"]) + " files:")
+    for stage in STAGES:
+        print("  %-18s %10.3fs %14.0f rules/sec" % (stage, run["seconds"][stage], run["rules_per_second"][stage]))
+
+
+def compare_results(results, previous, tolerance=DEFAULT_TOLERANCE):
+    """
+    Prints how much each stage has changed since an earlier run of the same corpus sizes.
+
+    :param results: Dict.  Our results.
+    :param previous: Dict.  Results of our earlier run.
+    :param tolerance: Float.  Stages slower than this fraction are regressions.
+    :return: Integer.  Number of regressions.
+    """
+    previous_runs = {run["rules"]: run for run in previous["runs"]}
+    regressions = 0
+    for run in results["runs"]:
+        if run["rules"] not in previous_runs:
+            continue
+        print(str(run["rules"]) + " rules compared to " + previous["created"] + ":")
+        for stage in STAGES:
+            before = previous_runs[run["rules"]]["seconds"].get(stage)
+            if before is None:   # added since our earlier run
+                continue
+            change = run["seconds"][stage] / max(before, 1e-9) - 1
+            regression = change > tolerance and run["seconds"][stage] >= MIN_COMPARED_SECONDS
+            regressions += regression
+            print("  %-18s %10.3fs -> %10.3fs %+7.1f%%%s" % (stage, before, run["seconds"][stage], change * 100,
+                                                             "  REGRESSION" if regression else ""))
+
+    return regressions
+
+
+def get_arguments():
+    """
+    Gets our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(description="Times each stage of PolicyToCSV.py on synthetic corpora.")
+    parser.add_argument("--sizes", default=None,
+                        help="comma separated rules in each corpus (default " +
+                             ",".join(str(size) for size in DEFAULT_SIZES) + ", or " +
+                             ",".join(str(size) for size in DEFAULT_SCALING_SIZES) + " with --scaling)")
+    parser.add_argument("--scaling", action="store_true",
+                        help="only time building a BNFdf at each size, and fit how build time grows with rules")
+    parser.add_argument("--output", default="benchmark_results.json", metavar="FILE",
+                        help="JSON file our results are written to (default %(default)s)")
+    parser.add_argument("--corpus-dir", default=None, metavar="DIR",
+                        help="keep generated corpora in DIR and reuse them in later runs "
+                             "(default: a temporary directory, removed afterwards)")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="worker processes of the end to end run (default %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed of our corpora (default %(default)s)")
+    parser.add_argument("--compare", default=None, metavar="FILE",
+                        help="JSON results of an earlier run, exits with 1 if any stage regressed")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="fraction a stage may slow down before it is a regression (default %(default)s)")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    if arguments.sizes is not None:
+        sizes = [int(size) for size in arguments.sizes.split(",")]
+    else:
+        sizes = DEFAULT_SCALING_SIZES if arguments.scaling else DEFAULT_SIZES
+
+    corpus_location = arguments.corpus_dir or tempfile.mkdtemp(prefix="benchmark_corpora_")
+    try:
+        if arguments.scaling:
+            results = run_benchmark([], corpus_location, arguments.workers, arguments.seed)
+            results["scaling"] = run_scaling(sizes, corpus_location, arguments.seed)
+        else:
+            results = run_benchmark(sizes, corpus_location, arguments.workers, arguments.seed)
+    finally:
+        if arguments.corpus_dir is None:
+            shutil.rmtree(corpus_location, ignore_errors=True)
+
+    with open(arguments.output, "w") as results_file:
+        json.dump(results, results_file, indent=2)
+    print("Results written to " + arguments.output)
+
+    if arguments.compare is not None:
+        with open(arguments.compare) as previous_file:
+            previous = json.load(previous_file)
+        if compare_results(results, previous, arguments.tolerance) > 0:
+            sys.exit(1)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Builds everything derived from our grammar table, grammarTable.csv, the one
+place our base BNF rules and their children in the tree are defined:
+
+GrammarIndex.py: our hash table and the word trie it is searched with, as
+literals, so TreeStructureHash loads them with its module instead of building
+them for every HashTable.
+
+treeDataStructure.csv: the tree of our visualization tool, our children in the
+order of our grammar table.
+
+Our grammar table is validated first.  Each link of the tree is found by the
+visualization tool by the names of its two ends (see drawTree in
+drawingFunctions.js), so two links with the same names, e.g. "Equal to" to
+"The user ID" under both "\\s" and "With a substring", would be highlighted
+together.  Such children are told apart by a trailing space, and every link
+that is still ambiguous is reported, along with repeated keys or children.
+
+Run after every edit of grammarTable.csv:
+    python3 BuildGrammar.py
+or, to only check that the built files are up to date:
+    python3 BuildGrammar.py --check
+"""
+
+import io
+import os
+import re
+import csv
+import sys
+import hashlib
+import argparse
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR_PATH = os.path.join(DIRECTORY, "grammarTable.csv")
+INDEX_PATH = os.path.join(DIRECTORY, "GrammarIndex.py")
+TREE_PATH = os.path.join(DIRECTORY, "..", "Visualization Tool", "Visualization Software", "treeDataStructure.csv")
+
+CHILDREN_COLUMNS = ["child0", "child1", "child2", "child3", "child4", "child5"]
+GRAMMAR_COLUMNS = ["key"] + CHILDREN_COLUMNS
+# every rule of our tree is drawn under this verb, the verbs of a csv are only colors
+TREE_VERB = "X"
+# characters removed from link ids, see drawTree in drawingFunctions.js
+_LINK_ID_PATTERN = re.compile(r"[/+()]")
+
+
+class GrammarError(ValueError):
+    """
+    Raised when our grammar table cannot be built, with every problem found.
+    """
+
+    def __init__(self, problems):
+        """
+        :param problems: List of strings.  Each problem, with its line of our grammar table.
+        """
+        self.problems = list(problems)
+        super().__init__("Grammar table is invalid:\n" + "\n".join(self.problems))
+
+
+def read_grammar(grammar_path=GRAMMAR_PATH):
+    """
+    Reads our grammar table.
+
+    :param grammar_path: String.  Path of our grammar table.
+    :return: List of tupples.  Line number, key and list of 6 children of each of our rules.
+    """
+    with open(grammar_path, newline="") as grammar_file:
+        reader = csv.reader(grammar_file)
+        if next(reader, None) != GRAMMAR_COLUMNS:
+            raise GrammarError(["line 1: header must be " + ",".join(GRAMMAR_COLUMNS)])
+
+        rules = []
+        problems = []
+        for row in reader:
+            if len(row) != len(GRAMMAR_COLUMNS):
+                problems.append("line %d: %d columns instead of %d" % (reader.line_num, len(row),
+                                                                     len(GRAMMAR_COLUMNS)))
+            else:
+                rules.append((reader.line_num, row[0], row[1:]))
+    if len(problems) > 0:
+        raise GrammarError(problems)
+
+    return rules
+
+
+def get_link_id(parent, child):
+    """
+    Gets the id our visualization tool gives the link between two children, without its verb.
+
+    :param parent: String.  Name of our link's parent.
+    :param child: String.  Name of our link's child.
+    :return: String.  Our link id.
+    """
+    return _LINK_ID_PATTERN.sub("", parent + "," + child)
+
+
+def validate_grammar(rules):
+    """
+    Checks that every key and every rule of our tree are unique, that children have no gaps and that every link of
+    our tree can be told apart by our visualization tool.
+
+    :param rules: List of tupples.  See read_grammar.
+    :return: VOID
+    """
+    problems = []
+    key_lines = {}
+    children_lines = {}
+    link_paths = {}   # link id: path of children to the link's child, line
+    for line, key, children in rules:
+        # keys are searched word by word, so keys that only differ in spaces are the same key
+        words = " ".join(key.split())
+        if words == "":
+            problems.append("line %d: empty key" % line)
+        elif words in key_lines:
+            problems.append("line %d: key %r repeats line %d" % (line, key, key_lines[words]))
+        key_lines.setdefault(words, line)
+
+        if tuple(children) in children_lines:
+            problems.append("line %d: children repeat line %d, so both keys are the same rule of the tree"
+                            % (line, children_lines[tuple(children)]))
+        children_lines.setdefault(tuple(children), line)
+
+        depth = children.index("") if "" in children else len(children)
+        if depth == 0 or any(child != "" for child in children[depth:]):
+            problems.append("line %d: children must be filled from child0 without gaps" % line)
+            continue
+
+        for i in range(1, depth):
+            link_id = get_link_id(children[i - 1], children[i])
+            path = tuple(children[:i + 1])
+            other_path, other_line = link_paths.setdefault(link_id, (path, line))
+            if other_path != path:
+                problems.append("line %d: link %r of %s is also the link of %s on line %d, add a trailing space to "
+                                "one of these children" % (line, link_id, " > ".join(path), " > ".join(other_path),
+                                                           other_line))
+    if len(problems) > 0:
+        raise GrammarError(problems)
+
+
+def build_trie(hash_table):
+    """
+    Builds a word trie over the keys of our hash table.  Each node is a dict of the next words of our keys, and
+    the node that ends a key holds the key and its children under None (TreeStructureHash._KEY_END).
+
+    :param hash_table: Dict.  Our keys and their children.
+    :return: Dict.  The root of our trie.
+    """
+    trie = {}
+    for key, children in hash_table.items():
+        node = trie
+        for word in key.split():
+            node = node.setdefault(word, {})
+        node[None] = (key, children)
+
+    return trie
+
+
+def get_index_source(rules, digest):
+    """
+    Writes our hash table and trie as the source of GrammarIndex.py.
+
+    :param rules: List of tupples.  See read_grammar.
+    :param digest: String.  Hex digest of our grammar table.
+    :return: String.  Our Python source.
+    """
+    hash_table = {key: children for line, key, children in rules}
+    source = io.StringIO()
+    source.write('"""\nGenerated by BuildGrammar.py from grammarTable.csv, do not edit.\n"""\n\n')
+    source.write("# hex digest of the grammar table this was built from\n")
+    source.write("GRAMMAR_DIGEST = %r\n\n" % digest)
+    source.write("# base BNF rule: [child0, child1, child2, child3, child4, child5]\n")
+    source.write("HASH_TABLE = {\n")
+    for key, children in hash_table.items():
+        source.write("    %r: %r,\n" % (key, children))
+    source.write("}\n\n")
+    source.write("# word trie over the keys of HASH_TABLE, see BuildGrammar.build_trie\n")
+    source.write("TRIE = %r\n" % (build_trie(hash_table),))
+
+    return source.getvalue()
+
+
+def get_tree_source(rules):
+    """
+    Writes our children as the source of treeDataStructure.csv.
+
+    :param rules: List of tupples.  See read_grammar.
+    :return: String.  Our csv, with its header.
+    """
+    source = io.StringIO()
+    writer = csv.writer(source, lineterminator="\n")
+    writer.writerow(["verb"] + CHILDREN_COLUMNS)
+    writer.writerows([TREE_VERB] + children for line, key, children in rules)
+
+    return source.getvalue()
+
+
+def build(grammar_path=GRAMMAR_PATH, index_path=INDEX_PATH, tree_path=TREE_PATH, check=False):
+    """
+    Validates our grammar table and writes every file built from it.
+
+    :param grammar_path: String.  Path of our grammar table.
+    :param index_path: String.  Path of GrammarIndex.py.
+    :param tree_path: String.  Path of treeDataStructure.csv.
+    :param check: Boolean.  If True, nothing is written, and the paths of built files that are out of date are
+                  returned instead.
+    :return: List of strings.  Paths of files that were, or with check would be, written.
+    """
+    with open(grammar_path, "rb") as grammar_file:
+        digest = hashlib.sha1(grammar_file.read()).hexdigest()
+    rules = read_grammar(grammar_path)
+    validate_grammar(rules)
+
+    changed = []
+    for path, source in ((index_path, get_index_source(rules, digest)), (tree_path, get_tree_source(rules))):
+        if os.path.isfile(path):
+            with open(path, newline="") as built_file:
+                if built_file.read() == source:
+                    continue
+        changed.append(path)
+        if not check:
+            with open(path, "w", newline="") as built_file:
+                built_file.write(source)
+
+    return changed
+
+
+def get_arguments():
+    """
+    Parses our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(description="Validates grammarTable.csv and builds GrammarIndex.py and the "
+                                                 "visualization tool's treeDataStructure.csv from it.")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that the built files are up to date, exiting with 1 if they are not")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    try:
+        changed = build(check=arguments.check)
+    except GrammarError as e:
+        sys.exit(str(e))
+
+    for path in changed:
+        print(("Out of date: " if arguments.check else "Written: ") + os.path.relpath(path))
+    if arguments.check and len(changed) > 0:
+        sys.exit(1)
+    if len(changed) == 0:
+        print("Built files are up to date.")
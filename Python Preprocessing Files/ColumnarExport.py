@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Exports our BNFdfs to columnar Parquet and Arrow IPC files, and reads them back.
+
+Every string column is dictionary encoded, since our columns repeat a small
+vocabulary of values, while numeric columns (see PolicyMetrics) are kept as
+integers.  Rows are grouped by a column (e.g. Grammar or Sector) with one row
+group, or record batch, per value, so analyses of one group only read that
+group.  Both formats only read the columns asked for, and Arrow files are
+memory-mapped, so other columns are never read from disk.  Columns read are
+still copied into our df.
+
+Needs pyarrow, which is optional.  CSV output does not.  pandas is only
+imported once a df is exported or read, so importing this module is quick.
+"""
+
+import os
+import logging
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+FORMATS = ("csv", "parquet", "arrow")
+FILE_EXTENSIONS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+DEFAULT_PARTITION_BY = "Grammar"
+
+logger = logging.getLogger("ColumnarExport")
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, which only our columnar formats need.
+
+    :return: Module.  pyarrow.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow output need pyarrow, install it with: pip install pyarrow")
+
+    return pyarrow
+
+
+def _get_table(df, partition_by):
+    """
+    Converts our df into an Arrow table with dictionary encoded string columns, grouped by a column.
+
+    :param df: pandas.DataFrame.  Our BNFdf.
+    :param partition_by: String.  Column our rows are grouped by, or None to keep our rows in order.
+    :return: Tupple.  pyarrow.Table, and a list of the (offset, length) of each of our groups.
+    """
+    pyarrow = import_pyarrow()
+    import pandas
+
+    if partition_by is not None and partition_by not in df.columns:
+        logger.warning("No %s column, rows are not grouped.", partition_by)
+        partition_by = None
+
+    if partition_by is None:
+        groups = [(0, len(df))]
+    else:
+        # stable, so rows keep their order within each group
+        df = df.sort_values(partition_by, kind="stable").reset_index(drop=True)
+        lengths = df.groupby(partition_by, sort=True, observed=True).size()
+        offsets = lengths.cumsum() - lengths
+        groups = list(zip(offsets.tolist(), lengths.tolist()))
+
+    # numeric columns, see PolicyMetrics, are kept as numbers
+    df = df.astype({column: "category" for column in df.columns
+                    if not isinstance(df[column].dtype, pandas.CategoricalDtype)
+                    and not pandas.api.types.is_numeric_dtype(df[column].dtype)})
+    return pyarrow.Table.from_pandas(df, preserve_index=False), groups
+
+
+def export_parquet(df, file_path, partition_by=DEFAULT_PARTITION_BY):
+    """
+    Exports our df to a Parquet file, with a row group for each value of partition_by.
+
+    :param df: pandas.DataFrame.  Our BNFdf.
+    :param file_path: String.  Path of our Parquet file.
+    :param partition_by: String.  Column our row groups are split on, or None for a single row group.
+    :return: VOID
+    """
+    import_pyarrow()
+    import pyarrow.parquet
+
+    table, groups = _get_table(df, partition_by)
+    with pyarrow.parquet.ParquetWriter(file_path, table.schema) as writer:
+        for offset, length in groups:
+            writer.write_table(table.slice(offset, length), row_group_size=max(length, 1))
+
+
+def export_arrow(df, file_path, partition_by=DEFAULT_PARTITION_BY):
+    """
+    Exports our df to an Arrow IPC file, with a record batch for each value of partition_by.
+
+    :param df: pandas.DataFrame.  Our BNFdf.
+    :param file_path: String.  Path of our Arrow file.
+    :param partition_by: String.  Column our record batches are split on, or None for a single record batch.
+    :return: VOID
+    """
+    pyarrow = import_pyarrow()
+    import pyarrow.ipc
+
+    table, groups = _get_table(df, partition_by)
+    with pyarrow.ipc.new_file(file_path, table.schema) as writer:
+        for offset, length in groups:
+            # slices share our table's dictionaries, which Arrow files need
+            writer.write_table(table.slice(offset, length), max_chunksize=max(length, 1))
+
+
+def read_BNFdf(file_path, columns=None):
+    """
+    Reads a BNFdf exported as csv, Parquet or Arrow back into a df.  Parquet and Arrow files only read the
+    columns asked for, and Arrow files are memory-mapped, but our columns are copied into our df.
+
+    :param file_path: String.  Path of our file, its extension gives its format.
+    :param columns: List of strings.  Columns to read, or None for every column.
+    :return: pandas.DataFrame.  Our BNFdf.
+    """
+    import pandas
+
+    extension = os.path.splitext(file_path)[1]
+    if extension == FILE_EXTENSIONS["parquet"]:
+        import_pyarrow()
+        return pandas.read_parquet(file_path, columns=columns)
+
+    if extension == FILE_EXTENSIONS["arrow"]:
+        pyarrow = import_pyarrow()
+        import pyarrow.ipc
+
+        with pyarrow.memory_map(file_path) as source:
+            table = pyarrow.ipc.open_file(source).read_all()
+            if columns is not None:
+                table = table.select(columns)
+            return table.to_pandas()
+
+    import PolicyMetrics
+
+    # numeric columns, see PolicyMetrics, are read back as numbers, empty where they have no value
+    df = pandas.read_csv(file_path, usecols=columns, dtype=str, keep_default_na=False)
+    for column in PolicyMetrics.INTEGER_COLUMNS:
+        if column in df.columns:
+            df[column] = pandas.to_numeric(df[column].replace("", None)).astype("Int64")
+
+    return df
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Module contains a ParseCache object, an on-disk cache of the parsed rows of
+our "completed" files.  Entries are keyed by a hash of a file's contents, so
+unchanged files are never parsed twice, and are grouped by the version of our
+hash table, so editing grammarTable.csv (and regenerating GrammarIndex.py with
+BuildGrammar.py) invalidates every entry.  Each fuzzy distance keeps its own
+entries, so runs with different fuzzy distances share a cache.
+
+Only directories named as our versions are ever removed, see VERSION_PATTERN,
+so other files and directories in our cache location are left alone.
+"""
+
+import os
+import re
+import json
+import shutil
+import hashlib
+import tempfile
+import TreeStructureHash
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# Bump whenever the rows produced by PolicyToCSV.parse_completed_file change shape or meaning.
+CACHE_FORMAT_VERSION = "1"
+
+# 1 GB
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# names of our version directories: <CACHE_FORMAT_VERSION>-<hash table version>-<fuzzy distance>.  Directories
+# without a fuzzy distance were written before it was part of our name.
+VERSION_PATTERN = re.compile(r"(\d+)-([0-9a-f]{40})(?:-(\d+))?$")
+
+
+class ParseCache:
+    """
+    Stores parsed rows in <cache_location>/<version>/<content hash>.json, see VERSION_PATTERN.  Least recently
+    used entries are evicted once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_location, max_bytes=DEFAULT_MAX_BYTES, fuzzy_distance=0):
+        """
+        Constructor for our cache.  Entries left by other hash table or cache format versions are removed.
+
+        :param cache_location: String.  Directory path of our cache.  Created if it does not exist.
+        :param max_bytes: Integer.  Size our cache is evicted down to.
+        :param fuzzy_distance: Integer.  Fuzzy distance of the hash table our rows are parsed with.
+        """
+        self.cache_location = cache_location
+        self.max_bytes = max_bytes
+        self.hash_table_version = TreeStructureHash.get_hash_table().get_version()
+        self.version = "%s-%s-%d" % (CACHE_FORMAT_VERSION, self.hash_table_version, fuzzy_distance)
+        self.version_location = os.path.join(cache_location, self.version)
+
+        os.makedirs(self.version_location, exist_ok=True)
+        self._remove_stale_versions()
+
+    def _remove_stale_versions(self):
+        """
+        Removes the entries of every other hash table or cache format version.  Entries of our version with other
+        fuzzy distances are kept, and directories that are not versions of ours are never touched.
+
+        :return: VOID
+        """
+        for entry in os.scandir(self.cache_location):
+            match = VERSION_PATTERN.match(entry.name)
+            if match is None or not entry.is_dir(follow_symlinks=False):
+                continue
+            cache_format, hash_table_version, fuzzy_distance = match.groups()
+            if (cache_format != CACHE_FORMAT_VERSION or hash_table_version != self.hash_table_version
+                    or fuzzy_distance is None):
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _entry_path(self, completed_file_imported):
+        """
+        Gets the path of the entry for a "completed" file.
+
+        :param completed_file_imported: String.  Our "completed" file.
+        :return: String.  Path of its entry.
+        """
+        content_hash = hashlib.sha256(completed_file_imported.encode("utf-8")).hexdigest()
+        return os.path.join(self.version_location, content_hash + ".json")
+
+    def get(self, completed_file_imported):
+        """
+        Gets the cached rows of a "completed" file.
+
+        :param completed_file_imported: String.  Our "completed" file.
+        :return: List of lists.  Our rows, or None if the file has not been cached.
+        """
+        entry_path = self._entry_path(completed_file_imported)
+        try:
+            with open(entry_path) as entry:
+                rows = json.load(entry)
+        except (OSError, ValueError):   # missing, or partially written by a run that was killed
+            return None
+
+        os.utime(entry_path)   # most recently used
+        return rows
+
+    def put(self, completed_file_imported, rows):
+        """
+        Caches the rows of a "completed" file.  Written to a temporary file first, so concurrent workers never
+        see partial entries.
+
+        :param completed_file_imported: String.  Our "completed" file.
+        :param rows: List of lists.  Our rows.
+        :return: VOID
+        """
+        entry_path = self._entry_path(completed_file_imported)
+        handle, temp_path = tempfile.mkstemp(dir=self.version_location, suffix=".tmp")
+        with os.fdopen(handle, "w") as entry:
+            json.dump(rows, entry)
+        os.replace(temp_path, entry_path)
+
+    def evict(self):
+        """
+        Removes least recently used entries until our cache is no larger than max_bytes.
+
+        :return: VOID
+        """
+        entries = []
+        total_bytes = 0
+        for entry in os.scandir(self.version_location):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total_bytes += stat.st_size
+
+        entries.sort()
+        for mtime, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            os.remove(path)
+            total_bytes -= size
+
+    def clear(self):
+        """
+        Removes every entry.
+
+        :return: VOID
+        """
+        shutil.rmtree(self.version_location, ignore_errors=True)
+        os.makedirs(self.version_location, exist_ok=True)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Module contains a PolicyGenerator object, which writes directories of synthetic
+"completed" files and their metadata .txt file.  Rules are sampled from the keys
+of our hash table, with random verbs, variables, time units and char sets, so
+every rule generated can be parsed by PolicyToCSV.py.
+
+Used by Benchmark.py, and useful on its own for corpora far larger than our
+test directories.
+"""
+
+import os
+import random
+import argparse
+import RuleParser
+import TreeStructureHash
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+_VERBS = ("must", "must not", "should", "should not")
+_TIME_UNITS = ("seconds", "minutes", "hours", "days")
+_CHAR_SETS = ("upper-case letters", "lower-case letters", "letters (unspec)", "numbers", "whitespace",
+              "special characters (unspec)", "special characters (these special characters: !@#$%^&*)",
+              "control or non-printable characters (unspec)")
+_SECTORS = ("Financial", "Retail", "Government", "Education", "Healthcare", "Technology")
+_AUDIENCES = ("Customer", "Enterprise")
+
+# odds that a variable is left as USER_INPUT_WARNING, as our online system does when none is provided
+_USER_INPUT_ODDS = 0.05
+# odds that a policy file starts with a comment, comments are only supported before the first rule
+_COMMENT_ODDS = 0.5
+
+DEFAULT_RULES_PER_FILE = 25
+METADATA_NAME = "Metadata.txt"
+
+
+class PolicyGenerator:
+    """
+    Generates synthetic BNF rules, "completed" files and metadata.  The same seed always generates the same
+    corpus.
+    """
+
+    def __init__(self, seed=None):
+        """
+        Constructor for our generator.
+
+        :param seed: Integer.  Seed of our random numbers.
+        """
+        self.random = random.Random(seed)
+        self.hash_table = TreeStructureHash.get_hash_table()
+        self.keys = self.hash_table.get_keys()
+        self.rule_parser = RuleParser.RuleParser()
+
+    def _get_number(self):
+        """
+        Gets a random variable.
+
+        :return: String.  A number, or USER_INPUT_WARNING.
+        """
+        if self.random.random() < _USER_INPUT_ODDS:
+            return RuleParser.USER_INPUT_WARNING
+
+        return str(self.random.randint(1, 24))
+
+    def _get_char_set(self):
+        """
+        Gets a random char set of one to three sets.
+
+        :return: String.  Our char set.
+        """
+        return ", ".join(self.random.sample(_CHAR_SETS, self.random.randint(1, 3)))
+
+    def _sample_rule(self):
+        """
+        Samples a BNF rule from our keys, without its trailing period.
+
+        :return: String.  Our BNF rule.
+        """
+        words = self.random.choice(self.keys).split(" ")
+        words.insert(1, self.random.choice(_VERBS))   # our keys have no verb after "Users"
+        rule = " ".join(words)
+
+        if rule.endswith("sets:"):
+            rule += " " + self._get_char_set()
+        rule = rule.replace("/char set/", self._get_char_set())
+        rule = rule.replace("/time unit/", self.random.choice(_TIME_UNITS))
+        while "/number/" in rule:
+            rule = rule.replace("/number/", self._get_number(), 1)
+
+        return rule
+
+    def generate_rule(self):
+        """
+        Generates a BNF rule, without its trailing period, that PolicyToCSV.py can parse.  Some samples cannot
+        be, e.g. a lockout of USER_INPUT_WARNING with a time unit, or any of the "sets:" keys, whose bases never
+        match their key, so they are sampled again.
+
+        :return: String.  Our BNF rule.
+        """
+        while True:
+            rule = self._sample_rule()
+            try:
+                self.hash_table.get_verb_and_children(self.rule_parser.parse_rule(rule)[4])
+            except ValueError:
+                continue
+            return rule
+
+    def generate_policy(self, rules):
+        """
+        Generates the contents of a "completed" file.
+
+        :param rules: Integer.  Number of rules in our file.
+        :return: String.  Our "completed" file.
+        """
+        lines = []
+        if self.random.random() < _COMMENT_ODDS:
+            lines.append("# Synthetic policy")
+        lines.extend(self.generate_rule() + "." for i in range(rules))
+
+        return "\n".join(lines) + "\n"
+
+    def generate_metadata(self, file_name, policy_id):
+        """
+        Generates the metadata row of a "completed" file.
+
+        :param file_name: String.  Our "completed" file name.
+        :param policy_id: String.  Our policyId.
+        :return: String.  Our metadata row, without its line break.
+        """
+        return ("<filename>" + file_name + "</filename><policyId>" + policy_id + "</policyId><sector>" +
+                self.random.choice(_SECTORS) + "</sector><audience>" + self.random.choice(_AUDIENCES) +
+                "</audience>")
+
+    def write_corpus(self, location, rules, rules_per_file=DEFAULT_RULES_PER_FILE, metadata=True):
+        """
+        Writes a directory of "completed" files, and a metadata .txt file with a row for each of them.
+
+        :param location: String.  Directory path.  Created if it does not exist.
+        :param rules: Integer.  Total number of rules in our directory.
+        :param rules_per_file: Integer.  Number of rules in each file, the last file may have fewer.
+        :param metadata: Boolean.  If True, our metadata .txt file is written too.
+        :return: Integer.  Number of "completed" files written.
+        """
+        os.makedirs(location, exist_ok=True)
+        files = -(-rules // rules_per_file)
+        width = max(6, len(str(files)))   # names and policyIds sort in the same order
+
+        metadata_rows = []
+        for i in range(files):
+            file_name = "Policy" + str(i).zfill(width)
+            with open(os.path.join(location, file_name), "w") as completed_file:
+                completed_file.write(self.generate_policy(min(rules_per_file, rules - i * rules_per_file)))
+            if metadata:
+                metadata_rows.append(self.generate_metadata(file_name, "Company " + str(i).zfill(width)))
+
+        if metadata:
+            with open(os.path.join(location, METADATA_NAME), "w") as metadata_file:
+                metadata_file.write("\n".join(metadata_rows) + "\n")
+
+        return files
+
+
+def get_arguments():
+    """
+    Gets our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(description="Writes a directory of synthetic policy files for PolicyToCSV.py.")
+    parser.add_argument("outfolder_path", help="directory our policy files are written to")
+    parser.add_argument("rules", type=int, help="total number of rules to generate")
+    parser.add_argument("--rules-per-file", type=int, default=DEFAULT_RULES_PER_FILE, metavar="N",
+                        help="rules in each policy file (default %(default)s)")
+    parser.add_argument("--no-metadata", action="store_true", help="do not write a metadata .txt file")
+    parser.add_argument("--seed", type=int, default=None, help="seed, the same seed generates the same files")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    generator = PolicyGenerator(arguments.seed)
+    files = generator.write_corpus(arguments.outfolder_path, arguments.rules, arguments.rules_per_file,
+                                   not arguments.no_metadata)
+    print("Wrote " + str(arguments.rules) + " rules in " + str(files) + " files to " + arguments.outfolder_path)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Module computes the numeric columns of our BNFdfs, so analyses of millions of
+rules aggregate them with vectorized operations instead of parsing the strings
+of BNF var1 and BNF var2 again.
+
+For each variable, its integer value, its value in a normalized unit and that
+unit.  Durations are normalized to seconds, other units (characters, times,
+passwords, ...) are kept as they are.  For each policy (completed file),
+metrics of how strong it is, e.g. its minimum password length, taken from its
+strictest rule and repeated on each of its rules, see POLICY_METRICS.
+
+Every column is computed from the codes and numbers of a RuleBuffer, once per
+distinct unit or BNF base, and then expanded over our rules.  Integer columns
+are nullable, empty where a rule has no value, e.g. DEPENDS ON USER INPUT.
+"""
+
+import re
+import numpy
+import pandas
+import GrammarIndex
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# seconds in each time unit, months are 30 days and years 365 days
+SECONDS_PER_UNIT = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800, "month": 2592000,
+                    "year": 31536000}
+NORMALIZED_TIME_UNIT = "seconds"
+# our variables and their unit columns
+VARIABLES = (("BNF var1", "BNF var1 Unit"), ("BNF var2", "BNF var2 Unit"))
+# policy metrics: column, verb category and grammar keys of the rules they are taken from, and whether a policy's
+# strictest rule is the one with the largest or the smallest BNF var1
+POLICY_METRICS = (
+    ("Min Length", "required",
+     re.compile(r"Users create passwords with length greater than or equal to /number/ characters$"), "max"),
+    ("Lockout Threshold", "prohibited", re.compile(r"Users fail to authenticate /number/ times\b"), "min"),
+    ("Expiry Days", "required", re.compile(r"Users change passwords before /number/ days$"), "min"))
+
+INTEGER_COLUMNS = ([variable + suffix for variable, unit in VARIABLES for suffix in (" Value", " Normalized")]
+                   + [metric[0] for metric in POLICY_METRICS])
+COLUMNS = ([variable + suffix for variable, unit in VARIABLES for suffix in (" Value", " Normalized",
+                                                                               " Normalized Unit")]
+           + [metric[0] for metric in POLICY_METRICS])
+
+CHILDREN_COLUMNS = ["child0", "child1", "child2", "child3", "child4", "child5"]
+# children are unique to each key, see BuildGrammar.validate_grammar
+_KEYS_BY_CHILDREN = {tuple(children): key for key, children in GrammarIndex.HASH_TABLE.items()}
+# largest integer our columns hold
+_MAX_NUMBER = numpy.iinfo(numpy.int64).max
+
+
+def get_seconds_per_unit(unit):
+    """
+    Gets the seconds in one of a time unit, singular or plural.
+
+    :param unit: String.  A variable's unit, e.g. minutes or characters.
+    :return: Integer.  Our seconds, or None if our unit is not a time unit.
+    """
+    return SECONDS_PER_UNIT.get(unit[:-1] if unit.endswith("s") else unit)
+
+
+def get_variable_columns(rules, variable, unit_column):
+    """
+    Gets the numeric columns of one of our variables.
+
+    :param rules: RuleBuffer.  Our rules.
+    :param variable: String.  BNF var1 or BNF var2.
+    :param unit_column: String.  Its unit column.
+    :return: Dict.  Our Value, Normalized and Normalized Unit columns.
+    """
+    values, valid = rules.get_integers(variable)
+
+    units = list(rules.values[unit_column])
+    unit_codes = numpy.frombuffer(rules.codes[unit_column], dtype=numpy.int32)
+    seconds = [get_seconds_per_unit(unit) for unit in units]
+    factors = numpy.array([1 if unit_seconds is None else unit_seconds for unit_seconds in seconds],
+                          dtype=numpy.int64)[unit_codes]
+    # values too large to hold once normalized are left empty
+    normalized_valid = valid & (values <= _MAX_NUMBER // factors)
+    normalized_codes, normalized_units = pandas.factorize(pandas.Index(
+        [unit if unit_seconds is None else NORMALIZED_TIME_UNIT for unit, unit_seconds in zip(units, seconds)],
+        dtype=object), sort=True)
+
+    return {variable + " Value": pandas.arrays.IntegerArray(values, ~valid),
+            variable + " Normalized": pandas.arrays.IntegerArray(numpy.where(normalized_valid, values * factors, 0),
+                                                                 ~normalized_valid),
+            variable + " Normalized Unit": pandas.Categorical.from_codes(normalized_codes[unit_codes],
+                                                                         normalized_units)}
+
+
+def get_policy_metric_columns(rules):
+    """
+    Gets the metrics of each of our policies, see POLICY_METRICS, repeated on each of its rules.  Policies without
+    rules a metric is taken from are left empty.
+
+    :param rules: RuleBuffer.  Our rules.
+    :return: Dict.  Our metric columns.
+    """
+    # the grammar key of each distinct base, from the children of its first rule
+    base_codes = numpy.frombuffer(rules.codes["BNF Base"], dtype=numpy.int32)
+    distinct_codes, first_rows = numpy.unique(base_codes, return_index=True)
+    children = [numpy.array(list(rules.values[column]), dtype=object)[
+        numpy.frombuffer(rules.codes[column], dtype=numpy.int32)[first_rows]] for column in CHILDREN_COLUMNS]
+    keys = [_KEYS_BY_CHILDREN.get(tuple(base_children), "") for base_children in zip(*children)]
+
+    values, valid = rules.get_integers("BNF var1")
+    category_codes = numpy.frombuffer(rules.codes["verb category"], dtype=numpy.int32)
+    file_indexes = rules.get_file_indexes()
+    files = len(rules.offsets) - 1
+
+    columns = {}
+    for column, category, pattern, strictest in POLICY_METRICS:
+        is_metric_base = numpy.zeros(len(rules.values["BNF Base"]), dtype=bool)
+        is_metric_base[distinct_codes] = [pattern.match(key) is not None for key in keys]
+        is_metric_rule = (is_metric_base[base_codes] & valid
+                          & (category_codes == rules.values["verb category"].get(category, -1)))
+
+        if strictest == "max":
+            metrics = numpy.zeros(files, dtype=numpy.int64)
+            numpy.maximum.at(metrics, file_indexes[is_metric_rule], values[is_metric_rule])
+        else:
+            metrics = numpy.full(files, _MAX_NUMBER, dtype=numpy.int64)
+            numpy.minimum.at(metrics, file_indexes[is_metric_rule], values[is_metric_rule])
+        has_metric = numpy.bincount(file_indexes[is_metric_rule], minlength=files) > 0
+        columns[column] = pandas.arrays.IntegerArray(metrics[file_indexes], ~has_metric[file_indexes])
+
+    return columns
+
+
+def get_columns(rules):
+    """
+    Gets every numeric column of our rules, see COLUMNS.
+
+    :param rules: RuleBuffer.  Our rules.
+    :return: Dict.  Our columns, in the order of COLUMNS.
+    """
+    columns = {}
+    for variable, unit_column in VARIABLES:
+        columns.update(get_variable_columns(rules, variable, unit_column))
+    columns.update(get_policy_metric_columns(rules))
+
+    return columns
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Module contains a PolicyOverlap object, which compares the rules of many
+policies (or sectors, audiences, files) of a BNFdf at once: how many rules of
+each policy are also in each other policy, which rules only one policy has,
+and which rules one policy has that another does not.
+
+Rules are compared by their canonical key, their verb and children (see
+PolicySummary.get_rule_key), as the Overlap Count of our visualization tool
+does.  Every rule of our df is given the index of its key, and our policies
+become one row each of a matrix of rule counts.  Our tree has a few hundred
+rules, so this matrix is small even for thousands of policies, and every pair
+of policies is compared with one matrix product instead of comparing rules.
+"""
+
+import sys
+import argparse
+import numpy
+import pandas
+import PolicySummary
+import ColumnarExport
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+KEY_COLUMNS = ["verb", "child0", "child1", "child2", "child3", "child4", "child5"]
+# what our policies are, the first of these our df has
+DEFAULT_BY = ("PolicyId", "File Name")
+
+
+class PolicyOverlap:
+    """
+    Counts the rules of each of our policies by canonical key.  counts[i, j] is the number of rules of policy i
+    with key j.
+    """
+
+    def __init__(self, df, by=None):
+        """
+        Constructor for our overlap.
+
+        :param df: pandas.DataFrame.  A BNFdf, e.g. BNFdf.df or one read with ColumnarExport.read_BNFdf.
+        :param by: String.  Column our policies are grouped by, e.g. PolicyId, Sector or File Name.  Defaults to
+                   the first of DEFAULT_BY in our df.
+        """
+        if by is None:
+            by = next((column for column in DEFAULT_BY if column in df.columns), None)
+        if by not in df.columns:
+            raise ValueError("No " + str(by) + " column to group policies by.")
+        self.by = by
+
+        # each distinct policy and key once, our rules are only their indexes from here on
+        rule_counts = df.groupby([by] + KEY_COLUMNS, observed=True, sort=True, dropna=False).size()
+        policy_codes, self.policies = pandas.factorize(rule_counts.index.get_level_values(0), sort=True)
+        key_codes, keys = pandas.factorize(rule_counts.index.droplevel(0), sort=True)
+        self.keys = pandas.DataFrame(list(keys), columns=KEY_COLUMNS)
+        self.keys.insert(0, "Rule Key", [PolicySummary.get_rule_key(key) for key in keys])
+
+        self.counts = numpy.zeros((len(self.policies), len(self.keys)), dtype=numpy.int64)
+        self.counts[policy_codes, key_codes] = rule_counts.to_numpy()
+
+    def get_rule_counts(self):
+        """
+        Gets our number of rules in each policy.
+
+        :return: pandas.Series.  Rules of each policy.
+        """
+        return pandas.Series(self.counts.sum(axis=1), index=self.policies, name="Rules")
+
+    def _select(self, policies):
+        """
+        Gets some of our policies and their rule counts.
+
+        :param policies: List of strings.  Our policies to select, or None for every policy.
+        :return: Tupple.  pandas.Index of our policies, and numpy.ndarray of their rows of counts.
+        """
+        if policies is None:
+            return self.policies, self.counts
+
+        policies = pandas.Index(policies)
+        indexes = self.policies.get_indexer(policies)
+        if (indexes == -1).any():
+            raise KeyError("No policies " + ", ".join(str(policy) for policy in policies[indexes == -1]) + ".")
+
+        return policies, self.counts[indexes]
+
+    def get_overlap(self, policies=None):
+        """
+        Gets the Overlap Count of every pair of policies: the number of rules of policy a (row) whose key policy b
+        (column) also has.  Our diagonal is each policy's number of rules.  Our table has a cell for every pair,
+        so compare subsets of tens of thousands of policies.
+
+        :param policies: List of strings.  Our policies to compare, or None for every policy.
+        :return: pandas.DataFrame.  Our policies by our policies.
+        """
+        policies, counts = self._select(policies)
+        # rules of a times whether b has them, for every pair at once
+        overlap = counts.astype(numpy.float64) @ (counts > 0).T.astype(numpy.float64)
+
+        return pandas.DataFrame(overlap.astype(numpy.int64), index=policies, columns=policies)
+
+    def get_unique(self, policies=None):
+        """
+        Gets the Unique Count of every pair of policies: the number of rules of policy a (row) whose key policy b
+        (column) does not have.
+
+        :param policies: List of strings.  Our policies to compare, or None for every policy.
+        :return: pandas.DataFrame.  Our policies by our policies.
+        """
+        overlap = self.get_overlap(policies)
+        return overlap.rsub(self.get_rule_counts()[overlap.index], axis=0)
+
+    def get_shared_keys(self, policies=None):
+        """
+        Gets the number of distinct keys every pair of policies has in common.
+
+        :param policies: List of strings.  Our policies to compare, or None for every policy.
+        :return: pandas.DataFrame.  Our policies by our policies.
+        """
+        policies, counts = self._select(policies)
+        has_keys = (counts > 0).astype(numpy.float64)
+
+        return pandas.DataFrame((has_keys @ has_keys.T).astype(numpy.int64), index=policies, columns=policies)
+
+    def get_jaccard(self, policies=None):
+        """
+        Gets the Jaccard similarity of the keys of every pair of policies, shared keys over keys of either.
+
+        :param policies: List of strings.  Our policies to compare, or None for every policy.
+        :return: pandas.DataFrame.  Our policies by our policies, 0 to 1.
+        """
+        shared = self.get_shared_keys(policies)
+        keys = numpy.diag(shared.to_numpy())
+        union = keys[:, None] + keys[None, :] - shared.to_numpy()
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            jaccard = numpy.where(union > 0, shared.to_numpy() / union, 1.0)
+
+        return pandas.DataFrame(jaccard, index=shared.index, columns=shared.columns)
+
+    def get_policy_counts(self):
+        """
+        Gets how many of our policies have each key.
+
+        :return: pandas.DataFrame.  Our keys, with a Policies column.
+        """
+        keys = self.keys.copy()
+        keys["Policies"] = (self.counts > 0).sum(axis=0)
+        keys["Rules"] = self.counts.sum(axis=0)
+
+        return keys
+
+    def get_unique_keys(self):
+        """
+        Gets the keys only one of our policies has.
+
+        :return: pandas.DataFrame.  Our keys, with the policy that has each and its number of rules.
+        """
+        only_one = numpy.flatnonzero((self.counts > 0).sum(axis=0) == 1)
+        owners = self.counts[:, only_one].argmax(axis=0)
+
+        keys = self.keys.iloc[only_one].reset_index(drop=True)
+        keys.insert(0, self.by, self.policies[owners])
+        keys["Rules"] = self.counts[owners, only_one]
+
+        return keys
+
+    def get_diff(self, policy, other):
+        """
+        Gets the keys of a policy that another policy does not have, and the keys they share.
+
+        :param policy: String.  One of our policies.
+        :param other: String.  Policy we are compared to.
+        :return: Tupple.  pandas.DataFrame of the keys only policy has, and of the keys both have, with the
+                 number of rules of each in each policy.
+        """
+        index = self.policies.get_loc(policy)
+        other_index = self.policies.get_loc(other)
+        counts = self.counts[[index, other_index]]
+
+        keys = self.keys.copy()
+        keys[str(policy)] = counts[0]
+        keys[str(other)] = counts[1]
+        only = keys[(counts[0] > 0) & (counts[1] == 0)].reset_index(drop=True)
+        shared = keys[(counts[0] > 0) & (counts[1] > 0)].reset_index(drop=True)
+
+        return only, shared
+
+
+def get_arguments():
+    """
+    Parses our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(description="Compares the rules of every pair of policies of an exported "
+                                                 "BNFdf (csv, parquet or arrow).")
+    parser.add_argument("infile_path", help="csv, parquet or arrow file exported by PolicyToCSV.py")
+    parser.add_argument("outfile_path", help="csv our table is written to")
+    parser.add_argument("--by", default=None,
+                        help="column policies are grouped by, e.g. PolicyId, Sector or File Name "
+                             "(default: " + " or ".join(DEFAULT_BY) + ")")
+    parser.add_argument("--table", default="overlap", choices=["overlap", "unique", "shared", "jaccard", "keys",
+                                                               "unique-keys"],
+                        help="overlap: rules of each row policy also in each column policy, unique: rules of each "
+                             "row policy not in each column policy, shared: keys in common, jaccard: similarity of "
+                             "keys, keys: policies with each key, unique-keys: keys only one policy has "
+                             "(default: %(default)s)")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    df = ColumnarExport.read_BNFdf(arguments.infile_path)
+    try:
+        overlap = PolicyOverlap(df, arguments.by)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    tables = {"overlap": overlap.get_overlap, "unique": overlap.get_unique, "shared": overlap.get_shared_keys,
+              "jaccard": overlap.get_jaccard, "keys": overlap.get_policy_counts, "unique-keys": overlap.get_unique_keys}
+    table = tables[arguments.table]()
+    table.to_csv(arguments.outfile_path, index=arguments.table in ("overlap", "unique", "shared", "jaccard"))
+    print(str(len(overlap.policies)) + " policies and " + str(len(overlap.keys)) + " keys compared.")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Module reads the BNF rules of our "completed" files lazily, a line at a time,
+so a file's text is never held in memory at once and every file is closed as
+soon as its last rule has been read.
+
+Rules are exactly those of PolicyToCSV.get_completed_policies, which removes
+comments, then pairs of line breaks, from a whole file and splits it on periods
+at the end of lines.  Rules may span several lines, and can be read along
+with the number of the line each starts on.
+"""
+
+import re
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+
+def _find_comment(line):
+    """
+    Finds the start of a comment in a line, a pound sign followed by whitespace.
+
+    :param line: String.  Our line, with its line break.
+    :return: Integer.  Index of our pound sign, -1 if there is no comment.
+    """
+    start = line.find("#")
+    while start != -1:
+        if start + 1 < len(line) and line[start + 1].isspace():
+            return start
+        start = line.find("#", start + 1)
+
+    return -1
+
+
+def _remove_comments(lines):
+    """
+    Removes comments from lines.  A comment runs to the end of its line, but when only whitespace follows its
+    pound sign, it also takes the whitespace of the lines after it and the rest of the next line with any text,
+    as re.sub("#\\s+.*", "", ...) does on a whole file.
+
+    :param lines: Iterable of strings.  Our lines, with their line breaks.
+    :return: Generator of tupples.  Text of each of our lines without comments, whether it has a line break, and
+             the number of the line our text is from.
+    """
+    prefix = None   # text before a comment that has taken our line breaks
+    prefix_number = 0
+    for number, line in enumerate(lines, 1):
+        line_break = line.endswith("\n")
+        text = line[:-1] if line_break else line
+
+        if prefix is not None:
+            if text.isspace() or text == "":
+                if line_break:
+                    continue
+                yield prefix, False, prefix_number   # our comment takes the rest of our file
+            else:
+                yield prefix, line_break, prefix_number
+            prefix = None
+            continue
+
+        start = _find_comment(line)
+        if start == -1:
+            yield text, line_break, number
+        elif text[start + 1:].isspace() or text[start + 1:] == "":
+            if line_break:
+                prefix = text[:start]
+                prefix_number = number
+            else:
+                yield text[:start], False, number
+        else:
+            yield text[:start], line_break, number
+
+    if prefix is not None:
+        yield prefix, False, prefix_number
+
+
+def _remove_paired_line_breaks(lines):
+    """
+    Removes pairs of line breaks, as re.sub("\\n{2}", "", ...) does on a whole file, so a run of line breaks
+    leaves one line break if it is odd and none if it is even.
+
+    :param lines: Iterable of tupples.  Text of each of our lines, whether it has a line break, and its line number.
+    :return: Generator of tupples.  Our text, each piece either a line break or text without line breaks, and the
+             number of the line it is from.
+    """
+    line_breaks = 0
+    number = 0
+    for text, line_break, number in lines:
+        if text != "":
+            if line_breaks % 2 == 1:
+                yield "\n", number
+            line_breaks = 0
+            yield text, number
+        if line_break:
+            line_breaks += 1
+
+    if line_breaks % 2 == 1:
+        yield "\n", number
+
+
+def _split_rules(pieces):
+    """
+    Splits our text on periods at the end of lines.
+
+    :param pieces: Iterable of tupples.  Our text, each piece either a line break or text without line breaks, and
+                   the number of the line it is from.
+    :return: Generator of tupples.  Number of the first line of text of each of our BNF rules, and our rule,
+             without its period.  Text after our last period is dropped.
+    """
+    rule = []
+    start = None
+    first = True
+    for piece, number in pieces:
+        if piece == "\n" and rule and rule[-1].endswith("."):
+            policy = "".join(rule)[:-1]
+            if first:
+                policy = re.sub("\\nUsers", "Users", policy)     # need to get rid of the extra line break
+                first = False
+            yield start, policy
+            rule = []
+            start = None
+        else:
+            if start is None and piece != "\n":
+                start = number
+            rule.append(piece)
+
+
+def iter_completed_policies(lines):
+    """
+    Gets BNF rules from the lines of a "completed" file, one rule at a time.
+
+    :param lines: Iterable of strings.  Our lines, with their line breaks, e.g. an open file.
+    :return: Generator of strings.  Our BNF rules, without their periods.
+    """
+    return (policy for number, policy in iter_numbered_policies(lines))
+
+
+def iter_numbered_policies(lines):
+    """
+    Gets BNF rules from the lines of a "completed" file, with the number of the line each starts on.
+
+    :param lines: Iterable of strings.  Our lines, with their line breaks, e.g. an open file.
+    :return: Generator of tupples.  Line number, counting from 1, and BNF rule, without its period.
+    """
+    return _split_rules(_remove_paired_line_breaks(_remove_comments(lines)))
+
+
+def iter_policy_file(file_path):
+    """
+    Gets BNF rules from a "completed" file, one rule at a time.  Our file is read in buffered chunks and closed
+    once our last rule has been read, or our generator is closed.
+
+    :param file_path: String.  Path of our "completed" file.
+    :return: Generator of strings.  Our BNF rules, without their periods.
+    """
+    with open(file_path) as completed_file:
+        yield from iter_completed_policies(completed_file)
+
+
+def iter_numbered_policy_file(file_path):
+    """
+    Gets BNF rules from a "completed" file, one rule at a time, with the number of the line each starts on.
+
+    :param file_path: String.  Path of our "completed" file.
+    :return: Generator of tupples.  Line number, counting from 1, and BNF rule, without its period.
+    """
+    with open(file_path) as completed_file:
+        yield from iter_numbered_policies(completed_file)
+
+
+def read_file(file_path):
+    """
+    Reads a whole file, closing it straight away.
+
+    :param file_path: String.  Path of our file.
+    :return: String.  Our file.
+    """
+    with open(file_path) as in_file:
+        return in_file.read()
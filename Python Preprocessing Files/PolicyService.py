@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+Runs PolicyToCSV as a long-running local service, so Python, our modules,
+compiled patterns and hash table are loaded once, instead of once per
+conversion, and each submitted policy is parsed in milliseconds.
+
+Policies are the text of a policy file, translated into the formal language,
+and come back as the rows of PolicyToCSV.BNFdfWithoutMeatadata, as JSON or csv.
+Two protocols are served:
+
+HTTP (default), on localhost:
+    POST /parse?format=json|csv&name=NAME   body: our policy, at most MAX_BODY_BYTES
+    GET /health
+Each connection is served in its own thread, so a slow client never holds up
+the others, and policies are parsed one at a time.
+
+stdin (--stdin), one JSON request per line, e.g.
+    {"id": 1, "policy": "Users must create passwords ...", "format": "json"}
+and one JSON response per line on stdout, with our request's id and either
+"columns" and "rows", "csv", or "error".  A request that cannot be parsed,
+for any reason, is answered with its error, and our service goes on.
+"""
+
+import io
+import os
+import csv
+import sys
+import json
+import logging
+import argparse
+import threading
+import http.server
+import urllib.parse
+import PolicyToCSV
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+FORMATS = ("json", "csv")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# policies submitted without a name
+DEFAULT_NAME = "policy"
+# largest HTTP body we read, 16 MB
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+logger = logging.getLogger("PolicyService")
+
+
+class PolicyService:
+    """
+    Parses submitted policies with a hash table that is built once, when our service starts.
+    """
+
+    columns = PolicyToCSV.BNFdfWithoutMeatadata.columns
+
+    def __init__(self, fuzzy_distance=0):
+        """
+        Constructor for our service.  Builds our hash table straight away, so our first policy is as quick as the
+        rest.
+
+        :param fuzzy_distance: Integer.  See PolicyToCSV.BNFdfWithoutMeatadata.
+        """
+        self.fuzzy_distance = fuzzy_distance
+        self.policies = 0
+        self._lock = threading.Lock()   # our hash table's fuzzy matches are shared by every request
+        PolicyToCSV.TreeStructureHash.get_hash_table(fuzzy_distance)
+
+    def parse_policy(self, policy, name=DEFAULT_NAME):
+        """
+        Parses a policy into our rows.  Policies are parsed one at a time, whichever thread they come from.
+
+        :param policy: String.  Text of our policy file.
+        :param name: String.  Our File Name column.
+        :return: List of lists.  One row per rule, with our columns.
+        """
+        if not isinstance(policy, str):
+            raise TypeError("Policy must be a string, not " + type(policy).__name__ + ".")
+        if not policy.endswith("\n"):
+            policy += "\n"   # so our last rule's period ends a line, as in our policy files
+
+        with self._lock:
+            rows = PolicyToCSV.parse_policies(PolicyToCSV.get_completed_policies(policy), self.fuzzy_distance, name)
+            self.policies += 1
+
+        return [row[:7] + [name] + row[7:] for row in rows]
+
+    def get_csv(self, rows):
+        """
+        Writes our rows as a csv, in the same dialect as PolicyToCSV.
+
+        :param rows: List of lists.  Our rows.
+        :return: String.  Our csv, with its header.
+        """
+        out_file = io.StringIO()
+        writer = csv.writer(out_file, lineterminator=os.linesep)
+        writer.writerow(self.columns)
+        writer.writerows(rows)
+
+        return out_file.getvalue()
+
+    def handle_request(self, request):
+        """
+        Answers a request of either of our protocols.
+
+        :param request: Dict.  Our policy, as a string or UTF-8 bytes, and optionally its id, name and format.
+        :return: Dict.  Our response.
+        """
+        response = {"id": request.get("id")}
+        try:
+            file_format = request.get("format", "json")
+            if file_format not in FORMATS:
+                raise ValueError("Unknown format " + repr(file_format) + ", expected one of " + ", ".join(FORMATS))
+            if "policy" not in request:
+                raise ValueError("Request has no policy.")
+            policy = request["policy"]
+            if isinstance(policy, bytes):
+                policy = policy.decode("utf-8")
+            rows = self.parse_policy(policy, request.get("name", DEFAULT_NAME))
+        except (ValueError, TypeError) as e:   # including TreeStructureHash.UnknownRuleError and bad UTF-8
+            response["error"] = str(e)
+        except Exception as e:
+            # a rule our parser cannot handle must not stop our service from answering the next request
+            logger.exception("Request %r could not be parsed.", response["id"])
+            response["error"] = str(e) or type(e).__name__
+        else:
+            if file_format == "csv":
+                response["csv"] = self.get_csv(rows)
+            else:
+                response["columns"] = self.columns
+                response["rows"] = rows
+
+        return response
+
+    def serve_stdin(self, in_file=sys.stdin, out_file=sys.stdout):
+        """
+        Answers one JSON request per line until our input ends.  Blank lines are skipped.
+
+        :param in_file: File.  Our requests.
+        :param out_file: File.  Our responses, flushed after each one.
+        :return: VOID
+        """
+        for line in in_file:
+            if line.strip() == "":
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                response = {"id": None, "error": "Request is not JSON (" + str(e) + ")."}
+            else:
+                response = self.handle_request(request if isinstance(request, dict) else {})
+            out_file.write(json.dumps(response) + "\n")
+            out_file.flush()
+
+    def get_http_server(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Makes our HTTP server, which serves each connection in its own thread.
+
+        :param host: String.  Address we listen on.
+        :param port: Integer.  Port we listen on, or 0 for any free port.
+        :return: http.server.ThreadingHTTPServer.  Our server, bound but not yet serving.
+        """
+        server = http.server.ThreadingHTTPServer((host, port), _RequestHandler)
+        server.service = self
+
+        return server
+
+    def serve_http(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Answers HTTP requests until we are interrupted.
+
+        :param host: String.  Address we listen on.
+        :param port: Integer.  Port we listen on, or 0 for any free port.
+        :return: VOID
+        """
+        server = self.get_http_server(host, port)
+        print("Serving on http://%s:%d" % server.server_address[:2], flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    HTTP protocol of our PolicyService, see our module documentation.
+    """
+
+    def do_GET(self):
+        """
+        Answers our health checks.
+
+        :return: VOID
+        """
+        if urllib.parse.urlsplit(self.path).path != "/health":
+            self._send_json(404, {"error": "Not found."})
+        else:
+            self._send_json(200, {"status": "ok", "policies": self.server.service.policies})
+
+    def do_POST(self):
+        """
+        Parses the policy in our body.
+
+        :return: VOID
+        """
+        url = urllib.parse.urlsplit(self.path)
+        if url.path != "/parse":
+            self._send_json(404, {"error": "Not found."})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = None
+        # our body is not read, so our connection cannot be reused
+        if length is None or length < 0:
+            self.close_connection = True
+            self._send_json(400, {"error": "Content-Length is not a number of bytes."})
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": "Policy is larger than %d bytes." % MAX_BODY_BYTES})
+            return
+
+        query = urllib.parse.parse_qs(url.query)
+        # decoded by handle_request, so a body that is not UTF-8 is answered with its error
+        request = {"policy": self.rfile.read(length),
+                   "name": query.get("name", [DEFAULT_NAME])[0],
+                   "format": query.get("format", ["json"])[0]}
+        response = self.server.service.handle_request(request)
+
+        if "error" in response:
+            self._send_json(400, {"error": response["error"]})
+        elif "csv" in response:
+            self._send(200, "text/csv; charset=utf-8", response["csv"])
+        else:
+            self._send_json(200, {"columns": response["columns"], "rows": response["rows"]})
+
+    def _send_json(self, status, body):
+        """
+        Sends a JSON response.
+
+        :param status: Integer.  Our HTTP status.
+        :param body: Dict.  Our response.
+        :return: VOID
+        """
+        self._send(status, "application/json", json.dumps(body))
+
+    def _send(self, status, content_type, body):
+        """
+        Sends a response.
+
+        :param status: Integer.  Our HTTP status.
+        :param content_type: String.  Our Content-Type.
+        :param body: String.  Our response.
+        :return: VOID
+        """
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """
+        Logs each request at DEBUG, rather than always writing it to stderr.
+
+        :return: VOID
+        """
+        logger.debug("%s " + format, self.address_string(), *args)
+
+
+def get_arguments():
+    """
+    Parses our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(description="Serves PolicyToCSV conversions of single policies, with the hash "
+                                                 "table loaded once.")
+    parser.add_argument("--stdin", action="store_true",
+                        help="answer one JSON request per line of stdin instead of serving HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address HTTP is served on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port HTTP is served on (default: %(default)s)")
+    parser.add_argument("--fuzzy", type=int, default=0, metavar="N",
+                        help="map rules that are not in the hash table to the closest rule at most N words away")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="DEBUG also logs each HTTP request (default: %(default)s)")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = get_arguments()
+    PolicyToCSV.configure_logging(getattr(logging, arguments.log_level))
+
+    service = PolicyService(arguments.fuzzy)
+    if arguments.stdin:
+        service.serve_stdin()
+    else:
+        service.serve_http(arguments.host, arguments.port)
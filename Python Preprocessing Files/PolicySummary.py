@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Module contains a PolicySummary object, the statistics our visualization tool
+shows for an uploaded csv (see calculateStats in fileHandling.js), computed
+once when the csv is exported instead of every time it is uploaded.
+
+For each child1 branch, and for all rules, we count rules, required (must,
+must not) and recommended (should, should not) rules, and ambiguous rules, with
+"(unspec)" in child4 or child5.  Each distinct rule, its verb and children, is
+also kept as a short hash with its number of rules, so two summaries are
+compared with a dict lookup per rule instead of comparing every pair of rules.
+"""
+
+import json
+import hashlib
+import collections
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# branches in the order of treeCategories in tree.js, any others follow in sorted order
+BRANCHES = ("Create Passwords", "Communicate Passwords", "Change Passwords", "Store Passwords",
+            "Fail to authenticate")
+ALL_RULES = "All"
+REQUIRED_VERBS = ("must", "mustNot")
+AMBIGUOUS = "(unspec)"
+
+
+def get_rule_key(verb_and_children):
+    """
+    Gets the canonical key of a rule, a hash of its verb and children.  Rules with the same key are the same rule
+    of our tree, whatever their variables.
+
+    :param verb_and_children: Tupple of strings.  Our verb and child0-child5.
+    :return: String.  16 hex characters.
+    """
+    # a separator no child contains, so ("ab", "c") and ("a", "bc") differ
+    return hashlib.blake2b("\x1f".join(verb_and_children).encode("utf-8"), digest_size=8).hexdigest()
+
+
+class PolicySummary:
+    """
+    Counts our rules by their verb and children, from which every statistic is derived.
+    """
+
+    def __init__(self):
+        """
+        Constructor for our empty summary.
+        """
+        self.rule_counts = collections.Counter()   # (verb, child0, ..., child5): number of rules
+
+    def add_rows(self, rows):
+        """
+        Counts parsed rows, see PolicyToCSV.parse_completed_file.
+
+        :param rows: Iterable of lists.  Our rows, starting with their verb and children.
+        :return: VOID
+        """
+        self.rule_counts.update(tuple(row[:7]) for row in rows)
+
+    def add_columns(self, verbs, *children):
+        """
+        Counts the rules of our verb and children columns.
+
+        :param verbs: Iterable of strings.  Our verbs.
+        :param children: Iterables of strings.  Our child0-child5 columns.
+        :return: VOID
+        """
+        self.rule_counts.update(zip(verbs, *children))
+
+    def update(self, other):
+        """
+        Adds the rules of another summary, e.g. of another directory.
+
+        :param other: PolicySummary.  Summary to add.
+        :return: VOID
+        """
+        self.rule_counts.update(other.rule_counts)
+
+    def get_branches(self):
+        """
+        Gets the statistics of all of our rules and of each branch.
+
+        :return: Dict.  Dict of rules, require, recommend, percent_require, percent_recommend and ambiguous, for
+                 ALL_RULES and each of our child1 branches.
+        """
+        counts = collections.defaultdict(lambda: {"rules": 0, "require": 0, "recommend": 0, "ambiguous": 0})
+        for branch in BRANCHES:
+            counts[branch]   # every branch is shown, even without rules
+        for verb_and_children, rules in self.rule_counts.items():
+            verb, child4, child5 = verb_and_children[0], verb_and_children[5], verb_and_children[6]
+            for branch in (ALL_RULES, verb_and_children[2]):
+                counts[branch]["rules"] += rules
+                counts[branch]["require" if verb in REQUIRED_VERBS else "recommend"] += rules
+                if AMBIGUOUS in child4 or AMBIGUOUS in child5:
+                    counts[branch]["ambiguous"] += rules
+
+        branches = {}
+        for branch in [ALL_RULES] + list(BRANCHES) + sorted(set(counts) - set(BRANCHES) - {ALL_RULES}):
+            branch_counts = branches[branch] = dict(counts[branch])
+            rules = branch_counts["rules"]
+            branch_counts["percent_require"] = branch_counts["require"] / rules if rules > 0 else 0
+            branch_counts["percent_recommend"] = branch_counts["recommend"] / rules if rules > 0 else 0
+
+        return branches
+
+    def get_keys(self):
+        """
+        Gets the key of each of our distinct rules, see get_rule_key.
+
+        :return: Dict.  Dict of the child1 branch and number of rules of each key.
+        """
+        keys = {}
+        for verb_and_children, rules in sorted(self.rule_counts.items()):
+            key = keys.setdefault(get_rule_key(verb_and_children), {"branch": verb_and_children[2], "rules": 0})
+            key["rules"] += rules
+
+        return keys
+
+    def to_dict(self):
+        """
+        Gets our summary in the form it is exported.
+
+        :return: Dict.  Our rules, branches and keys.
+        """
+        return {"rules": sum(self.rule_counts.values()), "branches": self.get_branches(), "keys": self.get_keys()}
+
+    def export(self, file_path):
+        """
+        Exports our summary to a JSON file.
+
+        :param file_path: String.  Path of our JSON file.
+        :return: VOID
+        """
+        with open(file_path, "w") as out_file:
+            json.dump(self.to_dict(), out_file, indent=1)
+
+
+def get_overlap(summary, other):
+    """
+    Counts the rules of an exported summary that are also in another, the "Overlap Count" of our visualization
+    tool.  Each of our rules found in other counts once, however many times other has it.
+
+    :param summary: Dict.  Our exported summary, see PolicySummary.to_dict.
+    :param other: Dict.  Exported summary we are compared to.
+    :return: Dict.  Number of our rules in other, for ALL_RULES and each child1 branch.
+    """
+    overlap = collections.Counter({branch: 0 for branch in summary["branches"]})
+    for key, counts in summary["keys"].items():
+        if key in other["keys"]:
+            overlap[ALL_RULES] += counts["rules"]
+            overlap[counts["branch"]] += counts["rules"]
+
+    return dict(overlap)
@@ -1,528 +1,426 @@
 #!/usr/bin/env python3
 """
-Module contains BNFdfWithMeatadata and BNFdfWithoutMeatadata objects.
+Module contains a BNFdf object, and its BNFdfWithMeatadata and BNFdfWithoutMeatadata forms.
 These objects break apart policies into CSVs, capturing key features, important
 for further analysis, and variables neccessary for generating visualizations
 with our HTML tool.
 
 Inputs for both constructors are the location of directories that contain at
 least one policy file, translated into the formal language.
+
+pandas (and our VectorizedRuleParser) are only imported once a df is built, so
+small conversions written with csv.writer (see export_BNFdf with stream) start
+in milliseconds rather than a second.
 """
 
-import sys
-import os
+import io
 import re
-import pandas
-import numpy
+import os
+import sys
+import csv
+import time
+import logging
+import argparse
+import functools
+import contextlib
+import collections
+import multiprocessing
+import ParseCache
+import RuleBuffer
+import PolicyReader
+import PolicySummary
+import ColumnarExport
+import RuleParser
 import TreeStructureHash
 
 __author__ = "Elijah Peake"
 __email__ = "elijah.peake@gmail.com"
 
 # This may by subject to change.  Replaces variables when no input variables are present.
-USER_INPUT_WARNING = "DEPENDS ON USER INPUT"
+USER_INPUT_WARNING = RuleParser.USER_INPUT_WARNING
 
-class BNFdfWithMeatadata:
-    """
-    Converts BNF "completed" files and metadata .txt file into a df that can be exported as a csv.
+# how our rules are parsed, one rule at a time or the whole corpus at once
+ENGINES = ("python", "vectorized")
 
-    "completed" files must NOT have a .txt extension and metadata must be input for each "completed" file in
-    alphabetical order of policyID.
-    """
+# seconds between our progress lines
+PROGRESS_INTERVAL = 5
 
-    def __init__(self, files_location=""):
-        """
-        Constructor for out BNFdf.  May be empty, but directory of BNF files to be analyzed should be provided
-        :param files_location: File path of our directory.  Should be unzipped.
-        """
-        self.files_location = files_location
-        self.verb = []
-        self.child0 = []
-        self.child1 = []
-        self.child2 = []
-        self.child3 = []
-        self.child4 = []
-        self.child5 = []
-        self.PolicyId = []
-        self.Sector = []
-        self.Audience = []
-        self.BNF = []
-        self.BNF_Base = []
-        self.BNF_var1 = []
-        self.BNF_var1_units = []
-        self.BNF_var2 = []
-        self.BNF_var2_units = []
-        self.Grammar = []
-        self.VerbCategory = []
-        self.charset = []
-        self.spec_char = []
-        self._find_values_for_BNFdf()
-        self.df = self._fill_BNFdf()
+# directories of policy files up to this size are written with csv.writer, without importing pandas
+FAST_PATH_MAX_BYTES = 1024 * 1024
+# methods of RuleParser timed with --profile, each is called once per rule
+_PROFILED_EXTRACTORS = ("_get_charset", "_get_specials", "_get_verb_category", "_get_grammar", "_get_units",
+                        "_get_base")
 
-    def _files_in_directory(self, files_location):
-        """
-        File must be unzipped.  Searches files in a directory given by files_location.
+# one row of our metadata, its tags may come in any order
+_METADATA_TAG_PATTERN = re.compile("<(filename|policyId|sector|audience)>(.*?)</\\1>")
+METADATA_FIELDS = ("policyId", "sector", "audience")
 
+logger = logging.getLogger("PolicyToCSV")
+# each base before it is searched in our hash table, only shown with --trace-rule
+rule_logger = logging.getLogger("PolicyToCSV.rules")
 
-        :param files_location: String.  Directory path.
-        :return: Tupple.  Meta and completed file names.
-        """
-        file_names = os.listdir(files_location)
+# built once per process, including in each of our worker processes
+_rule_parser = RuleParser.RuleParser()
+# arguments of our last configure_logging call, so our worker processes log the same way
+_logging_arguments = None
 
-        completed_files = []
-        for name in file_names:
-            if name.endswith(".txt"):
-                metadata = name
-            else:
-                completed_files.append(name)
-        completed_files.sort()
 
-        return metadata, completed_files
-
-    def _import_completed_files(self, file_location, completed_files):
-        """
-        Imports our completed files once we know their locations.
+class MetadataError(IndexError):
+    """
+    Raised when our metadata .txt file does not describe each of our completed files exactly once.  An
+    IndexError, so our metadata-free fallback still catches it.
+    """
 
-        :param file_location:  String.  Directory path.
-        :param completed_files:  List of "completed" file names
-        :return: List of strings.  Our "completed" files.
-        """
-        completed_files_imported = []
 
-        for i in range(0, len(completed_files)):
-            completed_files_imported.append(open(file_location + "\\" + completed_files[i]).read())
+def configure_logging(level=logging.WARNING, trace_rules=False):
+    """
+    Sets up our logging.  Log lines go to stderr.  Rule traces go to stdout, as our prints used to.
 
-        return completed_files_imported
+    :param level: Integer.  Level of our log lines, e.g. logging.INFO for progress lines.
+    :param trace_rules: Boolean.  If True, each base is written out before it is searched in our hash table, so
+                        the last rule searched before an error can be seen.
+    :return: VOID
+    """
+    global _logging_arguments
+    _logging_arguments = (level, trace_rules)
 
-    def _import_metadata(self, file_location, metadata):
-        """
-        Imports our completed files once we know their locations.
+    logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s: %(message)s", force=True)
+    for trace_logger in (rule_logger, TreeStructureHash.logger):
+        trace_logger.handlers = []
+        trace_logger.propagate = not trace_rules
+        trace_logger.setLevel(logging.DEBUG if trace_rules else logging.NOTSET)
+        if trace_rules:
+            trace_logger.addHandler(logging.StreamHandler(sys.stdout))
 
-        :param file_location:  String.  Directory path.
-        :param metadata:  List of "metadata" file name
-        :return: String.  Our "metadata" file.
-        """
 
-        return (open(file_location + "\\" + metadata).read())
+class Progress:
+    """
+    Logs how many files and rules we have parsed, our files/sec and rules/sec, and our ETA, at most once every
+    PROGRESS_INTERVAL seconds.
+    """
 
-    def _get_completed_policies(self, completed_file_imported):
+    def __init__(self, total_files):
         """
-        Get BNF rules from a "completed" file.
+        Constructor for our progress.
 
-        :param completed_files_imported: List of strings.  Our "completed" files.
-        :return: List of strings.  Our BNF rules.
+        :param total_files: Integer.  Number of files we will parse.
         """
+        self.total_files = total_files
+        self.files = 0
+        self.rules = 0
+        self.start = time.monotonic()
+        self.last_line = self.start
 
-        completed_file_imported = re.sub("#\s+.*", "", completed_file_imported)   # Get rid of all the comments
-        completed_file_imported = re.sub("\\n{2}", "", completed_file_imported)     # get rid of all extra lines breaks
-        policies = completed_file_imported.split(".\n")   # because our rules all end with a period
-
-        policies[0] = re.sub("\\nUsers", "Users", policies[0])     # need to get rid of the extra line break
-        del policies[len(policies)-1]  # last element is an empty string so we remove it
-
-        return policies
-
-    def _get_metadata(self, metadata_imported):
+    def update(self, rules):
         """
-        Cleans metadata.
+        Counts a parsed file.
 
-        :param metadata_imported:  String.  Our "metadata" file.
-        :return:  List of strings.  Meatadata for each company's policies.
+        :param rules: Integer.  Number of rules in our file.
+        :return: VOID
         """
-
-        metadata_imported = re.sub("#.*", "", metadata_imported)   # Get rid of all the comments
-        metadata_imported = re.sub("\\n{2}", "", metadata_imported)     # get rid of all extra new lines breaks
-        meta_cleaned = metadata_imported.split("\n")   # split on new line
-
-        del meta_cleaned[len(meta_cleaned)-1]  # last element is an empty string so we remove it
-
-        return meta_cleaned
-
-    def _get_policyids(self, meta_cleaned):
+        self.files += 1
+        self.rules += rules
+        now = time.monotonic()
+        if now - self.last_line >= PROGRESS_INTERVAL:
+            self.last_line = now
+            self._log(now)
+
+    def finish(self):
         """
-        Get policyids from our metadata.
+        Logs our final line.
 
-        :param meata_cleaned:  List of strings.  Meatadata for each company's policies.
-        :return:  List of strings.  Our policyids.
+        :return: VOID
         """
-        policyids = []
-        for i in range(0, len(meta_cleaned)):
-            split_meta = re.split("<policyId>(.*)</policyId>", meta_cleaned[i])
-            policyids.append(split_meta[1])  # our second element is the policyID
-
-        return policyids
+        self._log(time.monotonic())
 
-    def _get_sectors(self, meta_cleaned):
+    def _log(self, now):
         """
-        Get sectors from our metadata.
+        Logs a progress line.
 
-        :param meata_cleaned:  List of strings.  Meatadata for each company's policies.
-        :return:  List of strings.  Our sectors.
+        :param now: Float.  time.monotonic() now.
+        :return: VOID
         """
-        sectors = []
-        for i in range(0, len(meta_cleaned)):
-            split_meta = re.split("<sector>(.*)</sector>", meta_cleaned[i])
-            sectors.append(split_meta[1])  # our second element is the policyID
+        elapsed = max(now - self.start, 1e-9)
+        files_per_second = self.files / elapsed
+        eta = (self.total_files - self.files) / files_per_second if self.files > 0 else float("nan")
+        logger.info("%d/%d files, %d rules, %.1f files/sec, %.1f rules/sec, ETA %.0fs",
+                    self.files, self.total_files, self.rules, files_per_second, self.rules / elapsed, eta)
 
-        return sectors
 
-    def _get_audience(self, meta_cleaned):
-        """
-        Get audiences from our metadata.
+def get_pool(workers):
+    """
+    Starts a pool of worker processes that log the same way we do.
 
-        :param meata_cleaned:  List of strings.  Meatadata for each company's policies.
-        :return:  List of strings.  Our audiences.
-        """
-        audiences = []
-        for i in range(0, len(meta_cleaned)):
-            split_meta = re.split("<audience>(.*)</audience>", meta_cleaned[i])
-            audiences.append(split_meta[1])  # our second element is the policyID
+    :param workers: Integer.  Number of worker processes.
+    :return: multiprocessing.Pool.  Our pool, terminated when used as a context manager.
+    """
+    initializer = configure_logging if _logging_arguments is not None else None
+    return multiprocessing.Pool(workers, initializer, _logging_arguments or ())
 
-        return audiences
 
-    def _get_charset(self):
-        """
-        Get our char set from our BNF rules.
+def get_completed_policies(completed_file_imported):
+    """
+    Get BNF rules from a "completed" file.
 
-        :return: VOID
-        """
-        charsets = []
-        for rule in self.BNF:
-            char_match1 = re.findall("(?<=character in the set of )(.*)", rule)
-            char_match2 = re.findall("(?<=characters in the set of )(.*)", rule)
-            char_match3 = re.findall("(?<=sets: )(.*)", rule)
+    :param completed_file_imported: String.  Our "completed" file.
+    :return: List of strings.  Our BNF rules.
+    """
+    return list(PolicyReader.iter_completed_policies(io.StringIO(completed_file_imported)))
 
-            if len(char_match1) > 0:     # in this case we have chars
-                charsets.append(char_match1[0])
 
-            elif len(char_match2) > 0:
-                charsets.append(char_match2[0])
+def parse_completed_file(file_path, cache=None, fuzzy_distance=0, profile=None):
+    """
+    Reads a "completed" file and parses each of its rules, including its hash table lookup.  Files are
+    independent of each other, so this is what our worker processes run.
+
+    :param file_path: String.  Path of our "completed" file.
+    :param cache: ParseCache.  If given, unchanged files are not parsed again.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :param profile: StageProfile.  If given, reading our file, splitting it into rules, and each extractor and
+                    hash lookup of parse_policies are timed.  Our file is then read at once, so I/O is its own
+                    stage.
+    :return: List of lists.  One row per rule: verb, child0-child5, BNF, BNF Base, BNF var1, BNF var1 Unit,
+             BNF var2, BNF var2 Unit, verb category, Grammar, charset and spec char.
+    """
+    if cache is None and profile is not None:
+        completed_file_imported = profile.timed("read", PolicyReader.read_file)(file_path)
+        policies = profile.timed("split", get_completed_policies)(completed_file_imported)
+    elif cache is None:
+        policies = PolicyReader.iter_policy_file(file_path)   # read lazily
+    else:
+        # our cache is keyed by our whole file
+        completed_file_imported = PolicyReader.read_file(file_path)
+        rows = cache.get(completed_file_imported)
+        if rows is not None:
+            return rows
+        policies = get_completed_policies(completed_file_imported)
 
-            elif len(char_match3) > 0:
-                charsets.append(char_match3[0])
+    rows = parse_policies(policies, fuzzy_distance, file_path, profile)
 
-            else:     # no chars
-                charsets.append("")
+    if cache is not None:
+        cache.put(completed_file_imported, rows)
 
-        self.charset = charsets
+    return rows
 
-    def _get_specials(self):
-        """
-        Get our special char set from our BNF rules.
 
-        :return: VOID
-        """
-        spchars = []
+def parse_policies(policies, fuzzy_distance=0, source="", profile=None):
+    """
+    Parses BNF rules, including their hash table lookups.
 
-        for rule in self.charset:
-            sp_char_match = re.findall("(?<=these special characters: )(.*)", rule)
+    :param policies: Iterable of strings.  Our BNF rules, without their periods.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :param source: String.  Where our rules are from, e.g. a file path, for our rule traces.
+    :param profile: StageProfile.  If given, each rule extractor and hash lookup is timed.
+    :return: List of lists.  One row per rule, see parse_completed_file.
+    """
+    parse_rule = _rule_parser.parse_rule
+    get_verb_and_children = TreeStructureHash.get_hash_table(fuzzy_distance).get_verb_and_children
+    if profile is not None:
+        parse_rule = profile.timed("parse_rule", _get_profiled_rule_parser(profile).parse_rule)
+        get_verb_and_children = profile.timed("hash lookup", get_verb_and_children)
+
+    rows = []
+    verbs_and_children = {}   # policies repeat bases, each is only searched for once
+    for i, rule in enumerate(policies):
+        (verb_category, grammar, charset, spec_char, base,
+         var1, var1_units, var2, var2_units) = parse_rule(rule)
+
+        # see documentation of TreeStructureHash.py to see why we trace
+        rule_logger.debug("%s %d %s", source, i, base)
+        verb_and_children = verbs_and_children.get(base)
+        if verb_and_children is None:
+            verb_and_children = verbs_and_children[base] = get_verb_and_children(base)
 
-            if len(sp_char_match) > 0:     # in this case we have special chars
-                spchars.append(sp_char_match[0])     # our special chars
+        # she wanted the periods still at the end of the BNFs
+        rows.append(verb_and_children + [rule + ".", base, var1, var1_units, var2, var2_units,
+                                         verb_category, grammar, charset, spec_char])
 
-            else:     # no chars
-                spchars.append("")
+    return rows
 
-        # not the most efficient way to do this, but put unspec for special chars in spechars list
-        for i in range(0, len(self.charset)):
-            if len(re.findall("special characters \(unspec\)", self.charset[i])) > 0:     # if we have a match
-                spchars[i] = "(unspec)"
 
-        self.spec_char = spchars
+def _get_profiled_rule_parser(profile):
+    """
+    Gets a RuleParser whose extractors are each timed as a part of parse_rule.
 
-    def _get_verbs(self):
-        """
-        Get verbs from out BNF rules.
+    :param profile: StageProfile.  Our profile.
+    :return: RuleParser.RuleParser.  Our rule parser.
+    """
+    rule_parser = RuleParser.RuleParser()
+    for name in _PROFILED_EXTRACTORS:
+        setattr(rule_parser, name, profile.timed(name, getattr(rule_parser, name), "parse_rule"))
 
-        :return: VOID
-        """
-        verbs = []
-        for rule in self.BNF:
-            if len(re.findall("must not", rule)) > 0:    # we do the "not" case first so that must is a diff mapping
-                verbs.append("prohibited")
-            elif len(re.findall("must", rule)) > 0:
-                verbs.append("required")
-            elif len(re.findall("should not", rule)) > 0:
-                verbs.append("dissuaded")
-            else:   # should
-                verbs.append("recommended")
+    return rule_parser
 
-        self.VerbCategory = verbs
 
-    def _get_grammar(self):
-        """
-        Get grammars from our BNF rules.
+@functools.lru_cache(maxsize=4096)
+def _get_base_error(base, fuzzy_distance=0):
+    """
+    Searches for a base BNF rule in our hash table.  Policies repeat the same bases, and the same few
+    mistranslations, so each is only searched for once per process.
 
-        :return: VOID
-        """
-        grammars = []
-        for rule in self.BNF:
-            if len(re.findall("create passwords", rule)) > 0:
-                grammars.append("create")
-            elif len(re.findall("change passwords", rule)) > 0:
-                grammars.append("change")
-            elif len(re.findall("communicate passwords", rule)) > 0:
-                grammars.append("communicate")
-            elif len(re.findall("store passwords", rule)) > 0:
-                grammars.append("store")
-            else:   # lockout
-                grammars.append("fail to authenticate")
-
-        self.Grammar = grammars
-
-    def _get_v1_v1unit_v2_v2unit(self):
-        """
-        Gets Variable 1, variable 1 units, variable 2, and variable 2 units from BNF questions.
-
-        :return: Tupple of all the above in that order.
-        """
-        v1s = []
-        v1_units = []
-        v2s = []
-        v2_units = []
-
-        for rule in self.BNF:
-            nums = re.findall(r"[0-9]+|" + re.escape(USER_INPUT_WARNING), rule)
-            if len(nums) == 0:    # we've got nothing
-                v1s.append("")
-                v2s.append("")
-            elif len(nums) == 1:
-                v1s.append(nums[0])
-                v2s.append("")
-            else:   # len(nums) == 2
-                v1s.append(nums[0])
-                v2s.append(nums[1])
-
-        for i in range(0, len(self.BNF)):
-            post_number = re.split(r"[0-9]+|" + re.escape(USER_INPUT_WARNING), self.BNF[i])
-
-            if len(post_number) == 1:    # we've got nothing
-                v1_units.append("")
-                v2_units.append("")
-
-            elif len(post_number) == 2:  #
-                pre_unit1 = post_number[1].split()
-                index = 0
-                while pre_unit1[index] in ["or", "more"]:   # keep moving along the sentence until not in this set
-                    index += 1
-
-                var_l = pre_unit1[index]
-                if var_l == "consecutive":
-                    v1_units.append("consecutive characters")
-                elif var_l == "unique":
-                    v1_units.append("unique characters")
-                else:
-                    v1_units.append(var_l)
-
-                v2_units.append("")   # no units exist, but need to equal length
-
-            else:    # len(post_number) == 3
-                pre_unit1 = post_number[1].split()
-                pre_unit2 = post_number[2].split()
-
-                var_l = pre_unit1[0]
-                if var_l == "of":
-                    v1_units.append("sets")
-                else:
-                    v1_units.append(var_l)
-
-                v2_units.append(re.sub(":", "", pre_unit2[0]))
-
-        return v1s, v1_units, v2s, v2_units
-
-    def _get_base(self):
-        """
-        Gets the BNF base from BNF questions.
+    :param base: String.  Our base BNF rule.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :return: String.  Why our base cannot be mapped to a key, or None if it can.
+    """
+    try:
+        TreeStructureHash.get_hash_table(fuzzy_distance).get_verb_and_children(base)
+    except TreeStructureHash.UnknownRuleError as e:
+        return str(e)
 
-        :return: VOID
-        """
-        bases = []
+    return None
 
-        splits = []
-        for rule in self.BNF:
-            splits.append(re.findall("character[s\s]+in the set of", rule))
 
-        seperated_BNFs = []
-        for rule in self.BNF:
-            seperated_BNFs.append(re.split("character[s\s]+in the set of", rule))
+@functools.lru_cache(maxsize=65536)
+def _get_rule_error(rule, fuzzy_distance=0):
+    """
+    Extracts every column of a BNF rule, as parse_policies does, and searches for its base in our hash table,
+    once per distinct rule and process.
 
-        for i in range(0, len(seperated_BNFs)):
-            if len(seperated_BNFs[i]) > 1:
-                bases.append(seperated_BNFs[i][0] + splits[i][0] + " /char set/")
-            else:
-                bases.append(seperated_BNFs[i][0])
+    :param rule: String.  Our BNF rule.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :return: String.  Why our rule cannot be converted, or None if it can.
+    """
+    try:
+        base = _rule_parser.parse_rule(rule)[4]
+    except Exception as e:   # e.g. a number that ends our rule, without its unit, see RuleParser._get_units
+        return "Columns of rule %r cannot be extracted (%s: %s)" % (rule, type(e).__name__, e)
 
-        # repeat for the "sets:" possibility
-        splits = []
-        for rule in bases:
-            splits.append(re.findall("sets: ", rule))
+    return _get_base_error(base, fuzzy_distance)
 
-        seperated_BNFs = []
-        for rule in bases:
-            seperated_BNFs.append(re.split("sets:", rule))
 
-        for i in range(0, len(seperated_BNFs)):
-            if len(seperated_BNFs[i]) > 1:
-                bases[i] = seperated_BNFs[i][0] + splits[i][0] + " /char set/"
-            else:
-                bases[i] = seperated_BNFs[i][0]
+def check_completed_file(file_path, fuzzy_distance=0):
+    """
+    Checks that every rule of a "completed" file can be converted: that each of our columns can be extracted from
+    it, and that its base can be mapped to our hash table.  No rows are kept.
 
-        # getting rid of numbers
-        for i in range(0, len(bases)):
-            rule = re.sub("[0-9]+ times in a [0-9]+ (.+) interval", "/number/ times in a /number/ /time unit/ interval", bases[i])
-            rule = re.sub("[0-9]+ times", "/number/ times", rule)
-            rule = re.sub("[0-9]+ (.+) lockout", "/number/ /time unit/ lockout", rule)
+    :param file_path: String.  Path of our "completed" file.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :return: Tupple.  Number of rules checked, and a list of the line number and error of each rule that cannot
+             be converted.
+    """
+    rules = 0
+    failures = []
+    for line_number, rule in PolicyReader.iter_numbered_policy_file(file_path):
+        rules += 1
+        error = _get_rule_error(rule, fuzzy_distance)
+        if error is not None:
+            failures.append((line_number, error))
 
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*times in a " + re.escape(USER_INPUT_WARNING) + "(\s)*(.+) interval", "/number/ times in a /number/ /time unit/ interval", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*times", "/number/ times", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*lockout", "/number/ /time unit/ lockout", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING), "/number/", rule)
+    return rules, failures
 
-            rule = re.sub("[0-9]+", "/number/", rule)
-            bases[i] = rule
 
-        self.BNF_Base = bases
+def parse_completed_files(files_location, completed_files, workers=1, cache=None, fuzzy_distance=0, pool=None,
+                          profile=None):
+    """
+    Parses our "completed" files, fanning them out to a pool of worker processes when workers > 1.
+    Results always come back in the order of completed_files, so our output does not depend on workers.
+
+    :param files_location: String.  Directory path.
+    :param completed_files: List of "completed" file names.
+    :param workers: Integer.  Number of worker processes.
+    :param cache: ParseCache.  If given, unchanged files are not parsed again.  Evicted once we finish, unless
+                  our pool is shared.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :param pool: multiprocessing.Pool.  If given, our files are parsed in this pool of workers processes, which is
+                 left running, instead of a pool of our own.  See export_directories.
+    :param profile: StageProfile.  If given, and our files are parsed in our own process, the stages of
+                    parse_completed_file are timed.  Worker processes are not profiled.
+    :return: Generator of lists.  The parse_completed_file rows of each of our "completed" files.
+    """
+    file_paths = [os.path.join(files_location, name) for name in completed_files]
+    if workers > 1 and len(file_paths) > 1:
+        profile = None
+    parse = functools.partial(parse_completed_file, cache=cache, fuzzy_distance=fuzzy_distance, profile=profile)
+    progress = Progress(len(file_paths))
+    for rows in _map_files(parse, file_paths, workers, pool):
+        progress.update(len(rows))
+        yield rows
 
-    def _find_values_for_BNFdf(self):
-        """
-        Updates all the data fields using the above functions.
+    progress.finish()
+    if cache is not None and pool is None:
+        cache.evict()
 
-        :return: VOID
-        """
 
-        _files_in_directory = self._files_in_directory(self.files_location)
-        completed_files = self._import_completed_files(self.files_location, _files_in_directory[1])
-        imported_metadata = self._import_metadata(self.files_location, _files_in_directory[0])
-        clean_metadata = self._get_metadata(imported_metadata)
-
-        # Taking care of our BNFs and metadata first
-        listed_BNFs = []
-        for file in completed_files:
-            listed_BNFs.append(self._get_completed_policies(file))
-
-        # number of times we need to rep metadata
-        reps = []
-        for element in listed_BNFs:
-            reps.append(len(element))
-        self.BNF = sum(listed_BNFs, [])
-
-        policyids = self._get_policyids(clean_metadata)
-        for i in range(0, len(reps)):
-            self.PolicyId.extend(numpy.repeat(policyids[i], reps[i]))
-
-        sectors = self._get_sectors(clean_metadata)
-        for i in range(0, len(reps)):
-            self.Sector.extend(numpy.repeat(sectors[i], reps[i]))
-
-        audiences = self._get_audience(clean_metadata)
-        for i in range(0, len(reps)):
-            self.Audience.extend(numpy.repeat(audiences[i], reps[i]))
-
-        self._get_charset()
-        self._get_specials()
-        self._get_verbs()
-        self._get_grammar()
-        self._get_base()
-
-        lots_o_stuff = self._get_v1_v1unit_v2_v2unit()
-        self.BNF_var1 = lots_o_stuff[0]
-        self.BNF_var1_units = lots_o_stuff[1]
-        self.BNF_var2 = lots_o_stuff[2]
-        self.BNF_var2_units = lots_o_stuff[3]
-
-        # see documentation of TreeStructureHash.py to see why we print
-        hash_table = TreeStructureHash.HashTable()
-        for i, rule in enumerate(self.BNF_Base):
-            print(i, rule)
-            verb_and_children = hash_table.get_verb_and_children(rule)
-
-            self.verb.append(verb_and_children[0])
-            self.child0.append(verb_and_children[1])
-            self.child1.append(verb_and_children[2])
-            self.child2.append(verb_and_children[3])
-            self.child3.append(verb_and_children[4])
-            self.child4.append(verb_and_children[5])
-            self.child5.append(verb_and_children[6])
+def _map_files(function, file_paths, workers=1, pool=None):
+    """
+    Calls a function on each of our files, in a pool of worker processes when workers > 1.  Results always come
+    back in the order of file_paths.
+
+    :param function: Function.  Called with each of our file paths, must be picklable.
+    :param file_paths: List of strings.  Our file paths.
+    :param workers: Integer.  Number of worker processes.
+    :param pool: multiprocessing.Pool.  If given, used instead of a pool of our own, and left running.
+    :return: Generator.  The result of each of our files.
+    """
+    if workers <= 1 or len(file_paths) <= 1:
+        yield from map(function, file_paths)
+    else:
+        workers = min(workers, len(file_paths))
+        with contextlib.nullcontext(pool) if pool is not None else get_pool(workers) as pool:
+            yield from pool.imap(function, file_paths, chunksize=max(1, len(file_paths) // (workers * 4)))
 
 
-        # she wanted the periods still at the end of the BNFs
-        for i in range(0, len(self.BNF)):
-            self.BNF[i] = self.BNF[i] + "."
+def parse_completed_files_vectorized(files_location, completed_files, fuzzy_distance=0):
+    """
+    Parses all of our "completed" files at once with a VectorizedRuleParser.  Every rule is held in memory, and
+    our files are read in a single process without a cache.
+
+    :param files_location: String.  Directory path.
+    :param completed_files: List of "completed" file names.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :return: Tupple.  pandas.DataFrame of our rows (see parse_completed_file), and a list of the number of rules
+             in each of our files.
+    """
+    rules = []
+    rules_per_file = []
+    progress = Progress(len(completed_files))
+    for name in completed_files:
+        policies = list(PolicyReader.iter_policy_file(os.path.join(files_location, name)))
+        rules.extend(policies)
+        rules_per_file.append(len(policies))
+        progress.update(len(policies))
+    progress.finish()
 
-    def _fill_BNFdf(self):
-        """
-        Creates a df and fills it with our data fields.
+    import VectorizedRuleParser
 
-        :return: Our filled df
-        """
-        df = pandas.DataFrame()
-
-        df["verb"] = self.verb
-        df["child0"] = self.child0
-        df["child1"] = self.child1
-        df["child2"] = self.child2
-        df["child3"] = self.child3
-        df["child4"] = self.child4
-        df["child5"] = self.child5
-        df["PolicyId"] = self.PolicyId
-        df["Sector"] = self.Sector
-        df["Audience"] = self.Audience
-        df["BNF"] = self.BNF
-        df["BNF Base"] = self.BNF_Base
-        df["BNF var1"] = self.BNF_var1
-        df["BNF var1 Unit"] = self.BNF_var1_units
-        df["BNF var2"] = self.BNF_var2
-        df["BNF var2 Unit"] = self.BNF_var2_units
-        df["verb category"] = self.VerbCategory
-        df["Grammar"] = self.Grammar
-        df["charset"] = self.charset
-        df["spec char"] = self.spec_char
-
-        return df
-
-    def export_BNFdf(self, directory, name):
-        """
-        Exports our df to a csv at a desired location with a desired name.
+    parser = VectorizedRuleParser.VectorizedRuleParser(TreeStructureHash.get_hash_table(fuzzy_distance))
+    return parser.parse_rules(rules), rules_per_file
 
-        :param directory:  File path of our desired file output location
-        :param name:  Desired name of our file
-        :return: VOID
-        """
-        self.df.to_csv(directory + "\\" + name + ".csv", sep=",", index=False)
 
+def export_remapped_rules(base_counts, fuzzy_distance, file_path):
+    """
+    Exports a csv of the bases that were not hash table keys, and the keys they were fuzzy matched to.
 
-class BNFdfWithoutMeatadata:
+    :param base_counts: Counter.  Number of rules with each of our bases.
+    :param fuzzy_distance: Integer.  Fuzzy distance our bases were matched with.
+    :param file_path: String.  Path of our csv.
+    :return: VOID
     """
-    Converts BNF "completed" files into a df that can be exported as a csv.
+    hash_table = TreeStructureHash.get_hash_table(fuzzy_distance)
+    with open(file_path, "w", newline="") as out_file:
+        writer = csv.writer(out_file, lineterminator=os.linesep)
+        writer.writerow(["BNF Base", "Hash Table Key", "Words Changed", "Rules"])
+        for base, count in sorted(base_counts.items()):
+            key, distance = hash_table.get_remapping(base)
+            if distance > 0:
+                writer.writerow([base, key, distance, count])
 
+
+class FileNameEnricher:
+    """
+    Adds the name of each rule's "completed" file to its row.  Every file in our directory is a "completed" file.
     """
 
-    def __init__(self, files_location=""):
+    columns = ["File Name"]
+
+    def __init__(self, files_location):
         """
-        Constructor for our BNFdf.  May be empty, but directory of BNF files to be analyzed should be provided
-        :param files_location: File path of our directory.  Should be unzipped.
+        Constructor for our enricher.  Lists our completed files, without reading any of them.
+
+        :param files_location: String.  Directory path.
         """
-        self.files_location = files_location
-        self.verb = []
-        self.child0 = []
-        self.child1 = []
-        self.child2 = []
-        self.child3 = []
-        self.child4 = []
-        self.child5 = []
-        self.file_names = []
-        self.BNF = []
-        self.BNF_Base = []
-        self.BNF_var1 = []
-        self.BNF_var1_units = []
-        self.BNF_var2 = []
-        self.BNF_var2_units = []
-        self.Grammar = []
-        self.VerbCategory = []
-        self.charset = []
-        self.spec_char = []
-        self._find_values_for_BNFdf()
-        self.df = self._fill_BNFdf()
+        self.completed_file_names = self._files_in_directory(files_location)
+        self.file_values = [(name,) for name in self.completed_file_names]
 
     def _files_in_directory(self, files_location):
         """
@@ -532,7 +430,7 @@ class BNFdfWithoutMeatadata:
         :param files_location: String.  Directory path.
         :return: List. Completed file names.
         """
-        file_names = os.listdir(files_location)
+        file_names = [entry.name for entry in os.scandir(files_location) if entry.is_file()]   # not subdirectories
 
         completed_files = []
         for name in file_names:
@@ -541,366 +439,709 @@ class BNFdfWithoutMeatadata:
 
         return completed_files
 
-    def _import_completed_files(self, file_location, completed_files):
-        """
-        Imports our completed files once we know their locations.
 
-        :param file_location:  String.  Directory path.
-        :param completed_files:  List of "completed" file names
-        :return: List of strings.  Our "completed" files.
-        """
-        completed_files_imported = []
+class MetadataEnricher:
+    """
+    Joins the policyId, sector and audience of each rule's "completed" file to its row, from our metadata .txt
+    file.  "completed" files must NOT have a .txt extension and metadata must be input for each "completed" file,
+    in any order.  Rows are joined to our files by their <filename> tag.
+    """
 
-        for i in range(0, len(completed_files)):
-            completed_files_imported.append(open(file_location + "\\" + completed_files[i]).read())
+    columns = ["PolicyId", "Sector", "Audience"]
 
-        return completed_files_imported
+    def __init__(self, files_location):
+        """
+        Constructor for our enricher.  Reads our metadata, without reading any of our completed files.  Metadata
+        is small, so it is checked here rather than part way through our parsing.
 
-    def _get_completed_policies(self, completed_file_imported):
+        :param files_location: String.  Directory path.
         """
-        Get BNF rules from a "completed" file.
+        metadata_name, self.completed_file_names = self._files_in_directory(files_location)
+        metadata = self._get_metadata(PolicyReader.read_file(os.path.join(files_location, metadata_name)))
 
-        :param completed_files_imported: List of strings.  Our "completed" files.
-        :return: List of strings.  Our BNF rules.
+        missing = [name for name in self.completed_file_names if name not in metadata]
+        if missing:
+            raise MetadataError("Metadata has no row for " + ", ".join(missing) + ".")
+        self.file_values = [metadata[name] for name in self.completed_file_names]
+
+    def _files_in_directory(self, files_location):
         """
+        File must be unzipped.  Searches files in a directory given by files_location.
 
-        completed_file_imported = re.sub("#\s+.*", "", completed_file_imported)   # Get rid of all the comments
-        completed_file_imported = re.sub("\\n{2}", "", completed_file_imported)     # get rid of all extra lines breaks
-        policies = completed_file_imported.split(".\n")   # because our rules all end with a period
 
-        policies[0] = re.sub("\\nUsers", "Users", policies[0])     # need to get rid of the extra line break
-        del policies[len(policies)-1]  # last element is an empty string so we remove it
+        :param files_location: String.  Directory path.
+        :return: Tupple.  Meta and completed file names.
+        """
+        file_names = [entry.name for entry in os.scandir(files_location) if entry.is_file()]   # not subdirectories
 
-        return policies
+        metadata = None
+        completed_files = []
+        for name in file_names:
+            if name.endswith(".txt"):
+                metadata = name
+            else:
+                completed_files.append(name)
+        completed_files.sort()
+        if metadata is None:
+            raise MetadataError("No metadata .txt file in " + files_location + ".")
+
+        return metadata, completed_files
 
-    def _get_charset(self):
+    def _get_metadata(self, metadata_imported):
         """
-        Get our char set from our BNF rules.
+        Indexes our metadata by file name, reading each row once.  Comments and rows without a <filename> tag are
+        skipped.
 
-        :return: VOID
+        :param metadata_imported:  String.  Our "metadata" file.
+        :return:  Dict.  Tupple of the policyId, sector and audience of each of our file names.
         """
-        charsets = []
-        for rule in self.BNF:
-            char_match1 = re.findall("(?<=character in the set of )(.*)", rule)
-            char_match2 = re.findall("(?<=characters in the set of )(.*)", rule)
-            char_match3 = re.findall("(?<=sets: )(.*)", rule)
+        metadata = {}
+        for row in metadata_imported.split("\n"):
+            tags = dict(_METADATA_TAG_PATTERN.findall(re.sub("#.*", "", row)))   # Get rid of all the comments
+            if "filename" not in tags:
+                continue
 
-            if len(char_match1) > 0:     # in this case we have chars
-                charsets.append(char_match1[0])
+            file_name = tags["filename"]
+            if file_name in metadata:
+                raise MetadataError("Metadata has more than one row for " + file_name + ".")
+            missing = [field for field in METADATA_FIELDS if field not in tags]
+            if missing:
+                raise MetadataError("Metadata row for " + file_name + " has no " + ", ".join(missing) + ".")
+            metadata[file_name] = tuple(tags[field] for field in METADATA_FIELDS)
 
-            elif len(char_match2) > 0:
-                charsets.append(char_match2[0])
+        return metadata
 
-            elif len(char_match3) > 0:
-                charsets.append(char_match3[0])
 
-            else:     # no chars
-                charsets.append("")
+def get_enricher(files_location):
+    """
+    Detects how the rows of a directory are enriched, before any of its completed files are read: joined to its
+    metadata if its metadata .txt file describes each of its files, with their file names otherwise.
 
-        self.charset = charsets
+    :param files_location: String.  Directory path.
+    :return: MetadataEnricher or FileNameEnricher.  Our enricher.
+    """
+    try:
+        return MetadataEnricher(files_location)
+    except MetadataError as e:
+        logger.warning("Metadata of %s incorrectly formatted (%s).  A data frame without metadata will be generated.",
+                       files_location, e)
 
-    def _get_specials(self):
-        """
-        Get our special char set from our BNF rules.
+    return FileNameEnricher(files_location)
 
-        :return: VOID
-        """
-        spchars = []
 
-        for rule in self.charset:
-            sp_char_match = re.findall("(?<=these special characters: )(.*)", rule)
+class BNFdf:
+    """
+    Converts BNF "completed" files into a df that can be exported as a csv.  Each rule's row is its parsed columns
+    (see parse_completed_file) with the columns of our enricher, the same for every rule of a file, after its verb
+    and children.
+    """
 
-            if len(sp_char_match) > 0:     # in this case we have special chars
-                spchars.append(sp_char_match[0])     # our special chars
+    def __init__(self, files_location="", stream=False, workers=1, cache=None, fuzzy_distance=0, engine="python",
+                 pool=None, enricher=None, profile=None, metrics=False):
+        """
+        Constructor for our BNFdf.  May be empty, but directory of BNF files to be analyzed should be provided
+        :param files_location: File path of our directory.  Should be unzipped.
+        :param stream: Boolean.  If True, no df is built.  Rules are instead parsed and written one policy file
+                       at a time by export_BNFdf, so memory depends on our largest file rather than our directory.
+        :param workers: Integer.  Number of processes our completed files are parsed in.  Output does not change.
+        :param cache: ParseCache.  If given, completed files that have not changed since they were cached are
+                      not parsed again.
+        :param fuzzy_distance: Integer.  If above 0, bases that are not hash table keys are mapped to the closest
+                               key at most this many words away, and export_BNFdf also exports a csv of them.
+        :param engine: String.  One of ENGINES.  "vectorized" parses our whole directory at once with pandas
+                       string operations, which is faster on large directories, but cannot stream, and ignores
+                       workers and cache.  Our df is identical.
+        :param pool: multiprocessing.Pool.  If given with workers > 1, our completed files are parsed in this pool
+                     instead of a pool of our own, so several directories can share one.
+        :param enricher: Class.  MetadataEnricher or FileNameEnricher, or None to detect it with get_enricher.
+        :param profile: StageProfile.  If given, the wall time, rules and peak memory of each of our stages are
+                        recorded in it, see get_profile.
+        :param metrics: Boolean.  If True, our df also has the numeric columns of PolicyMetrics: the integer and
+                        normalized values of our variables, and the metrics of each policy.  Cannot stream.
+        """
+        self.files_location = files_location
+        self.workers = workers
+        self.cache = cache
+        self.fuzzy_distance = fuzzy_distance
+        self.engine = engine
+        self.pool = pool
+        self.base_counts = collections.Counter()
+        self.rules = RuleBuffer.RuleBuffer()
+        self.stream = stream
+        self.df = None
+        self.summary = None
+        self.profile = profile
+        if engine not in ENGINES:
+            raise ValueError("Unknown engine " + repr(engine) + ", expected one of " + ", ".join(ENGINES))
+        if stream and engine == "vectorized":
+            raise ValueError("The vectorized engine parses our whole directory at once, so it cannot stream.")
+        if stream and metrics:
+            raise ValueError("Policy metrics are computed over every rule of a df, so they cannot be streamed.")
+        self.metrics = metrics
+        with self._stage("files") as stage:
+            self.enricher = get_enricher(files_location) if enricher is None else enricher(files_location)
+            self.completed_file_names = self.enricher.completed_file_names
+            stage["files"] = stage.get("files", 0) + len(self.completed_file_names)
+        self.columns = RuleParser.ROW_COLUMNS[:7] + self.enricher.columns + RuleParser.ROW_COLUMNS[7:]
+        if metrics:
+            import PolicyMetrics
+
+            self.columns += PolicyMetrics.COLUMNS
+        if not stream:
+            with self._stage("parse") as stage:
+                self._find_values_for_BNFdf()
+                stage["rules"] += len(self.rules)
+            with self._stage("_fill_BNFdf") as stage:
+                self.df = self._fill_BNFdf()
+                stage["rules"] += len(self.rules)
+
+    def _stage(self, name):
+        """
+        Times a block as one of the stages of our profile, if we have one.
 
-            else:     # no chars
-                spchars.append("")
+        :param name: String.  Name of our stage.
+        :return: Context manager of a dict.  Our stage.
+        """
+        return self.profile.stage(name) if self.profile is not None else contextlib.nullcontext({"rules": 0})
 
-        # not the most efficient way to do this, but put unspec for special chars in spechars list
-        for i in range(0, len(self.charset)):
-            if len(re.findall("special characters \(unspec\)", self.charset[i])) > 0:     # if we have a match
-                spchars[i] = "(unspec)"
+    def get_profile(self):
+        """
+        Gets the stages recorded by our profile, see StageProfile.
 
-        self.spec_char = spchars
+        :return: Dict.  Our wall time and our stages, or None without a profile.
+        """
+        return self.profile.to_dict() if self.profile is not None else None
 
-    def _get_verbs(self):
+    def _find_values_for_BNFdf(self):
         """
-        Get verbs from out BNF rules.
+        Updates all the data fields using the above functions.  Each completed file's rows are appended to our
+        RuleBuffer, which holds our data fields as compact columns.
 
         :return: VOID
         """
-        verbs = []
-        for rule in self.BNF:
-            if len(re.findall("must not", rule)) > 0:    # we do the "not" case first so that must is a diff mapping
-                verbs.append("prohibited")
-            elif len(re.findall("must", rule)) > 0:
-                verbs.append("required")
-            elif len(re.findall("should not", rule)) > 0:
-                verbs.append("dissuaded")
-            else:   # should
-                verbs.append("recommended")
+        if self.engine == "vectorized":
+            rows, rules_per_file = parse_completed_files_vectorized(self.files_location, self.completed_file_names,
+                                                                    self.fuzzy_distance)
+            self.rules.add_files(rows, rules_per_file)
+        else:
+            add_file = self.rules.add_file if self.profile is None else self.profile.timed("collect",
+                                                                                          self.rules.add_file)
+            for parsed_rows in parse_completed_files(self.files_location, self.completed_file_names, self.workers,
+                                                     self.cache, self.fuzzy_distance, self.pool, self.profile):
+                add_file(parsed_rows)
+
+        self.base_counts.update(self.rules.get_counts("BNF Base"))
+
+    def _stream_rows(self):
+        """
+        Generates our csv rows one completed file at a time, in the same order as our df.
 
-        self.VerbCategory = verbs
+        :return: Generator of lists.  Our csv rows.
+        """
+        parsed_files = parse_completed_files(self.files_location, self.completed_file_names, self.workers, self.cache,
+                                             self.fuzzy_distance, self.pool, self.profile)
+        for parsed_rows, values in zip(parsed_files, self.enricher.file_values):
+            self.base_counts.update(row[8] for row in parsed_rows)
+            if self.summary is not None:
+                self.summary.add_rows(parsed_rows)
+            for row in parsed_rows:
+                yield row[:7] + list(values) + row[7:]
 
-    def _get_grammar(self):
+    def _fill_BNFdf(self):
         """
-        Get grammars from our BNF rules.
+        Creates a df and fills it with our data fields.  Every column but BNF is categorical, made from the codes
+        of our RuleBuffer, as are our enricher's columns.  With metrics, our numeric columns are computed from
+        them too.
 
-        :return: VOID
+        :return: Our filled df
         """
-        grammars = []
-        for rule in self.BNF:
-            if len(re.findall("create passwords", rule)) > 0:
-                grammars.append("create")
-            elif len(re.findall("change passwords", rule)) > 0:
-                grammars.append("change")
-            elif len(re.findall("communicate passwords", rule)) > 0:
-                grammars.append("communicate")
-            elif len(re.findall("store passwords", rule)) > 0:
-                grammars.append("store")
-            else:   # lockout
-                grammars.append("fail to authenticate")
-
-        self.Grammar = grammars
-
-    def _get_v1_v1unit_v2_v2unit(self):
-        """
-        Gets Variable 1, variable 1 units, variable 2, and variable 2 units from BNF questions.
-
-        :return: Tupple of all the above in that order.
-        """
-        v1s = []
-        v1_units = []
-        v2s = []
-        v2_units = []
-
-        for rule in self.BNF:
-            nums = re.findall(r"[0-9]+|" + re.escape(USER_INPUT_WARNING), rule)
-            if len(nums) == 0:    # we've got nothing
-                v1s.append("")
-                v2s.append("")
-            elif len(nums) == 1:
-                v1s.append(nums[0])
-                v2s.append("")
-            else:   # len(nums) == 2
-                v1s.append(nums[0])
-                v2s.append(nums[1])
-
-        for i in range(0, len(self.BNF)):
-            post_number = re.split(r"[0-9]+|" + re.escape(USER_INPUT_WARNING), self.BNF[i])
-
-            if len(post_number) == 1:    # we've got nothing
-                v1_units.append("")
-                v2_units.append("")
-
-            elif len(post_number) == 2:  #
-                pre_unit1 = post_number[1].split()
-                index = 0
-                while pre_unit1[index] in ["or", "more"]:   # keep moving along the sentence until not in this set
-                    index += 1
-
-                var_l = pre_unit1[index]
-                if var_l == "consecutive":
-                    v1_units.append("consecutive characters")
-                elif var_l == "unique":
-                    v1_units.append("unique characters")
-                else:
-                    v1_units.append(var_l)
-
-                v2_units.append("")   # no units exist, but need to equal length
-
-            else:    # len(post_number) == 3
-                pre_unit1 = post_number[1].split()
-                pre_unit2 = post_number[2].split()
-
-                var_l = pre_unit1[0]
-                if var_l == "of":
-                    v1_units.append("sets")
-                else:
-                    v1_units.append(var_l)
-
-                v2_units.append(re.sub(":", "", pre_unit2[0]))
-
-        return v1s, v1_units, v2s, v2_units
-
-    def _get_base(self):
-        """
-        Gets the BNF base from BNF questions.
+        import pandas
 
-        :return: VOID
+        columns = {}
+        if self.metrics:
+            import PolicyMetrics
+
+            with self._stage("metrics"):
+                columns.update(PolicyMetrics.get_columns(self.rules))
+        for column in self.columns:
+            if column in self.enricher.columns:
+                i = self.enricher.columns.index(column)
+                columns[column] = self.rules.get_file_column([values[i] for values in self.enricher.file_values])
+            elif column not in columns:
+                columns[column] = self.rules.get_df_column(column)
+
+        return pandas.DataFrame(columns, columns=self.columns)
+
+    def get_summary(self):
         """
-        bases = []
+        Summarises our rules, see PolicySummary.  Needs our df, streamed summaries are made by export_BNFdf.
 
-        splits = []
-        for rule in self.BNF:
-            splits.append(re.findall("character[s\s]+in the set of", rule))
+        :return: PolicySummary.PolicySummary.  Our summary.
+        """
+        summary = PolicySummary.PolicySummary()
+        summary.add_columns(*(self.rules.get_column(column) for column in RuleParser.ROW_COLUMNS[:7]))
 
-        seperated_BNFs = []
-        for rule in self.BNF:
-            seperated_BNFs.append(re.split("character[s\s]+in the set of", rule))
+        return summary
 
-        for i in range(0, len(seperated_BNFs)):
-            if len(seperated_BNFs[i]) > 1:
-                bases.append(seperated_BNFs[i][0] + splits[i][0] + " /char set/")
-            else:
-                bases.append(seperated_BNFs[i][0])
+    def export_BNFdf(self, directory, name, formats=("csv",), partition_by=ColumnarExport.DEFAULT_PARTITION_BY,
+                     summary=False):
+        """
+        Exports our df to a csv at a desired location with a desired name, and/or to Parquet and Arrow files.
 
-        # repeat for the "sets:" possibility
-        splits = []
-        for rule in bases:
-            splits.append(re.findall("sets: ", rule))
+        :param directory:  File path of our desired file output location
+        :param name:  Desired name of our file
+        :param formats: List of strings.  Any of ColumnarExport.FORMATS.  Parquet and Arrow need pyarrow, and a df,
+                        so they cannot be streamed.
+        :param partition_by: String.  Column the rows of our Parquet and Arrow files are grouped by, or None.
+        :param summary: Boolean.  If True, also exports <name>_summary.json, the statistics of our visualization
+                        tool, see PolicySummary.
+        :return: VOID
+        """
+        if self.stream and any(file_format != "csv" for file_format in formats):
+            raise ValueError("Only csv files can be streamed.")
+
+        with self._stage("export_BNFdf") as stage:
+            if self.stream:
+                # streamed rules are counted as they are written, again on each export
+                self.base_counts = collections.Counter()
+            self.summary = None
+            if summary:
+                self.summary = PolicySummary.PolicySummary() if self.stream else self.get_summary()
+
+            if not self.stream:
+                export_df(self.df, directory, name, formats, partition_by)
+                stage["rules"] += len(self.rules)
+            elif "csv" in formats:
+                # same dialect as df.to_csv, written a row at a time
+                with open(os.path.join(directory, name + ColumnarExport.FILE_EXTENSIONS["csv"]), "w",
+                          newline="") as out_file:
+                    writer = csv.writer(out_file, lineterminator=os.linesep)
+                    writer.writerow(self.columns)
+                    writer.writerows(self._stream_rows())
+                stage["rules"] += sum(self.base_counts.values())
+
+            if summary:
+                self.summary.export(os.path.join(directory, name + "_summary.json"))
+            if self.fuzzy_distance > 0:
+                export_remapped_rules(self.base_counts, self.fuzzy_distance,
+                                      os.path.join(directory, name + "_remapped.csv"))
+
+
+class BNFdfWithMeatadata(BNFdf):
+    """
+    Converts BNF "completed" files and metadata .txt file into a df that can be exported as a csv, see
+    MetadataEnricher.  Raises MetadataError if our metadata does not describe each of our files.
+    """
 
-        seperated_BNFs = []
-        for rule in bases:
-            seperated_BNFs.append(re.split("sets:", rule))
+    columns = RuleParser.ROW_COLUMNS[:7] + MetadataEnricher.columns + RuleParser.ROW_COLUMNS[7:]
 
-        for i in range(0, len(seperated_BNFs)):
-            if len(seperated_BNFs[i]) > 1:
-                bases[i] = seperated_BNFs[i][0] + splits[i][0] + " /char set/"
-            else:
-                bases[i] = seperated_BNFs[i][0]
+    def __init__(self, files_location="", stream=False, workers=1, cache=None, fuzzy_distance=0, engine="python",
+                 pool=None, profile=None, metrics=False):
+        """
+        Constructor for our BNFdf, see BNFdf.
+        """
+        super().__init__(files_location, stream, workers, cache, fuzzy_distance, engine, pool, MetadataEnricher,
+                         profile, metrics)
 
-        # getting rid of numbers
-        for i in range(0, len(bases)):
-            rule = re.sub("[0-9]+ times in a [0-9]+ (.+) interval", "/number/ times in a /number/ /time unit/ interval", bases[i])
-            rule = re.sub("[0-9]+ times", "/number/ times", rule)
-            rule = re.sub("[0-9]+ (.+) lockout", "/number/ /time unit/ lockout", rule)
 
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*times in a " + re.escape(USER_INPUT_WARNING) + "(\s)*(.+) interval", "/number/ times in a /number/ /time unit/ interval", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*times", "/number/ times", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING) + "(\s)*lockout", "/number/ /time unit/ lockout", rule)
-            rule = re.sub(re.escape(USER_INPUT_WARNING), "/number/", rule)
+class BNFdfWithoutMeatadata(BNFdf):
+    """
+    Converts BNF "completed" files into a df that can be exported as a csv, see FileNameEnricher.
 
-            rule = re.sub("[0-9]+", "/number/", rule)
-            bases[i] = rule
+    """
 
-        self.BNF_Base = bases
+    columns = RuleParser.ROW_COLUMNS[:7] + FileNameEnricher.columns + RuleParser.ROW_COLUMNS[7:]
 
-    def _find_values_for_BNFdf(self):
+    def __init__(self, files_location="", stream=False, workers=1, cache=None, fuzzy_distance=0, engine="python",
+                 pool=None, profile=None, metrics=False):
         """
-        Updates all the data fields using the above functions.
-
-        :return: VOID
+        Constructor for our BNFdf, see BNFdf.
         """
+        super().__init__(files_location, stream, workers, cache, fuzzy_distance, engine, pool, FileNameEnricher,
+                         profile, metrics)
 
-        _files_in_directory = self._files_in_directory(self.files_location)
-        completed_files = self._import_completed_files(self.files_location, _files_in_directory)
 
-        # Taking care of our BNFs and metadata first
-        listed_BNFs = []
-        for file in completed_files:
-            listed_BNFs.append(self._get_completed_policies(file))
+def is_small_directory(files_location, max_bytes=FAST_PATH_MAX_BYTES):
+    """
+    Checks whether the files of a directory are small enough that importing pandas would take longer than
+    parsing them.
 
-        # number of times we need to rep metadata
-        reps = []
-        for element in listed_BNFs:
-            reps.append(len(element))
+    :param files_location: String.  Directory path.
+    :param max_bytes: Integer.  Largest total size of a small directory's files.
+    :return: Boolean.  True if our files are no larger than max_bytes altogether.
+    """
+    total_bytes = 0
+    with os.scandir(files_location) as entries:
+        for entry in entries:
+            if entry.is_file():
+                total_bytes += entry.stat().st_size
+                if total_bytes > max_bytes:
+                    return False
 
-        self.BNF = sum(listed_BNFs, [])
+    return True
 
-        for i in range(0, len(reps)):
-            self.file_names.extend(numpy.repeat(_files_in_directory[i], reps[i]))
 
-        self._get_charset()
-        self._get_specials()
-        self._get_verbs()
-        self._get_grammar()
-        self._get_base()
+def find_policy_directories(root):
+    """
+    Walks a directory tree, e.g. of sector/year subdirectories, for the directories that hold policy files, any
+    file other than a .txt metadata file.
 
-        lots_o_stuff = self._get_v1_v1unit_v2_v2unit()
-        self.BNF_var1 = lots_o_stuff[0]
-        self.BNF_var1_units = lots_o_stuff[1]
-        self.BNF_var2 = lots_o_stuff[2]
-        self.BNF_var2_units = lots_o_stuff[3]
+    :param root: String.  Directory path of our tree.
+    :return: List of strings.  Paths of our policy directories, sorted, so our output does not depend on our
+             file system.
+    """
+    directories = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        has_policies = False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif entry.is_file() and not entry.name.endswith(".txt"):
+                    has_policies = True
+        if has_policies:
+            directories.append(directory)
+
+    return sorted(directories)
+
+
+def has_rules(files_location, completed_files):
+    """
+    Checks whether any of our "completed" files has a rule, reading each only up to its first rule, without
+    parsing it.
 
-        # see documentation of TreeStructureHash.py to see why we print
-        hash_table = TreeStructureHash.HashTable()
-        for i, rule in enumerate(self.BNF_Base):
-            print(i, rule)
-            verb_and_children = hash_table.get_verb_and_children(rule)
+    :param files_location: String.  Directory path.
+    :param completed_files: List of "completed" file names.
+    :return: Boolean.  True if any of our files has a rule.
+    """
+    for name in completed_files:
+        policies = PolicyReader.iter_policy_file(os.path.join(files_location, name))
+        for _ in policies:
+            policies.close()
+            return True
 
-            self.verb.append(verb_and_children[0])
-            self.child0.append(verb_and_children[1])
-            self.child1.append(verb_and_children[2])
-            self.child2.append(verb_and_children[3])
-            self.child3.append(verb_and_children[4])
-            self.child4.append(verb_and_children[5])
-            self.child5.append(verb_and_children[6])
+    return False
 
-        # she wanted the periods still at the end of the BNFs
-        for i in range(0, len(self.BNF)):
-            self.BNF[i] = self.BNF[i] + "."
 
-    def _fill_BNFdf(self):
-        """
-        Creates a df and fills it with our data fields.
+def build_BNFdf(files_location, stream=False, workers=1, cache=None, fuzzy_distance=0, engine="python", pool=None,
+                profile=None, metrics=False):
+    """
+    Builds the BNFdf of a directory, with its metadata, or without it if our metadata is missing or incorrectly
+    formatted, or if our directory has no rules.  Our metadata is checked before any of our completed files are
+    parsed, so they are only parsed once, and streamed rules are written with the same columns as our df.  See
+    BNFdf for our parameters.
 
-        :return: Our filled df
-        """
-        df = pandas.DataFrame()
-
-        df["verb"] = self.verb
-        df["child0"] = self.child0
-        df["child1"] = self.child1
-        df["child2"] = self.child2
-        df["child3"] = self.child3
-        df["child4"] = self.child4
-        df["child5"] = self.child5
-        df["File Name"] = self.file_names
-        df["BNF"] = self.BNF
-        df["BNF Base"] = self.BNF_Base
-        df["BNF var1"] = self.BNF_var1
-        df["BNF var1 Unit"] = self.BNF_var1_units
-        df["BNF var2"] = self.BNF_var2
-        df["BNF var2 Unit"] = self.BNF_var2_units
-        df["verb category"] = self.VerbCategory
-        df["Grammar"] = self.Grammar
-        df["charset"] = self.charset
-        df["spec char"] = self.spec_char
-
-        return df
-
-    def export_BNFdf(self, directory, name):
-        """
-        Exports our df to a csv at a desired location with a desired name.
+    :return: BNFdf.  Our BNFdf.
+    """
+    BNF_df = BNFdf(files_location, stream, workers, cache, fuzzy_distance, engine, pool, profile=profile,
+                   metrics=metrics)
+    if isinstance(BNF_df.enricher, MetadataEnricher) and (
+            not has_rules(files_location, BNF_df.completed_file_names) if stream else len(BNF_df.rules) == 0):
+        # a df without rules has always been exported without metadata, and parsing our files again is free
+        logger.warning("No rules in %s.  A data frame without metadata will be generated.", files_location)
+        BNF_df = BNFdf(files_location, stream, workers, cache, fuzzy_distance, engine, pool, FileNameEnricher, profile,
+                       metrics)
 
-        :param directory:  File path of our desired file output location
-        :param name:  Desired name of our file
-        :return: VOID
-        """
-        self.df.to_csv(directory + "\\" + name + ".csv", sep=",", index=False)
+    return BNF_df
 
 
-def print_usage():
+def export_df(df, directory, name, formats=("csv",), partition_by=ColumnarExport.DEFAULT_PARTITION_BY):
     """
-    Prints the correct usage of the program
+    Exports a df to a csv, and/or to Parquet and Arrow files, at a desired location with a desired name.
 
+    :param df: pandas.DataFrame.  Our df.
+    :param directory: String.  File path of our desired file output location.
+    :param name: String.  Desired name of our files, without their extensions.
+    :param formats: List of strings.  Any of ColumnarExport.FORMATS.
+    :param partition_by: String.  Column the rows of our Parquet and Arrow files are grouped by, or None.
     :return: VOID
     """
-    print("--------------------------------------------------------------------------------------------------------")
-    print("\nCHECK TO MAKE SURE DIRECTORY PATH IS ONE WORD\n")
-    print("\nUsage: python3 PolicyToCSV.py <infolder_path> <outfile_directory_path> <outfile_desired_name")
-    print("\nExample: ")
-    print("\\Users\\ebp\\PycharmProjects\\Passwords\\venv\Scripts\\python.exe "
-          "C:\\Users\\ebp\\PycharmProjects\\Passwords\\PolicyToCSV.py "
-          "C:\\Users\\ebp\\Desktop\\my_directory C:\\Users\\ebp\\Desktop\\my_desired_output location my_output")
-    print("--------------------------------------------------------------------------------------------------------")
+    for file_format in formats:
+        file_path = os.path.join(directory, name + ColumnarExport.FILE_EXTENSIONS[file_format])
+        if file_format == "parquet":
+            ColumnarExport.export_parquet(df, file_path, partition_by)
+        elif file_format == "arrow":
+            ColumnarExport.export_arrow(df, file_path, partition_by)
+        else:
+            df.to_csv(file_path, sep=",", index=False)
+
+
+def export_directories(root, directory, name, merge=False, stream=False, workers=1, cache=None, fuzzy_distance=0,
+                       engine="python", formats=("csv",), partition_by=ColumnarExport.DEFAULT_PARTITION_BY,
+                       summary=False, profile=None, metrics=False):
+    """
+    Exports every policy directory in a directory tree (see find_policy_directories), each with or without its
+    metadata.  Every directory is parsed in the same pool of worker processes, so workers start once, and read
+    and parse the files of a directory side by side.
+
+    Without merge, the files of each directory are written to the same relative path under our output
+    directory.  With merge, our dfs are written to one set of files, with a Directory column of their relative
+    paths first.  Columns missing from some of our dfs, e.g. File Name when only some directories have
+    metadata, are left empty there.
+
+    :param root: String.  Directory path of our tree.
+    :param directory: String.  File path of our desired file output location.
+    :param name: String.  Desired name of our files, without their extensions.
+    :param merge: Boolean.  If True, writes one set of files for our whole tree.  Cannot be streamed.
+    :param formats: List of strings.  Any of ColumnarExport.FORMATS.
+    :param partition_by: String.  Column the rows of our Parquet and Arrow files are grouped by, or None.
+    :param summary: Boolean.  If True, also exports the summary of each directory, or of our whole tree, see
+                    BNFdf.export_BNFdf.
+    :param profile: StageProfile.  If given, the stages of every directory are added up in it.
+    :param metrics: Boolean.  If True, our dfs also have the numeric columns of PolicyMetrics.
+    :return: List of strings.  Paths of our policy directories.
+    """
+    if merge and stream:
+        raise ValueError("Merged output needs the df of every directory, so it cannot be streamed.")
+
+    policy_directories = find_policy_directories(root)
+    if not policy_directories:
+        raise ValueError("No policy files in " + root + ".")
+
+    dfs = []
+    base_counts = collections.Counter()
+    tree_summary = PolicySummary.PolicySummary()
+    with get_pool(workers) if workers > 1 else contextlib.nullcontext() as pool:
+        for i, policy_directory in enumerate(policy_directories):
+            relative_path = os.path.relpath(policy_directory, root)
+            logger.info("Directory %d/%d: %s", i + 1, len(policy_directories), relative_path)
+            BNF_df = build_BNFdf(policy_directory, stream, workers, cache, fuzzy_distance, engine, pool, profile,
+                                 metrics)
+
+            if merge:
+                BNF_df.df.insert(0, "Directory", relative_path.replace(os.sep, "/"))
+                dfs.append(BNF_df.df)
+                base_counts.update(BNF_df.base_counts)
+                if summary:
+                    tree_summary.update(BNF_df.get_summary())
+            else:
+                out_directory = os.path.normpath(os.path.join(directory, relative_path))
+                os.makedirs(out_directory, exist_ok=True)
+                BNF_df.export_BNFdf(out_directory, name, formats, partition_by, summary)
+
+    if cache is not None:
+        cache.evict()
+
+    if merge:
+        import pandas
+
+        with profile.stage("merge") if profile is not None else contextlib.nullcontext():
+            df = pandas.concat(dfs, ignore_index=True)
+            for column in df.columns:
+                # missing from some of our dfs, our numeric columns are left empty as they are
+                if df[column].hasnans and not pandas.api.types.is_numeric_dtype(df[column]):
+                    df[column] = df[column].astype(object).fillna("")
+            df["Directory"] = df["Directory"].astype("category")
+            os.makedirs(directory, exist_ok=True)
+            export_df(df, directory, name, formats, partition_by)
+            if summary:
+                tree_summary.export(os.path.join(directory, name + "_summary.json"))
+            if fuzzy_distance > 0:
+                export_remapped_rules(base_counts, fuzzy_distance, os.path.join(directory, name + "_remapped.csv"))
+
+    return policy_directories
+
+
+def check_directories(directories, workers=1, fuzzy_distance=0):
+    """
+    Checks every rule of the "completed" files of our directories in one pass, without building any data frame
+    or writing any file, see check_completed_file.  Every directory is checked in the same pool of worker
+    processes.
+
+    :param directories: List of strings.  Directory paths.
+    :param workers: Integer.  Number of worker processes.
+    :param fuzzy_distance: Integer.  Bases up to this many words away from a hash table key are mapped to it.
+    :return: Tupple.  Number of files and of rules checked, and a list of the file path, line number and error of
+             each rule that cannot be converted.
+    """
+    files = 0
+    rules = 0
+    failures = []
+    check = functools.partial(check_completed_file, fuzzy_distance=fuzzy_distance)
+    with get_pool(workers) if workers > 1 else contextlib.nullcontext() as pool:
+        for directory in directories:
+            # the files a conversion would parse, see get_enricher
+            try:
+                completed_file_names = MetadataEnricher(directory).completed_file_names
+            except MetadataError:
+                completed_file_names = FileNameEnricher(directory).completed_file_names
+            file_paths = [os.path.join(directory, name) for name in completed_file_names]
+            progress = Progress(len(file_paths))
+            results = _map_files(check, file_paths, workers, pool)
+            for file_path, (file_rules, file_failures) in zip(file_paths, results):
+                progress.update(file_rules)
+                rules += file_rules
+                failures.extend((file_path, line_number, error) for line_number, error in file_failures)
+            progress.finish()
+            files += len(file_paths)
+
+    return files, rules, failures
+
+
+def get_arguments():
+    """
+    Parses our command line arguments.
+
+    :return: argparse.Namespace.  Our arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Converts a directory of policy files, translated into the formal language, into a csv.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="CHECK TO MAKE SURE DIRECTORY PATH IS ONE WORD\n\n"
+               "Example:\n"
+               "\\Users\\ebp\\PycharmProjects\\Passwords\\venv\\Scripts\\python.exe "
+               "C:\\Users\\ebp\\PycharmProjects\\Passwords\\PolicyToCSV.py "
+               "C:\\Users\\ebp\\Desktop\\my_directory C:\\Users\\ebp\\Desktop\\my_desired_output location my_output")
+    parser.add_argument("infolder_path", help="directory of policy files (and optionally a .txt metadata file), "
+                                              "or with --recursive a tree of such directories")
+    parser.add_argument("outfile_directory_path", nargs="?", help="directory the csv is written to")
+    parser.add_argument("outfile_desired_name", nargs="?", help="name of the csv, without its extension")
+    parser.add_argument("--check", action="store_true",
+                        help="only check that every rule can be converted (its columns extracted and its base "
+                             "mapped to the hash table), listing every rule that cannot with its file and line, "
+                             "without writing anything (no output arguments)")
+    parser.add_argument("--recursive", action="store_true",
+                        help="export every directory of policy files under infolder_path, each to the same relative "
+                             "path under outfile_directory_path, parsed in one pool of --workers")
+    parser.add_argument("--merge", action="store_true",
+                        help="with --recursive, export one csv of every directory, with a Directory column")
+    parser.add_argument("--stream", action="store_true",
+                        help="write rows one policy file at a time instead of building a data frame, without "
+                             "pandas (for very large directories; always used for csv output of directories "
+                             "under %d KB)" % (FAST_PATH_MAX_BYTES // 1024))
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="parse policy files in N processes.  Output is identical to a single process")
+    parser.add_argument("--cache", metavar="DIR",
+                        help="cache parsed policy files in DIR, so only new or changed files are parsed next run")
+    parser.add_argument("--cache-size", type=int, default=ParseCache.DEFAULT_MAX_BYTES // (1024 * 1024), metavar="MB",
+                        help="size the cache is evicted down to, least recently used first (default: %(default)s)")
+    parser.add_argument("--clear-cache", action="store_true", help="empty the cache before parsing")
+    parser.add_argument("--fuzzy", type=int, default=0, metavar="N",
+                        help="map rules that are not in the hash table to the closest rule at most N words away, "
+                             "and export <outfile_desired_name>_remapped.csv listing them")
+    parser.add_argument("--engine", default="python", choices=ENGINES,
+                        help="vectorized parses the whole directory at once with pandas, faster on large "
+                             "directories but without --stream, --workers or --cache (default: %(default)s)")
+    parser.add_argument("--format", nargs="+", default=["csv"], choices=ColumnarExport.FORMATS, dest="formats",
+                        help="files to write, parquet and arrow need pyarrow and a data frame (not --stream) "
+                             "(default: csv)")
+    parser.add_argument("--partition-by", default=ColumnarExport.DEFAULT_PARTITION_BY, metavar="COLUMN",
+                        help="column the rows of parquet and arrow files are grouped by, e.g. Grammar or Sector, "
+                             "or none (default: %(default)s)")
+    parser.add_argument("--summary", action="store_true",
+                        help="also export <outfile_desired_name>_summary.json, the rule counts, require/recommend "
+                             "percentages, ambiguous counts and rule keys of each rule category, for the "
+                             "visualization tool")
+    parser.add_argument("--metrics", action="store_true",
+                        help="also write numeric columns: the integer and normalized (durations in seconds) values "
+                             "of BNF var1 and var2, and each policy's minimum length, lockout threshold and expiry "
+                             "days (not --stream)")
+    parser.add_argument("--profile", action="store_true",
+                        help="print the wall time, rules and peak memory of each stage to stderr, and export them to "
+                             "<outfile_desired_name>_profile.json")
+    parser.add_argument("--profile-cprofile", metavar="FILE",
+                        help="also dump cProfile statistics of the whole run to FILE, for pstats or snakeviz")
+    parser.add_argument("--profile-tracemalloc", metavar="FILE",
+                        help="also trace Python memory, adding the peak allocated in each stage, and dump a "
+                             "tracemalloc snapshot to FILE when done (slow)")
+    parser.add_argument("--log-level", default="WARNING", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="INFO also logs a progress line (files/sec, rules/sec, ETA) every %d seconds "
+                             "(default: %%(default)s)" % PROGRESS_INTERVAL)
+    parser.add_argument("--trace-rule", action="store_true",
+                        help="print each rule before it is searched in the hash table, to find misformatted rules")
+
+    arguments = parser.parse_args()
+    if not arguments.check and arguments.outfile_desired_name is None:
+        parser.error("outfile_directory_path and outfile_desired_name are required, unless --check")
+    if arguments.engine == "vectorized" and (arguments.stream or arguments.workers > 1 or arguments.cache):
+        parser.error("--engine vectorized cannot be combined with --stream, --workers or --cache")
+    if arguments.merge and (not arguments.recursive or arguments.stream):
+        parser.error("--merge needs --recursive, and cannot be combined with --stream")
+    if arguments.metrics and arguments.stream:
+        parser.error("--metrics cannot be combined with --stream")
+    if arguments.profile_cprofile is not None or arguments.profile_tracemalloc is not None:
+        arguments.profile = True
+    if arguments.partition_by == "none":
+        arguments.partition_by = None
+    if arguments.formats != ["csv"]:
+        if arguments.stream:
+            parser.error("--format parquet and arrow cannot be combined with --stream")
+        try:
+            ColumnarExport.import_pyarrow()
+        except ImportError as e:
+            parser.error(str(e))
+
+    return arguments
 
 
 if __name__ == "__main__":
-    if len(sys.argv) == 4:
-        try:
-            BNF_df = BNFdfWithMeatadata(sys.argv[1])
-            BNF_df.BNF_Base[0] # (did it work)
-            BNF_df.export_BNFdf(sys.argv[2], sys.argv[3])
-            print("\nFile Successfully Exported with metadata.")
-
-        except (IndexError, UnboundLocalError) as e:
-            print("\nMetadata incorrectly formatted.  A data frame without metadata will be generated.")
-
-        if "BNF_df" not in locals():
-            BNF_df = BNFdfWithoutMeatadata(sys.argv[1])
-            BNF_df.export_BNFdf(sys.argv[2], sys.argv[3])
-            print("File Successfully Exported without metadata.")
+    arguments = get_arguments()
+    configure_logging(getattr(logging, arguments.log_level), arguments.trace_rule)
+
+    if arguments.check:
+        directories = ([arguments.infolder_path] if not arguments.recursive
+                       else find_policy_directories(arguments.infolder_path))
+        files, rules, failures = check_directories(directories, arguments.workers, arguments.fuzzy)
+        for file_path, line_number, error in failures:
+            print("%s:%d: %s" % (file_path, line_number, error))
+        print("\n%d rules in %d files checked, %d cannot be converted." % (rules, files, len(failures)))
+        sys.exit(1 if len(failures) > 0 else 0)
+
+    cache = None
+    if arguments.cache is not None:
+        cache = ParseCache.ParseCache(arguments.cache, arguments.cache_size * 1024 * 1024, arguments.fuzzy)
+        if arguments.clear_cache:
+            cache.clear()
+
+    if (not arguments.stream and not arguments.recursive and arguments.formats == ["csv"]
+            and arguments.engine == "python" and not arguments.metrics
+            and is_small_directory(arguments.infolder_path)):
+        # identical csv, and pandas is never imported
+        logger.info("Small directory, writing rows without a data frame.")
+        arguments.stream = True
+
+    profile = None
+    profiler = None
+    if arguments.profile:
+        import StageProfile
+
+        profile = StageProfile.StageProfile()
+    if arguments.profile_tracemalloc is not None:
+        import tracemalloc
+
+        tracemalloc.start()
+    if arguments.profile_cprofile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    if arguments.recursive:
+        directories = export_directories(arguments.infolder_path, arguments.outfile_directory_path,
+                                         arguments.outfile_desired_name, arguments.merge, arguments.stream,
+                                         arguments.workers, cache, arguments.fuzzy, arguments.engine,
+                                         arguments.formats, arguments.partition_by, arguments.summary, profile,
+                                         arguments.metrics)
+        message = "\n" + str(len(directories)) + " Directories Successfully Exported."
     else:
-        print_usage()
+        BNF_df = build_BNFdf(arguments.infolder_path, arguments.stream, arguments.workers, cache, arguments.fuzzy,
+                             arguments.engine, profile=profile, metrics=arguments.metrics)
+        BNF_df.export_BNFdf(arguments.outfile_directory_path, arguments.outfile_desired_name, arguments.formats,
+                            arguments.partition_by, arguments.summary)
+        if isinstance(BNF_df.enricher, MetadataEnricher):
+            message = "\nFile Successfully Exported with metadata."
+        else:
+            message = "\nFile Successfully Exported without metadata."
+
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(arguments.profile_cprofile)
+    if arguments.profile_tracemalloc is not None:
+        tracemalloc.take_snapshot().dump(arguments.profile_tracemalloc)
+        tracemalloc.stop()
+    if profile is not None:
+        print(profile.get_report(), file=sys.stderr)
+        profile.export(os.path.join(arguments.outfile_directory_path, arguments.outfile_desired_name + "_profile.json"))
+    print(message)
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Module contains a RuleBuffer object, which collects the parsed rows of many
+"completed" files into one flat column per field, along with the offset of
+each file's first row, like a CSR matrix.  Adding a file only appends to our
+columns, so collecting a directory is linear in its number of rules, and
+per-file values (file names, metadata) are attached to each file's offset
+range instead of being repeated for every row.
+
+Our columns are compact.  Most fields repeat a few short strings (verbs,
+children, bases, units, ...), so each distinct value is kept once and each rule
+only holds its 4 byte code, in an array.  BNF var1 and BNF var2 are kept as 8
+byte integers, with MISSING for rules without them and USER_INPUT for
+RuleParser.USER_INPUT_WARNING.  Only BNF, which is different for almost every
+rule, is a list of strings.  Collected rules take less than half the memory of
+lists of strings, and columns of our df are made straight from our codes.
+
+Only our df columns need numpy and pandas, which are imported when first used,
+so collecting rows stays light.
+"""
+
+import array
+import RuleParser
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# numbers of rules without a variable, and of variables that depend on user input
+MISSING = -1
+USER_INPUT = -2
+# numbers at and below this are numbers kept as written, e.g. with leading zeros, see _Numbers
+VERBATIM = -3
+NUMBER_COLUMNS = ["BNF var1", "BNF var2"]
+# every other rule is different
+TEXT_COLUMNS = ["BNF"]
+CODED_COLUMNS = [column for column in RuleParser.ROW_COLUMNS if column not in NUMBER_COLUMNS + TEXT_COLUMNS]
+# largest number kept as an integer
+_MAX_NUMBER = 2 ** 63 - 1
+
+
+class _Codes(dict):
+    """
+    Code of each distinct value of a column, in the order values were first added.
+    """
+
+    def __missing__(self, value):
+        """
+        Adds a new value.
+
+        :param value: String.  Our value.
+        :return: Integer.  Its code.
+        """
+        code = self[value] = len(self)
+        return code
+
+
+class _Numbers(dict):
+    """
+    Number of each distinct value of our number columns.  Values that would not be written the same way again as
+    an integer are kept as written, numbered VERBATIM and down.
+    """
+
+    def __init__(self):
+        """
+        Constructor for our empty numbers.
+        """
+        super().__init__()
+        self.verbatim = []
+
+    def __missing__(self, value):
+        """
+        Adds a new value.
+
+        :param value: String.  Our value, a number, USER_INPUT_WARNING or empty.
+        :return: Integer.  Its number.
+        """
+        if value == "":
+            number = MISSING
+        elif value == RuleParser.USER_INPUT_WARNING:
+            number = USER_INPUT
+        elif value.isascii() and value.isdigit() and str(int(value)) == value and int(value) <= _MAX_NUMBER:
+            number = int(value)
+        else:
+            number = VERBATIM - len(self.verbatim)
+            self.verbatim.append(value)
+        self[value] = number
+
+        return number
+
+    def get_value(self, number):
+        """
+        Gets the value a number was added as.
+
+        :param number: Integer.  Our number.
+        :return: String.  Our value.
+        """
+        if number >= 0:
+            return str(number)
+        if number == MISSING:
+            return ""
+        if number == USER_INPUT:
+            return RuleParser.USER_INPUT_WARNING
+
+        return self.verbatim[VERBATIM - number]
+
+
+class RuleBuffer:
+    """
+    Compact columns of parsed rows, see PolicyToCSV.parse_completed_file, and the offsets of each file's rows.
+    Rows of file i are offsets[i] to offsets[i + 1].
+    """
+
+    def __init__(self):
+        """
+        Constructor for our empty buffer.
+        """
+        self.codes = {column: array.array("i") for column in CODED_COLUMNS}
+        self.values = {column: _Codes() for column in CODED_COLUMNS}
+        self.numbers = {column: array.array("q") for column in NUMBER_COLUMNS}
+        self.texts = {column: [] for column in TEXT_COLUMNS}
+        self._numbers = _Numbers()   # shared by our number columns
+        self.offsets = array.array("q", [0])
+
+    def __len__(self):
+        """
+        Gets our number of rules.
+
+        :return: Integer.  Our number of rules.
+        """
+        return self.offsets[-1]
+
+    def _add_values(self, column, values):
+        """
+        Appends values to one of our columns.
+
+        :param column: String.  One of ROW_COLUMNS.
+        :param values: Iterable of strings.  Our values.
+        :return: VOID
+        """
+        if column in self.codes:
+            self.codes[column].extend(map(self.values[column].__getitem__, values))
+        elif column in self.numbers:
+            self.numbers[column].extend(map(self._numbers.__getitem__, values))
+        else:
+            self.texts[column].extend(values)
+
+    def add_file(self, rows):
+        """
+        Appends the rows of a file.
+
+        :param rows: List of lists.  Our file's rows, in the order of ROW_COLUMNS.
+        :return: VOID
+        """
+        if len(rows) > 0:
+            for column, values in zip(RuleParser.ROW_COLUMNS, zip(*rows)):
+                self._add_values(column, values)
+        self.offsets.append(self.offsets[-1] + len(rows))
+
+    def add_files(self, df, rules_per_file):
+        """
+        Appends the rows of several files at once.
+
+        :param df: pandas.DataFrame.  Our files' rows, with ROW_COLUMNS.
+        :param rules_per_file: List of integers.  Number of rows of each of our files, in order.
+        :return: VOID
+        """
+        for column in RuleParser.ROW_COLUMNS:
+            self._add_values(column, df[column].tolist())
+        for rules in rules_per_file:
+            self.offsets.append(self.offsets[-1] + rules)
+
+    def get_column(self, column):
+        """
+        Gets the values of one of our columns, one rule at a time, without copying our column.
+
+        :param column: String.  One of ROW_COLUMNS.
+        :return: Iterator of strings.  Our values.
+        """
+        if column in self.codes:
+            return map(list(self.values[column]).__getitem__, self.codes[column])
+        if column in self.numbers:
+            return map(self._numbers.get_value, self.numbers[column])
+
+        return iter(self.texts[column])
+
+    def get_counts(self, column):
+        """
+        Counts the rules with each value of one of our coded columns.
+
+        :param column: String.  One of CODED_COLUMNS.
+        :return: Dict.  Number of rules with each of our values.
+        """
+        import numpy
+
+        counts = numpy.bincount(numpy.frombuffer(self.codes[column], dtype=numpy.int32),
+                                minlength=len(self.values[column]))
+        return dict(zip(self.values[column], counts.tolist()))
+
+    def get_numbers(self, column):
+        """
+        Gets one of our number columns, without copying it.
+
+        :param column: String.  One of NUMBER_COLUMNS.
+        :return: numpy.ndarray.  Our numbers, see MISSING, USER_INPUT and VERBATIM.
+        """
+        import numpy
+
+        return numpy.frombuffer(self.numbers[column], dtype=numpy.int64)
+
+    def get_integers(self, column):
+        """
+        Gets the integer value of each rule of one of our number columns, including numbers kept as written.
+
+        :param column: String.  One of NUMBER_COLUMNS.
+        :return: Tupple.  numpy.ndarray of our values, and numpy.ndarray of whether each rule has one, False for
+                 MISSING, USER_INPUT and numbers too large to hold.
+        """
+        import numpy
+
+        numbers = self.get_numbers(column)
+        values = numbers.copy()
+        valid = numbers >= 0
+        for row in numpy.flatnonzero(numbers <= VERBATIM).tolist():
+            value = self._numbers.get_value(int(numbers[row]))
+            if value.isascii() and value.isdigit() and int(value) <= _MAX_NUMBER:
+                values[row] = int(value)
+                valid[row] = True
+
+        return values, valid
+
+    def get_df_column(self, column):
+        """
+        Gets one of our columns for our df.  Coded and number columns are categorical, made from our codes, with
+        their categories sorted, as pandas sorts the categories of a column of strings.
+
+        :param column: String.  One of ROW_COLUMNS.
+        :return: pandas.Categorical, or a list of strings for our text columns.
+        """
+        import numpy
+
+        if column in self.codes:
+            return _get_categorical(numpy.frombuffer(self.codes[column], dtype=numpy.int32),
+                                    list(self.values[column]))
+        if column in self.numbers:
+            distinct_numbers, codes = numpy.unique(self.get_numbers(column), return_inverse=True)
+            return _get_categorical(codes, [self._numbers.get_value(number) for number in distinct_numbers.tolist()])
+
+        return self.texts[column]
+
+    def get_rules_per_file(self):
+        """
+        Gets our number of rules in each file.
+
+        :return: numpy.ndarray.  Our rules per file.
+        """
+        import numpy
+
+        return numpy.diff(numpy.frombuffer(self.offsets, dtype=numpy.int64))
+
+    def get_file_indexes(self):
+        """
+        Gets the index of the file of each of our rules.
+
+        :return: numpy.ndarray.  Our file indexes.
+        """
+        import numpy
+
+        return numpy.repeat(numpy.arange(len(self.offsets) - 1), self.get_rules_per_file())
+
+    def get_file_column(self, values):
+        """
+        Expands a value per file into a column, over each file's offset range.
+
+        :param values: List of strings.  A value for each of our files.
+        :return: pandas.Categorical.  A code per rule into our distinct values.
+        """
+        import pandas
+
+        codes, distinct_values = pandas.factorize(pandas.Series(values, dtype=object))
+
+        return pandas.Categorical.from_codes(codes[self.get_file_indexes()], distinct_values)
+
+
+def _get_categorical(codes, values):
+    """
+    Makes a categorical of codes into distinct values, with its categories sorted.
+
+    :param codes: numpy.ndarray.  A code per rule into our values.
+    :param values: List of strings.  Our distinct values.
+    :return: pandas.Categorical.  Our column.
+    """
+    import numpy
+    import pandas
+
+    values = pandas.Index(values, dtype=object)
+    order = values.argsort()
+    # new code of each of our codes
+    sorted_codes = numpy.empty(len(order), dtype=codes.dtype)
+    sorted_codes[order] = numpy.arange(len(order), dtype=codes.dtype)
+
+    return pandas.Categorical.from_codes(sorted_codes[codes], values[order])
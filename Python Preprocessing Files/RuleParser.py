@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Module contains a RuleParser object, which breaks a single BNF rule into every
+column our CSVs need (verb category, grammar, char sets, variables and base) in
+one visit of the rule.
+
+All of our patterns are compiled once, when the module is imported, instead of
+on every call.
+"""
+
+import re
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# This may by subject to change.  Replaces variables when no input variables are present.
+USER_INPUT_WARNING = "DEPENDS ON USER INPUT"
+
+# char sets
+_CHARSET_PATTERNS = (re.compile("(?<=character in the set of )(.*)"),
+                     re.compile("(?<=characters in the set of )(.*)"),
+                     re.compile("(?<=sets: )(.*)"))
+_SPECIALS_PATTERN = re.compile("(?<=these special characters: )(.*)")
+_UNSPEC_SPECIALS = "special characters (unspec)"
+
+# verb categories and grammars, checked in order.  We do the "not" case first so that must is a diff mapping
+_VERB_CATEGORIES = (("must not", "prohibited"),
+                    ("must", "required"),
+                    ("should not", "dissuaded"))
+_GRAMMARS = (("create passwords", "create"),
+             ("change passwords", "change"),
+             ("communicate passwords", "communicate"),
+             ("store passwords", "store"))
+
+# variables
+_NUMBER_PATTERN = re.compile(r"[0-9]+|" + re.escape(USER_INPUT_WARNING))
+
+# bases
+_CHARSET_BASE_PATTERN = re.compile(r"character[s\s]+in the set of")
+_NUMBER_SUBSTITUTIONS = (
+    (re.compile("[0-9]+ times in a [0-9]+ (.+) interval"), "/number/ times in a /number/ /time unit/ interval"),
+    (re.compile("[0-9]+ times"), "/number/ times"),
+    (re.compile("[0-9]+ (.+) lockout"), "/number/ /time unit/ lockout"),
+    (re.compile(re.escape(USER_INPUT_WARNING) + r"(\s)*times in a " + re.escape(USER_INPUT_WARNING) + r"(\s)*(.+) interval"),
+     "/number/ times in a /number/ /time unit/ interval"),
+    (re.compile(re.escape(USER_INPUT_WARNING) + r"(\s)*times"), "/number/ times"),
+    (re.compile(re.escape(USER_INPUT_WARNING) + r"(\s)*lockout"), "/number/ /time unit/ lockout"),
+    (re.compile(re.escape(USER_INPUT_WARNING)), "/number/"),
+    (re.compile("[0-9]+"), "/number/"))
+
+# columns of the rows of PolicyToCSV.parse_completed_file, our parsed columns after a verb and children
+ROW_COLUMNS = ["verb", "child0", "child1", "child2", "child3", "child4", "child5", "BNF", "BNF Base", "BNF var1",
+               "BNF var1 Unit", "BNF var2", "BNF var2 Unit", "verb category", "Grammar", "charset", "spec char"]
+
+
+class RuleParser:
+    """
+    Parses BNF rules (without their trailing period) into the values of our CSV columns.
+    """
+
+    def parse_rule(self, rule):
+        """
+        Gets every column value for a single BNF rule.
+
+        :param rule: String.  Our BNF rule.
+        :return: Tupple.  (verb category, grammar, charset, spec char, BNF base,
+                 var1, var1 unit, var2, var2 unit)
+        """
+        charset = self._get_charset(rule)
+        nums = _NUMBER_PATTERN.findall(rule)
+        post_number = _NUMBER_PATTERN.split(rule)
+        v1_unit, v2_unit = self._get_units(post_number)
+
+        return (self._get_verb_category(rule),
+                self._get_grammar(rule),
+                charset,
+                self._get_specials(charset),
+                self._get_base(rule),
+                nums[0] if len(nums) > 0 else "",
+                v1_unit,
+                nums[1] if len(nums) > 1 else "",
+                v2_unit)
+
+    def _get_charset(self, rule):
+        """
+        Get our char set from a BNF rule.
+
+        :param rule: String.  Our BNF rule.
+        :return: String.  Our char set, empty if there is none.
+        """
+        for pattern in _CHARSET_PATTERNS:
+            char_match = pattern.search(rule)
+            if char_match is not None:
+                return char_match.group(0)
+
+        return ""
+
+    def _get_specials(self, charset):
+        """
+        Get our special char set from a char set.
+
+        :param charset: String.  Our char set.
+        :return: String.  Our special chars, "(unspec)" or empty.
+        """
+        if _UNSPEC_SPECIALS in charset:
+            return "(unspec)"
+
+        sp_char_match = _SPECIALS_PATTERN.search(charset)
+        if sp_char_match is not None:
+            return sp_char_match.group(0)
+
+        return ""
+
+    def _get_verb_category(self, rule):
+        """
+        Get the verb category of a BNF rule.
+
+        :param rule: String.  Our BNF rule.
+        :return: String.  prohibited, required, dissuaded or recommended.
+        """
+        for verb, category in _VERB_CATEGORIES:
+            if verb in rule:
+                return category
+
+        return "recommended"   # should
+
+    def _get_grammar(self, rule):
+        """
+        Get the grammar of a BNF rule.
+
+        :param rule: String.  Our BNF rule.
+        :return: String.  Our grammar.
+        """
+        for phrase, grammar in _GRAMMARS:
+            if phrase in rule:
+                return grammar
+
+        return "fail to authenticate"   # lockout
+
+    def _get_units(self, post_number):
+        """
+        Gets variable 1 units and variable 2 units from a BNF rule split on its variables.
+
+        :param post_number: List of strings.  Our BNF rule split on its variables.
+        :return: Tupple.  Variable 1 units and variable 2 units.
+        """
+        if len(post_number) == 1:    # we've got nothing
+            return "", ""
+
+        if len(post_number) == 2:
+            pre_unit1 = post_number[1].split()
+            index = 0
+            while pre_unit1[index] in ["or", "more"]:   # keep moving along the sentence until not in this set
+                index += 1
+
+            var_l = pre_unit1[index]
+            if var_l == "consecutive":
+                return "consecutive characters", ""
+            elif var_l == "unique":
+                return "unique characters", ""
+            return var_l, ""   # no units exist, but need to equal length
+
+        # len(post_number) == 3
+        pre_unit1 = post_number[1].split()
+        pre_unit2 = post_number[2].split()
+
+        var_l = pre_unit1[0]
+        if var_l == "of":
+            var_l = "sets"
+
+        return var_l, pre_unit2[0].replace(":", "")
+
+    def _get_base(self, rule):
+        """
+        Gets the BNF base from a BNF rule.
+
+        :param rule: String.  Our BNF rule.
+        :return: String.  Our rule without variables.
+        """
+        base = rule
+        char_match = _CHARSET_BASE_PATTERN.search(base)
+        if char_match is not None:
+            base = base[:char_match.start()] + char_match.group(0) + " /char set/"
+
+        # repeat for the "sets:" possibility
+        sets_index = base.find("sets:")
+        if sets_index != -1:
+            base = base[:sets_index] + "sets: " + " /char set/"
+
+        # getting rid of numbers
+        for pattern, replacement in _NUMBER_SUBSTITUTIONS:
+            base = pattern.sub(replacement, base)
+
+        return base
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Module contains a StageProfile object, which records the wall time, number
+of calls and rules, and peak memory of each stage of a BNFdf, so a slow run can
+be traced to file I/O, our rule extractors, hash lookups or pandas.
+
+Stages are either blocks (StageProfile.stage), such as building our df, or
+functions called once per file or rule (StageProfile.timed), such as each of
+the extractors of RuleParser.  Stages started inside another stage are its
+children, and their time is also part of it.  Peak memory is the peak resident
+set size of our process at the end of each block, and, while tracemalloc is
+tracing, the peak memory allocated by Python during each block.
+"""
+
+import sys
+import json
+import time
+import contextlib
+import tracemalloc
+
+try:
+    import resource
+except ImportError:   # not available on Windows
+    resource = None
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+MB = 1024 * 1024
+
+
+def get_peak_rss_mb():
+    """
+    Gets the peak resident set size of our process so far.
+
+    :return: Float.  Our peak RSS in MB, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / MB if sys.platform == "darwin" else peak / 1024   # bytes on macOS, KB elsewhere
+
+
+class StageProfile:
+    """
+    Each of our stages, in the order they first started, as a dict of its parent stage, seconds, calls and rules,
+    and peak memory.
+    """
+
+    def __init__(self):
+        """
+        Constructor for our empty profile.  Our wall time starts now.
+        """
+        self.start = time.perf_counter()
+        self.stages = {}
+        self._open = []   # name and peak traced bytes of each block that has started but not finished
+
+    def _get_stage(self, name, parent):
+        """
+        Gets one of our stages, adding it if it has not started before.
+
+        :param name: String.  Name of our stage.
+        :param parent: String.  Name of the stage it is part of, or None.
+        :return: Dict.  Our stage.
+        """
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = {"parent": parent, "seconds": 0.0, "calls": 0, "rules": 0}
+
+        return stage
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Times a block as one of our stages.  Rules may be counted by adding them to the stage's "rules".
+
+        :param name: String.  Name of our stage.
+        :return: Context manager of a dict.  Our stage.
+        """
+        stage = self._get_stage(name, self._open[-1][0] if len(self._open) > 0 else None)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # our parent's peak so far, as our own starts from here
+            if len(self._open) > 0:
+                self._open[-1][1] = max(self._open[-1][1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        self._open.append([name, 0])
+
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage["seconds"] += time.perf_counter() - start
+            stage["calls"] += 1
+            name, peak_traced = self._open.pop()
+            stage["peak_rss_mb"] = get_peak_rss_mb()
+            if tracing:
+                peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1])
+                stage["peak_traced_mb"] = max(stage.get("peak_traced_mb", 0.0), peak_traced / MB)
+                if len(self._open) > 0:
+                    self._open[-1][1] = max(self._open[-1][1], peak_traced)
+                tracemalloc.reset_peak()
+
+    def timed(self, name, function, parent=None):
+        """
+        Wraps a function called once per file or rule, so each call is added to one of our stages.  Only its
+        time and calls are recorded, memory is left to the block it is called in.
+
+        :param name: String.  Name of our stage.
+        :param function: Function.  Function to time.
+        :param parent: String.  Name of the stage our function is part of.  Defaults to the block we are in.
+        :return: Function.  Our function, timed.
+        """
+        if parent is None and len(self._open) > 0:
+            parent = self._open[-1][0]
+        stage = self._get_stage(name, parent)
+        perf_counter = time.perf_counter
+
+        def timed_function(*args):
+            start = perf_counter()
+            result = function(*args)
+            stage["seconds"] += perf_counter() - start
+            stage["calls"] += 1
+            return result
+
+        return timed_function
+
+    def to_dict(self):
+        """
+        Gets our profile in the form it is exported.
+
+        :return: Dict.  Our wall time so far, and our stages.
+        """
+        return {"seconds": time.perf_counter() - self.start, "peak_rss_mb": get_peak_rss_mb(),
+                "stages": {name: dict(stage) for name, stage in self.stages.items()}}
+
+    def get_report(self):
+        """
+        Formats our stages as a table, each stage under the stage it is part of.
+
+        :return: String.  Our report.
+        """
+        profile = self.to_dict()
+        traced = any("peak_traced_mb" in stage for stage in profile["stages"].values())
+        header = "%-28s %10s %6s %10s %10s %12s %12s" % ("stage", "seconds", "%", "calls", "rules", "rules/sec",
+                                                          "peak RSS MB")
+        lines = [header + (" %15s" % "peak traced MB" if traced else ""), "-" * (len(header) + 16 * traced)]
+
+        def add_lines(parent, depth):
+            for name, stage in profile["stages"].items():
+                if stage["parent"] != parent:
+                    continue
+                rules, rules_per_second = "-", "-"
+                if stage["rules"] > 0:
+                    rules = str(stage["rules"])
+                    rules_per_second = "%.0f" % (stage["rules"] / max(stage["seconds"], 1e-9))
+                line = "%-28s %10.3f %6.1f %10d %10s %12s %12s" % (
+                    "  " * depth + name, stage["seconds"], 100 * stage["seconds"] / max(profile["seconds"], 1e-9),
+                    stage["calls"], rules, rules_per_second, _format_mb(stage.get("peak_rss_mb")))
+                if traced:
+                    line += " %15s" % _format_mb(stage.get("peak_traced_mb"))
+                lines.append(line)
+                add_lines(name, depth + 1)
+
+        add_lines(None, 0)
+        lines.append("%-28s %10.3f %6.1f %10s %10s %12s %12s" % ("total", profile["seconds"], 100.0, "", "", "",
+                                                                 _format_mb(profile["peak_rss_mb"])))
+
+        return "\n".join(lines)
+
+    def export(self, file_path):
+        """
+        Exports our profile to a JSON file, so runs can be compared.
+
+        :param file_path: String.  Path of our JSON file.
+        :return: VOID
+        """
+        with open(file_path, "w") as out_file:
+            json.dump(self.to_dict(), out_file, indent=1)
+
+
+def _format_mb(mb):
+    """
+    Formats an amount of memory for our report.
+
+    :param mb: Float.  Memory in MB, or None if it was not measured.
+    :return: String.  Our memory.
+    """
+    return "-" if mb is None else "%.1f" % mb
@@ -2,138 +2,242 @@
 """
 Module contains a HashTable object, neccessary for getting the vairables
 needed for our visualization tool from each of our base BNF rules.
+
+Our keys and children are defined in grammarTable.csv, and loaded from
+GrammarIndex.py, which BuildGrammar.py builds from it along with the
+visualization tool's treeDataStructure.csv.  get_hash_table gives one
+HashTable per fuzzy distance and process.
 """
 
-import re
+import hashlib
+import logging
+import functools
+import GrammarIndex
 
 __author__ = "Elijah Peake"
 __email__ = "elijah.peake@gmail.com"
 
+# each rule as it is searched for, see get_verb_and_children
+logger = logging.getLogger("TreeStructureHash")
+
+# modal verbs that follow the subject of every rule, each may be followed by "not"
+_VERBS = ("must", "should")
+# marks the trie node that completes a key, see BuildGrammar.build_trie
+_KEY_END = None
+# how many words away keys are still suggested in our errors
+_SUGGESTION_DISTANCE = 3
+# fuzzy matches remembered per HashTable, real corpora repeat the same few mistranslations
+_MAX_FUZZY_MATCHES = 4096
+
+
+class UnknownRuleError(ValueError):
+    """
+    Raised when a base BNF rule is not a key of our hash table, usually because it was not translated perfectly
+    into the formal language.  Reports the longest start of the rule that matches a key, what could follow it,
+    and the closest keys to the rule.
+    """
+
+    def __init__(self, rule, matched_words, expected_words, closest_keys=()):
+        """
+        :param rule: String.  Our base BNF rule.
+        :param matched_words: List of strings.  Longest start of our rule (without its verb) that matches a key.
+        :param expected_words: List of strings.  Words that could have come next.
+        :param closest_keys: List of strings.  Keys fewest words away from our rule, if any are close.
+        """
+        self.rule = rule
+        self.matched_words = list(matched_words)
+        self.matched_prefix = " ".join(matched_words)
+        self.expected_words = sorted(expected_words)
+        self.closest_keys = list(closest_keys)
+        message = ("BNF base %r is not in the hash table.  Longest match: %r, which can be followed by: %s"
+                   % (rule, self.matched_prefix, ", ".join(repr(word) for word in self.expected_words)
+                      or "nothing (the rule is too long)"))
+        if len(self.closest_keys) > 0:
+            message += ".  Closest keys: " + ", ".join(repr(key) for key in self.closest_keys)
+        super().__init__(message)
+
+    def __reduce__(self):
+        """
+        Lets our error be pickled, so it can be raised in a worker process and re-raised in our main one.
+
+        :return: Tupple.  Our class and constructor arguments.
+        """
+        return UnknownRuleError, (self.rule, self.matched_words, self.expected_words, self.closest_keys)
+
+
 class HashTable:
-    def __init__(self):
-        self._hash_table = {'Users change passwords before /number/ days': ['Users', 'Change Passwords', 'Before /number/ days', '', '', ''],
-                            'Users change passwords before /number/ days if compromised': ['Users', 'Change Passwords', 'Before /number/ days if', 'Compromised', '', ''],
-                            'Users change passwords before /number/ days if directed by management': ['Users', 'Change Passwords', 'Before /number/ days if', 'Directed By Management', '', ''],
-                            'Users change passwords before /number/ days if found non-compliant': ['Users', 'Change Passwords', 'Before /number/ days if', 'Found Non-Compliant', '', ''],
-                            'Users change passwords before /number/ days if sent unencrypted': ['Users', 'Change Passwords', 'Before /number/ days if', 'Sent Unencrypted', '', ''],
-                            'Users change passwords before /number/ days if shared': ['Users', 'Change Passwords', 'Before /number/ days if', 'Shared', '', ''],
-                            'Users change passwords immediately if compromised': ['Users', 'Change Passwords', 'Immediately if', 'Compromised', '', ''],
-                            'Users change passwords immediately if directed by management': ['Users', 'Change Passwords', 'Immediately if', 'Directed By Management', '', ''],
-                            'Users change passwords immediately if found non-compliant': ['Users', 'Change Passwords', 'Immediately if', 'Found Non-Compliant', '', ''],
-                            'Users change passwords immediately if sent unencrypted': ['Users', 'Change Passwords', 'Immediately if', 'Sent Unencrypted', '', ''],
-                            'Users change passwords immediately if shared': ['Users', 'Change Passwords', 'Immediately if', 'Shared', '', ''],
-                            'Users communicate passwords except in an emergency': ['Users', 'Communicate Passwords', 'Except in an emergency', '', '', ''],
-                            'Users communicate passwords to a third party': ['Users', 'Communicate Passwords', 'To', 'A third Party', '', ''],
-                            'Users communicate passwords to anyone': ['Users', 'Communicate Passwords', 'To', 'Anyone', '', ''],
-                            'Users communicate passwords by any means': ['Users', 'Communicate Passwords', 'by', 'Any means', '', ''],
-                            'Users communicate passwords by any network without encryption': ['Users', 'Communicate Passwords', 'by', 'Any Network without encryption', '', ''],
-                            'Users communicate passwords by any network': ['Users', 'Communicate Passwords', 'by', 'Any network', '', ''],
-                            'Users communicate passwords by email without encryption': ['Users', 'Communicate Passwords', 'by', 'Email without encryption', '', ''],
-                            'Users communicate passwords by email': ['Users', 'Communicate Passwords', 'by', 'Email', '', ''],
-                            'Users communicate passwords by mail without encryption': ['Users', 'Communicate Passwords', 'by', 'Mail without encryption', '', ''],
-                            'Users communicate passwords by mail accompanied by the user ID': ['Users', 'Communicate Passwords', 'by', 'Mail accompanied by the user ID', '', ''],
-                            'Users communicate passwords by mail': ['Users', 'Communicate Passwords', 'by', 'Mail', '', ''],
-                            'Users communicate passwords by phone mail': ['Users', 'Communicate Passwords', 'by', 'Phone Mail', '', ''],
-                            'Users communicate passwords by phone': ['Users', 'Communicate Passwords', 'by', 'Phone', '', ''],
-                            'Users communicate passwords by Internet or wide-area network': ['Users', 'Communicate Passwords', 'by', 'Internet or wide-area network', '', ''],
-                            'Users communicate passwords by Internet or wide-area network without encryption': ['Users', 'Communicate Passwords', 'by', 'Internet or wide-area network without encryption', '', ''],
-                            'Users communicate passwords by local area network': ['Users', 'Communicate Passwords', 'by', 'Local area network', '', ''],
-                            'Users communicate passwords by local area network without encryption': ['Users', 'Communicate Passwords', 'by', 'Local area network without encryption', '', ''],
-                            'Users create passwords with length greater than or equal to /number/ characters': ['Users', 'Create Passwords', 'With length greater than or equal to /number/ characters', '', '', ''],
-                            'Users create passwords with a character in the set of /char set/': ['Users', 'Create Passwords', 'With a character in the set of /char set/', '', '', ''],
-                            'Users create passwords with all characters in the set of /char set/': ['Users','Create Passwords','With all characters in the set of /char set/','', '', ''],
-                            'Users create passwords with a character in the first /number/ characters in the set of /char set/': ['Users', 'Create Passwords', 'With a character in the first /number/ characters in the set of /char set/', '', '', ''],
-                            'Users create passwords with /number/ or more characters in the set of /char set/': ['Users', 'Create Passwords', 'With /number/ or more characters in the set of /char set/', '', '', ''],
-                            'Users create passwords with an internal character in the set of /char set/': ['Users', 'Create Passwords', 'With an internal character in the set of /char set/', '', '', ''],
-                            'Users create passwords with a first or last character in the set of /char set/': ['Users', 'Create Passwords', 'With a first or last character in the set of /char set/', '', '', ''],
-                            'Users create passwords equal to the user ID': ['Users', 'Create Passwords', '\s', 'Equal to', 'The user ID', ''],
-                            'Users create passwords equal to their name': ['Users', 'Create Passwords', '\s', 'Equal to', 'Their name', ''],
-                            'Users create passwords in the set of dictionary words': ['Users', 'Create Passwords', '\s', 'In the set of', 'Dictionary Words', ''],
-                            'Users create passwords in the set of dictionary words followed by a number': ['Users', 'Create Passwords', '\s', 'In the set of', 'Dictionary Words +', 'Followed by a number'],
-                            'Users create passwords in the set of dictionary words in reverse': ['Users', 'Create Passwords', '\s', 'In the set of', 'Dictionary Words +', 'In reverse'],
-                            'Users create passwords in the set of dictionary words with numbers substituted for letters': ['Users', 'Create Passwords', '\s', 'In the set of', 'Dictionary Words +', 'With numbers substituted for letters'],
-                            'Users create passwords in the set of dictionary words preceded or followed by a number or special character (unspec)': ['Users', 'Create Passwords', '\s', 'In the set of', 'Dictionary Words +', 'Preceded or followed by a number or special character (unspec)'],
-                            'Users create passwords in the set of otherwise forbidden content concatenated': ['Users', 'Create Passwords', '\s', 'In the set of', 'Otherwise forbidden content', 'Concatenated'],
-                            'Users create passwords in the set of otherwise forbidden content in reverse': ['Users', 'Create Passwords', '\s', 'In the set of', 'Otherwise forbidden content', 'In reverse'],
-                            'Users create passwords in the set of otherwise forbidden content preceded or followed by a number': ['Users', 'Create Passwords', '\s', 'In the set of', 'Otherwise forbidden content', 'Preceded or followed by a number'],
-                            'Users create passwords in the set of their last /number/ passwords': ['Users', 'Create Passwords', '\s', 'In the set of', 'Their last', '/number/ passwords'],
-                            'Users create passwords in the set of their last /number/ years of passwords': ['Users', 'Create Passwords', '\s', 'In the set of', 'Their last', '/number/ years of passwords'],
-                            'Users create passwords in the set of strings with a character repeated /number/ or more times consecutively': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'A character repeated /number/ or more times consecutively'],
-                            'Users create passwords in the set of strings with a character repeated /number/ or more times': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'A character repeated /number/ or more times'],
-                            'Users create passwords in the set of strings with a run of /number/ or more consecutive characters in sequence': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'A run of /number/ or more consecutive characters in sequence'],
-                            'Users create passwords in the set of strings with at least /number/ unique characters': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'At least /number/ unique characters'],
-                            'Users create passwords in the set of strings with characters from /number/ of these /number/ sets:': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'Characters from /number/ of these /number/ sets:'],
-                            'Users create passwords in the set of strings with word or number patterns (unspec)': ['Users', 'Create Passwords', '\s', 'In the set of', 'Strings with', 'Word or number patterns (unspec)'],
-                            'Users create passwords in the set of passwords to an outside system': ['Users', 'Create Passwords', '\s', 'In the set of', 'passwords', 'To an outside system'],
-                            'Users create passwords in the set of passwords to any other system': ['Users', 'Create Passwords', '\s', 'In the set of', 'passwords', 'To any other system'],
-                            'Users create passwords in the set of those passwords used /number/ times in the last /number/ years': ['Users', 'Create Passwords', '\s', 'In the set of', 'Those passwords used /number/ times in the last /number/ years', ''],
-                            'Users create passwords in the set of proper nouns': ['Users', 'Create Passwords', '\s', 'In the set of', 'Proper nouns', ''],
-                            'Users create passwords in the set of incremental changes to existing passwords (unspec)': ['Users', 'Create Passwords', '\s', 'In the set of', 'Incremental changes to existing passwords (unspec)', ''],
-                            'Users create passwords in the set of personally identifying information': ['Users', 'Create Passwords', '\s', 'In the set of', 'Personally identifying information', ''],
-                            'Users create passwords in the set of vendor default passwords': ['Users', 'Create Passwords', '\s', 'In the set of', 'Vendor default passwords', ''],
-                            'Users create passwords in the set of addresses or other locations': ['Users', 'Create Passwords', '\s', 'In the set of', 'Addresses or other locations', ''],
-                            'Users create passwords in the set of birthdays or other dates': ['Users', 'Create Passwords', '\s', 'In the set of', 'Birthdays or other dates', ''],
-                            'Users create passwords with a substring equal to the user ID': ['Users', 'Create Passwords', 'With a substring', 'Equal to', 'The user ID ', ''],
-                            'Users create passwords with a substring equal to their name': ['Users', 'Create Passwords', 'With a substring', 'Equal to', 'Their name ', ''],
-                            'Users create passwords with a substring in the set of dictionary words': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Dictionary Words', ''],
-                            'Users create passwords with a substring in the set of dictionary words followed by a number': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Dictionary Words + ', 'Followed by a number'],
-                            'Users create passwords with a substring in the set of dictionary words in reverse': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Dictionary Words + ', 'In reverse'],
-                            'Users create passwords with a substring in the set of dictionary words with numbers substituted for letters': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Dictionary Words + ', 'With numbers substituted for letters'],
-                            'Users create passwords with a substring in the set of dictionary words preceded or followed by a number or special character (unspec)': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Dictionary Words + ', 'Preceded or followed by a number or special character (unspec)'],
-                            'Users create passwords with a substring in the set of otherwise forbidden content concatenated': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Otherwise forbidden content ', 'Concatenated'],
-                            'Users create passwords with a substring in the set of otherwise forbidden contentin reverse': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Otherwise forbidden content ', 'In reverse'],
-                            'Users create passwords with a substring in the set of otherwise forbidden content preceded or followed by a number': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Otherwise forbidden content ', 'Preceded or followed by a number'],
-                            'Users create passwords with a substring in the set of their last/number/ passwords': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Their last ', '/number/ passwords'],
-                            'Users create passwords with a substring in the set of their last/number/ years of passwords': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Their last ', '/number/ years of passwords'],
-                            'Users create passwords with a substring in the set of strings with a character repeated /number/ or more times consecutively': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'A character repeated /number/ or more times consecutively'],
-                            'Users create passwords with a substring in the set of strings with a character repeated /number/ or more times': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'A character repeated /number/ or more times'],
-                            'Users create passwords with a substring in the set of strings with a run of /number/ or more consecutive characters in sequence': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'A run of /number/ or more consecutive characters in sequence'],
-                            'Users create passwords with a substring in the set of strings with at least /number/ unique characters': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'At least /number/ unique characters'],
-                            'Users create passwords with a substring in the set of strings with characters from /number/ of these /number/ sets:': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'Characters from /number/ of these /number/ sets:'],
-                            'Users create passwords with a substring in the set of strings with word or number patterns (unspec)': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Strings with ', 'Word or number patterns (unspec)'],
-                            'Users create passwords with a substring in the set of passwords to an outside system': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'passwords ', 'To an outside system'],
-                            'Users create passwords with a substring in the set of passwords to any other system': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'passwords ', 'To any other system'],
-                            'Users create passwords with a substring in the set of those passwords used /number/ times in the last /number/ years': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Those passwords used /number/ times in the last /number/ years ', ''],
-                            'Users create passwords with a substring in the set of proper nouns': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Proper nouns ', ''],
-                            'Users create passwords with a substring in the set of incremental changes to existing passwords (unspec)': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Incremental changes to existing passwords (unspec) ', ''],
-                            'Users create passwords with a substring in the set of personally identifying information': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Personally identifying information ', ''],
-                            'Users create passwords with a substring in the set of vendor default passwords': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Vendor default passwords ', ''],
-                            'Users create passwords with a substring in the set of addresses or other locations': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Addresses or other locations ', ''],
-                            'Users create passwords with a substring in the set of birthdays or other dates': ['Users', 'Create Passwords', 'With a substring', 'In the set of ', 'Birthdays or other dates ', ''],
-                            'Users store passwords in writing anywhere': ['Users', 'Store Passwords', 'In writing', 'Anywhere', '', ''],
-                            'Users store passwords in writing in a secure location': ['Users', 'Store Passwords', 'In writing', 'In a secure location', '', ''],
-                            'Users store passwords in writing in an unsecure location': ['Users', 'Store Passwords', 'In writing', 'In an unsecure location', '', ''],
-                            'Users store passwords in writing in automated scripts': ['Users', 'Store Passwords', 'In writing', 'In automated scripts', '', ''],
-                            'Users store passwords in writing in clear text or weakly encrypted': ['Users', 'Store Passwords', 'In writing', 'In clear text or weakly encrypted', '', ''],
-                            'Users store passwords in writing in clear text in an unsecure location': ['Users', 'Store Passwords', 'In writing', 'In clear text in an unsecure location', '', ''],
-                            'Users store passwords in writing on outside systems': ['Users', 'Store Passwords', 'In writing', 'On outside systems', '', ''],
-                            'Users store passwords online anywhere': ['Users', 'Store Passwords', 'Online', 'Anywhere', '', ''],
-                            'Users store passwords online in a secure location': ['Users', 'Store Passwords', 'Online', 'In a secure location', '', ''],
-                            'Users store passwords online in an unsecure location': ['Users', 'Store Passwords', 'Online', 'In an unsecure location', '', ''],
-                            'Users store passwords online in automated scripts': ['Users', 'Store Passwords', 'Online', 'In automated scripts', '', ''],
-                            'Users store passwords online in clear text or weakly encrypted': ['Users', 'Store Passwords', 'Online', 'In clear text or weakly encrypted', '', ''],
-                            'Users store passwords online in clear text in an unsecure location': ['Users', 'Store Passwords', 'Online', 'In clear text in an unsecure location', '', ''],
-                            'Users store passwords online on outside systems': ['Users', 'Store Passwords', 'Online', 'On outside systems', '', ''],
-                            'Users fail to authenticate /number/ times in a /number/ /time unit/ interval to avoid administrative unlock or a /number/ /time unit/ lockout': ['Users', 'Fail to authenticate', '/number/ times in a /number/ /time unit/ interval', 'to avoid', 'Administrative unlock or a /number/ /time unit/ lockout', ''],
-                            'Users fail to authenticate /number/ times in a /number/ /time unit/ interval to avoid administrative unlock': ['Users', 'Fail to authenticate', '/number/ times in a /number/ /time unit/ interval', 'to avoid', 'Administrative unlock', ''],
-                            'Users fail to authenticate /number/ times in a /number/ /time unit/ interval to avoid a lockout of unspecified duration': ['Users', 'Fail to authenticate', '/number/ times in a /number/ /time unit/ interval', 'to avoid', 'A lockout of unspecified duration', ''],
-                            'Users fail to authenticate /number/ times in a /number/ /time unit/ interval to avoid a /number/ /time unit/ lockout': ['Users', 'Fail to authenticate', '/number/ times in a /number/ /time unit/ interval', 'to avoid', 'A /number/ /time unit/ lockout', ''],
-                            'Users fail to authenticate /number/ times to avoid administrative unlock or a /number/ /time unit/ lockout': ['Users', 'Fail to authenticate', '/number/ times', 'to avoid', 'Administrative unlock or a /number/ /time unit/ lockout ', ''],
-                            'Users fail to authenticate /number/ times to avoid administrative unlock': ['Users', 'Fail to authenticate', '/number/ times', 'to avoid', 'Administrative unlock ', ''],
-                            'Users fail to authenticate /number/ times to avoid a lockout of unspecified duration': ['Users', 'Fail to authenticate', '/number/ times', 'to avoid', 'A lockout of unspecified duration ', ''],
-                            'Users fail to authenticate /number/ times to avoid a /number/ /time unit/ lockout': ['Users', 'Fail to authenticate', '/number/ times', 'to avoid', 'A /number/ /time unit/ lockout ', '']
-                            }
+    def __init__(self, fuzzy_distance=0):
+        """
+        Constructor for our hash table.
+
+        :param fuzzy_distance: Integer.  If above 0, base BNF rules that are not keys are mapped to the single
+                               closest key, if it is at most this many inserted, deleted or substituted words away.
+        """
+        self.fuzzy_distance = fuzzy_distance
+        self._fuzzy_matches = {}
+        # our grammar, built from grammarTable.csv by BuildGrammar.py, is shared by every HashTable
+        self._hash_table = GrammarIndex.HASH_TABLE
+        self._trie = GrammarIndex.TRIE
+
+    def _find_nearest_keys(self, path, max_distance):
+        """
+        Finds the keys fewest words away from a rule.  Our trie is walked with one row of the word edit distance
+        table per node, so shared starts of keys are only compared once and branches already further than
+        max_distance are never entered.  Only the cells of a row within max_distance of its node's depth can be
+        close enough, so each row is computed over that band alone, and every other cell is left at max_distance + 1.
+
+        :param path: List of strings.  Our base BNF rule, without its verb, split into words.
+        :param max_distance: Integer.  Keys further away than this are ignored.
+        :return: Tupple.  Smallest distance found and a list of (key, children) at that distance.
+        """
+        too_far = max_distance + 1
+        best_distance = too_far
+        best_keys = []
+        first_row = list(range(min(len(path), max_distance) + 1)) + [too_far] * (len(path) - max_distance)
+        stack = [(self._trie, 0, first_row)]
+        while len(stack) > 0:
+            node, depth, previous_row = stack.pop()
+            depth += 1
+            # our band of columns, those at most max_distance words from our depth
+            low = max(1, depth - max_distance)
+            high = min(len(path), depth + max_distance)
+            for word, child in node.items():
+                if word == _KEY_END:
+                    if previous_row[-1] > max_distance:
+                        continue
+                    if previous_row[-1] < best_distance:
+                        best_distance = previous_row[-1]
+                        best_keys = [child]
+                    elif previous_row[-1] == best_distance:
+                        best_keys.append(child)
+                    continue
+                if low > high:
+                    continue
+
+                row = [too_far] * (len(path) + 1)
+                if depth <= max_distance:
+                    row[0] = depth
+                left = row[low - 1]
+                for j in range(low, high + 1):
+                    diagonal = previous_row[j - 1]
+                    cell = diagonal if path[j - 1] == word else diagonal + 1   # match or substitute
+                    if previous_row[j] + 1 < cell:   # insert
+                        cell = previous_row[j] + 1
+                    if left + 1 < cell:   # delete
+                        cell = left + 1
+                    row[j] = cell
+                    left = cell
+                if min(row[low - 1:high + 1]) <= min(best_distance, max_distance):
+                    stack.append((child, depth, row))
+
+        return best_distance, sorted(best_keys)
+
+    def _find_key(self, rule):
+        """
+        Finds the verb of a base BNF rule and the key of our hash table it maps to.
+
+        :param rule: String.  Our base BNF rule.
+        :return: Tupple.  Our verb, our key, its children and how many words away from our rule it is.
+        """
+        words = rule.split()
+        verb, verb_end = self._get_verb(words)
+        if verb is None:
+            raise UnknownRuleError(rule, words[:1], list(_VERBS))
+
+        path = words[:1] + words[verb_end:]
+        node = self._trie
+        for matched, word in enumerate(path):
+            if word not in node:
+                break
+            node = node[word]
+        else:
+            matched = len(path)
+            if _KEY_END in node:
+                return (verb,) + node[_KEY_END] + (0,)
+
+        path = tuple(path)
+        if self.fuzzy_distance > 0:
+            if path not in self._fuzzy_matches:
+                if len(self._fuzzy_matches) >= _MAX_FUZZY_MATCHES:
+                    self._fuzzy_matches.clear()
+                self._fuzzy_matches[path] = self._find_nearest_keys(path, self.fuzzy_distance)
+
+            distance, nearest_keys = self._fuzzy_matches[path]
+            if len(nearest_keys) == 1:
+                return (verb,) + nearest_keys[0] + (distance,)
+
+        expected_words = []
+        if matched == len(path) or path[matched] not in node:
+            expected_words = [next_word for next_word in node if next_word != _KEY_END]
+        distance, nearest_keys = self._find_nearest_keys(path, max(self.fuzzy_distance, _SUGGESTION_DISTANCE))
+        raise UnknownRuleError(rule, path[:matched], expected_words, [key for key, children in nearest_keys])
+
+    def _get_verb(self, words):
+        """
+        Gets the modal verb that follows the subject of a base BNF rule.
+
+        :param words: List of strings.  Our base BNF rule, split into words.
+        :return: Tupple.  Our verb (must, mustNot, should or shouldNot), or None if there isn't one, and the
+                 index of the first word after it.
+        """
+        if len(words) < 2 or words[1] not in _VERBS:
+            return None, 1
+        if len(words) > 2 and words[2] == "not":
+            return words[1] + "Not", 3
+
+        return words[1], 2
 
     def get_verb_and_children(self, rule):
         """
         Converts a base BNF rule into a list of all parameters necessary for
-        our visualization.
+        our visualization.  The rule is scanned once, word by word, so extra
+        spaces between words do not matter.
 
         :param rule: String. Our base BNF rule
         :return: List. [verb, child0, child1, child2, child3, child4, child5]
         """
-        verb = re.findall("(must not |must |should not |should )", rule)[0]
-        rule = rule.replace(verb, "")
-        verb = verb.replace("n", "N").replace(" ", "")
-        print("Search in hash:", rule)
-        return [verb] + self._hash_table.get(rule)
+        logger.debug("Search in hash: %s", rule)
+        verb, key, children, distance = self._find_key(rule)
+
+        return [verb] + children
+
+    def get_remapping(self, rule):
+        """
+        Gets the key a base BNF rule was fuzzy matched to.
+
+        :param rule: String.  Our base BNF rule.
+        :return: Tupple.  Our key and how many words away from our rule it is, 0 if our rule is a key.
+        """
+        verb, key, children, distance = self._find_key(rule)
+
+        return key, distance
+
+    def get_keys(self):
+        """
+        Gets every base BNF rule in our hash table.
+
+        :return: List of strings.  Our keys, sorted.
+        """
+        return sorted(self._hash_table)
+
+    def get_version(self):
+        """
+        Gets a version of our hash table that changes whenever any of its keys or values, or our fuzzy distance,
+        change.
+
+        :return: String.  Hex digest of our hash table.
+        """
+        table = repr((self.fuzzy_distance, sorted(self._hash_table.items())))
+        return hashlib.sha1(table.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def get_hash_table(fuzzy_distance=0):
+    """
+    Gets our hash table, built once per fuzzy distance, so its fuzzy matches are shared by every policy parsed in
+    our process.
+
+    :param fuzzy_distance: Integer.  See HashTable.
+    :return: HashTable.
+    """
+    return HashTable(fuzzy_distance)
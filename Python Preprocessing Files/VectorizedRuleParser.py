@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Module contains a VectorizedRuleParser object, an alternative to RuleParser
+that parses a whole corpus of BNF rules at once with pandas string operations
+instead of one rule at a time.  Its columns are identical to RuleParser's.
+
+Corpora repeat the same rules many times, so each distinct rule is parsed only
+once, and each distinct base is looked up in our hash table only once.  Results
+are expanded back to every rule by index.  Our verb and children columns are
+categorical, an integer code per rule into a small dictionary of values.
+"""
+
+import re
+import numpy
+import pandas
+import RuleParser
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+# shared with RuleParser, so both engines bin rules the same way
+_VERB_CATEGORIES = RuleParser._VERB_CATEGORIES
+_GRAMMARS = RuleParser._GRAMMARS
+_UNSPEC_SPECIALS = RuleParser._UNSPEC_SPECIALS
+_NUMBER_SUBSTITUTIONS = RuleParser._NUMBER_SUBSTITUTIONS
+ROW_COLUMNS = RuleParser.ROW_COLUMNS
+
+_NUMBER = "[0-9]+|" + re.escape(RuleParser.USER_INPUT_WARNING)
+# a word as str.split() sees it in a rule split on its variables
+_WORD = "(?:(?!" + re.escape(RuleParser.USER_INPUT_WARNING) + r")[^\s0-9])+"
+
+_CHARSET_PATTERNS = ("character in the set of (.*)", "characters in the set of (.*)", "sets: (.*)")
+_SPECIALS_PATTERN = "these special characters: (.*)"
+_VARIABLES_PATTERN = "(?s)^.*?(" + _NUMBER + ")(?:.*?(" + _NUMBER + "))?"
+# our unit when a rule has one variable skips "or more"
+_SINGLE_UNIT_PATTERN = "(?s)^.*?(?:" + _NUMBER + r")\s*(?:(?:or|more)\s+)*(\S+)"
+_UNIT1_PATTERN = "(?s)^.*?(?:" + _NUMBER + r")\s*(" + _WORD + ")"
+_UNIT2_PATTERN = "(?s)^.*?(?:" + _NUMBER + ").*?(?:" + _NUMBER + r")\s*(" + _WORD + ")"
+_CHARSET_BASE_PATTERN = r"(?s)(character[s\s]+in the set of).*"
+_SETS_BASE_PATTERN = "(?s)sets:.*"
+
+
+def get_children_columns(bases, hash_table):
+    """
+    Gets the verb and children columns of our bases, looking each distinct base up in our hash table once and
+    expanding the result back to every base by index.
+
+    :param bases: List of strings.  Our base BNF rules.
+    :param hash_table: TreeStructureHash.HashTable.  Hash table our bases are looked up in.
+    :return: Dict.  A pandas.Categorical for each of verb and child0-child5.
+    """
+    base_codes, unique_bases = pandas.factorize(pandas.Series(bases, dtype=object))
+    verbs_and_children = [hash_table.get_verb_and_children(base) for base in unique_bases]
+
+    columns = {}
+    for i, column in enumerate(ROW_COLUMNS[:7]):
+        codes, values = pandas.factorize(pandas.Series([row[i] for row in verbs_and_children], dtype=object))
+        columns[column] = pandas.Categorical.from_codes(codes[base_codes], values)
+
+    return columns
+
+
+class VectorizedRuleParser:
+    """
+    Parses lists of BNF rules (without their trailing periods) into the values of our CSV columns, including
+    their verbs and children from our hash table.
+    """
+
+    def __init__(self, hash_table):
+        """
+        Constructor for our parser.
+
+        :param hash_table: TreeStructureHash.HashTable.  Hash table our bases are looked up in.
+        """
+        self.hash_table = hash_table
+
+    def parse_rules(self, rules):
+        """
+        Gets every column value for a list of BNF rules.
+
+        :param rules: List of strings.  Our BNF rules.
+        :return: pandas.DataFrame.  One row per rule, with the ROW_COLUMNS of PolicyToCSV.parse_completed_file.
+        """
+        codes, unique_rules = pandas.factorize(pandas.Series(rules, dtype=object))
+        unique_rules = pandas.Series(unique_rules, dtype=object)
+
+        columns = self._get_columns(unique_rules)
+        children = pandas.DataFrame(get_children_columns(columns["BNF Base"], self.hash_table))
+        columns = pandas.concat([children, columns], axis=1)
+
+        return columns.take(codes).reset_index(drop=True)[ROW_COLUMNS]
+
+    def _get_columns(self, rules):
+        """
+        Gets every column value, other than our verbs and children, for our distinct rules.
+
+        :param rules: pandas.Series.  Our distinct BNF rules.
+        :return: pandas.DataFrame.  One row per rule.
+        """
+        charset = pandas.Series("", index=rules.index, dtype=object)
+        for pattern in reversed(_CHARSET_PATTERNS):   # our first pattern matched wins
+            charset = rules.str.extract(pattern, expand=False).fillna(charset)
+        variables = rules.str.extract(_VARIABLES_PATTERN).fillna("")
+        var1_units, var2_units = self._get_units(rules)
+
+        return pandas.DataFrame({"BNF": rules + ".",
+                                 "BNF Base": self._get_bases(rules),
+                                 "BNF var1": variables[0],
+                                 "BNF var1 Unit": var1_units,
+                                 "BNF var2": variables[1],
+                                 "BNF var2 Unit": var2_units,
+                                 "verb category": self._select(rules, _VERB_CATEGORIES, "recommended"),
+                                 "Grammar": self._select(rules, _GRAMMARS, "fail to authenticate"),
+                                 "charset": charset,
+                                 "spec char": self._get_specials(charset)}, dtype=object)
+
+    def _select(self, rules, phrases, default):
+        """
+        Gets the value of the first phrase found in each rule.
+
+        :param rules: pandas.Series.  Our BNF rules.
+        :param phrases: Tupple of tupples.  Phrases and their values, checked in order.
+        :param default: String.  Value when no phrase is found.
+        :return: pandas.Series.  Our values.
+        """
+        conditions = [rules.str.contains(phrase, regex=False).to_numpy(dtype=bool) for phrase, value in phrases]
+        values = numpy.select(conditions, [value for phrase, value in phrases], default).astype(object)
+
+        return pandas.Series(values, index=rules.index, dtype=object)
+
+    def _get_specials(self, charset):
+        """
+        Get our special char sets from our char sets.
+
+        :param charset: pandas.Series.  Our char sets.
+        :return: pandas.Series.  Our special chars, "(unspec)" or empty.
+        """
+        specials = charset.str.extract(_SPECIALS_PATTERN, expand=False).fillna("")
+        unspec = charset.str.contains(_UNSPEC_SPECIALS, regex=False).to_numpy(dtype=bool)
+
+        return specials.mask(unspec, "(unspec)")
+
+    def _get_units(self, rules):
+        """
+        Gets variable 1 units and variable 2 units of our BNF rules.
+
+        :param rules: pandas.Series.  Our BNF rules.
+        :return: Tupple.  pandas.Series of our variable 1 units and of our variable 2 units.
+        """
+        variables = rules.str.count(_NUMBER).to_numpy()
+        single = variables == 1
+        several = variables > 1
+
+        single_units = rules.str.extract(_SINGLE_UNIT_PATTERN, expand=False)
+        single_units = single_units.replace({"consecutive": "consecutive characters", "unique": "unique characters"})
+        var1_units = rules.str.extract(_UNIT1_PATTERN, expand=False).replace({"of": "sets"})
+        var2_units = rules.str.extract(_UNIT2_PATTERN, expand=False).str.replace(":", "", regex=False)
+
+        var1_units = pandas.Series(numpy.select([single, several], [single_units.to_numpy(), var1_units.to_numpy()],
+                                                ""), index=rules.index, dtype=object)
+        var2_units = pandas.Series(numpy.where(several, var2_units.to_numpy(), ""), index=rules.index, dtype=object)
+
+        return var1_units, var2_units
+
+    def _get_bases(self, rules):
+        """
+        Gets the BNF bases of our BNF rules.
+
+        :param rules: pandas.Series.  Our BNF rules.
+        :return: pandas.Series.  Our rules without variables.
+        """
+        bases = rules.str.replace(_CHARSET_BASE_PATTERN, r"\1 /char set/", n=1, regex=True)
+        bases = bases.str.replace(_SETS_BASE_PATTERN, "sets:  /char set/", n=1, regex=True)
+        for pattern, replacement in _NUMBER_SUBSTITUTIONS:
+            bases = bases.str.replace(pattern, replacement, regex=True)
+
+        return bases
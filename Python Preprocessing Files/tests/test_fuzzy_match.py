@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Checks that the fuzzy search of our hash table finds the same keys, at the
+same distance, as comparing a rule to every key one at a time.
+
+Run from "Python Preprocessing Files":
+    python3 -m pytest tests
+"""
+
+import os
+import sys
+import random
+import unittest
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+
+import GrammarIndex  # noqa: E402
+import TreeStructureHash  # noqa: E402
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+MAX_DISTANCES = [1, 2, 3]
+RULES_PER_DISTANCE = 100
+
+
+def get_word_distance(words, other_words):
+    """
+    Gets the word edit distance between two rules, with the whole edit distance table.
+
+    :param words: List of strings.  Our first rule, split into words.
+    :param other_words: List of strings.  Our second rule, split into words.
+    :return: Integer.  Number of inserted, deleted or substituted words.
+    """
+    previous_row = list(range(len(words) + 1))
+    for i, other_word in enumerate(other_words, 1):
+        row = [i]
+        for j, word in enumerate(words, 1):
+            row.append(min(previous_row[j - 1] + (word != other_word), previous_row[j] + 1, row[j - 1] + 1))
+        previous_row = row
+
+    return previous_row[-1]
+
+
+class FuzzyMatchTest(unittest.TestCase):
+    """
+    Compares our trie search to every key, on rules a few words away from our keys.
+    """
+
+    def test_nearest_keys(self):
+        keys = sorted(GrammarIndex.HASH_TABLE)
+        words = sorted({word for key in keys for word in key.split()}) + ["unknown"]
+        random_numbers = random.Random(0)
+        for max_distance in MAX_DISTANCES:
+            hash_table = TreeStructureHash.HashTable(max_distance)
+            for _ in range(RULES_PER_DISTANCE):
+                path = random_numbers.choice(keys).split()
+                for _ in range(random_numbers.randrange(max_distance + 2)):
+                    position = random_numbers.randrange(len(path) + 1)
+                    if position < len(path) and random_numbers.random() < 0.5:
+                        del path[position]
+                    else:
+                        path.insert(position, random_numbers.choice(words))
+
+                distances = {key: get_word_distance(path, key.split()) for key in keys}
+                best_distance = min(distances.values())
+                with self.subTest(path=" ".join(path), max_distance=max_distance):
+                    distance, nearest_keys = hash_table._find_nearest_keys(tuple(path), max_distance)
+                    if best_distance > max_distance:
+                        self.assertEqual([], nearest_keys)
+                    else:
+                        self.assertEqual(best_distance, distance)
+                        self.assertEqual(sorted(key for key in keys if distances[key] == best_distance),
+                                         [key for key, children in nearest_keys])
+
+
+if __name__ == "__main__":
+    unittest.main()
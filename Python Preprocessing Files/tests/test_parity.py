@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Checks that PolicyToCSV still writes, byte for byte, the csvs of the original
+parser for each of our Test Directories, with and without metadata, whether
+our rows are collected in a df or streamed.
+
+Expected csvs (expected/) were written by the original PolicyToCSV.py, before
+rules were parsed in a single pass.  "Test Files with Metadata without
+metadata.csv" is its directory converted with BNFdfWithoutMeatadata.
+
+Run from "Python Preprocessing Files":
+    python3 -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+import pandas
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+
+import PolicyMetrics  # noqa: E402
+import PolicyToCSV  # noqa: E402
+import StageProfile  # noqa: E402
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+TEST_DIRECTORIES = os.path.join(os.path.dirname(DIRECTORY), "Test Directories")
+EXPECTED_DIRECTORY = os.path.join(DIRECTORY, "expected")
+# our directories without metadata, and our directory with it
+DIRECTORIES_WITHOUT_METADATA = ["Test Files 1", "Test Files 2", "Test Files 3"]
+DIRECTORY_WITH_METADATA = "Test Files with Metadata"
+
+
+class ParityTest(unittest.TestCase):
+    """
+    Converts each of our Test Directories and compares our csv to the expected csv.
+    """
+
+    def assert_expected_csv(self, BNF_df, expected_name):
+        """
+        Exports a BNFdf and checks its csv is the expected csv.  Line endings are those of our platform, so they
+        are not compared.
+
+        :param BNF_df: BNFdf.  Our BNFdf.
+        :param expected_name: String.  Name of our expected csv, without its extension.
+        :return: VOID
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            BNF_df.export_BNFdf(directory, "out")
+            with open(os.path.join(directory, "out.csv")) as out_file:
+                csv = out_file.read()
+        with open(os.path.join(EXPECTED_DIRECTORY, expected_name + ".csv")) as expected_file:
+            expected_csv = expected_file.read()
+
+        self.assertEqual(expected_csv, csv)
+
+    def test_without_metadata(self):
+        for name in DIRECTORIES_WITHOUT_METADATA:
+            for stream in (False, True):
+                with self.subTest(directory=name, stream=stream):
+                    BNF_df = PolicyToCSV.build_BNFdf(os.path.join(TEST_DIRECTORIES, name), stream)
+                    self.assertIsInstance(BNF_df.enricher, PolicyToCSV.FileNameEnricher)
+                    self.assert_expected_csv(BNF_df, name)
+
+    def test_with_metadata(self):
+        for stream in (False, True):
+            with self.subTest(stream=stream):
+                BNF_df = PolicyToCSV.build_BNFdf(os.path.join(TEST_DIRECTORIES, DIRECTORY_WITH_METADATA), stream)
+                self.assertIsInstance(BNF_df.enricher, PolicyToCSV.MetadataEnricher)
+                self.assert_expected_csv(BNF_df, DIRECTORY_WITH_METADATA)
+
+    def test_metadata_directory_without_metadata(self):
+        for stream in (False, True):
+            with self.subTest(stream=stream):
+                BNF_df = PolicyToCSV.BNFdfWithoutMeatadata(os.path.join(TEST_DIRECTORIES, DIRECTORY_WITH_METADATA),
+                                                           stream)
+                self.assert_expected_csv(BNF_df, DIRECTORY_WITH_METADATA + " without metadata")
+
+    def test_streamed_exports_are_repeatable(self):
+        files_location = os.path.join(TEST_DIRECTORIES, DIRECTORIES_WITHOUT_METADATA[0])
+        base_counts = PolicyToCSV.build_BNFdf(files_location).base_counts
+        BNF_df = PolicyToCSV.build_BNFdf(files_location, stream=True)
+        for export in range(2):
+            with self.subTest(export=export):
+                self.assert_expected_csv(BNF_df, DIRECTORIES_WITHOUT_METADATA[0])
+                self.assertEqual(base_counts, BNF_df.base_counts)
+
+    def test_metadata_directory_without_rules(self):
+        with tempfile.TemporaryDirectory() as directory:
+            metadata_directory = os.path.join(TEST_DIRECTORIES, DIRECTORY_WITH_METADATA)
+            for name in os.listdir(metadata_directory):
+                with open(os.path.join(directory, name), "w") as out_file:
+                    if name.endswith(".txt"):
+                        with open(os.path.join(metadata_directory, name)) as metadata_file:
+                            out_file.write(metadata_file.read())
+            for stream in (False, True):
+                with self.subTest(stream=stream):
+                    BNF_df = PolicyToCSV.build_BNFdf(directory, stream)
+                    self.assertIsInstance(BNF_df.enricher, PolicyToCSV.FileNameEnricher)
+                    self.assertEqual(PolicyToCSV.BNFdfWithoutMeatadata.columns, BNF_df.columns)
+
+    def test_profile_is_forwarded(self):
+        for BNFdf_class, name in ((PolicyToCSV.BNFdfWithMeatadata, DIRECTORY_WITH_METADATA),
+                                  (PolicyToCSV.BNFdfWithoutMeatadata, DIRECTORIES_WITHOUT_METADATA[0])):
+            with self.subTest(BNFdf_class=BNFdf_class.__name__):
+                profile = StageProfile.StageProfile()
+                BNF_df = BNFdf_class(os.path.join(TEST_DIRECTORIES, name), profile=profile)
+                self.assertIs(profile, BNF_df.profile)
+                self.assertGreater(profile.stages["parse"]["rules"], 0)
+
+    def test_metrics_are_forwarded(self):
+        for BNFdf_class, name in ((PolicyToCSV.BNFdfWithMeatadata, DIRECTORY_WITH_METADATA),
+                                  (PolicyToCSV.BNFdfWithoutMeatadata, DIRECTORIES_WITHOUT_METADATA[0])):
+            with self.subTest(BNFdf_class=BNFdf_class.__name__):
+                BNF_df = BNFdf_class(os.path.join(TEST_DIRECTORIES, name), metrics=True)
+                self.assertEqual(PolicyMetrics.COLUMNS, BNF_df.columns[-len(PolicyMetrics.COLUMNS):])
+                self.assertEqual(BNF_df.columns, list(BNF_df.df.columns))
+                self.assertEqual({8}, set(BNF_df.df["Min Length"]))
+
+    def test_variable_metrics(self):
+        df = PolicyToCSV.build_BNFdf(os.path.join(TEST_DIRECTORIES, "Test Files 1"), metrics=True).df
+        rows = df.set_index("BNF")
+
+        expiry = rows.loc["Users must change passwords before 90 days."]
+        self.assertEqual(90, expiry["BNF var1 Value"])
+        self.assertEqual(7776000, expiry["BNF var1 Normalized"])
+        self.assertEqual("seconds", expiry["BNF var1 Normalized Unit"])
+        length = rows.loc["Users must create passwords with length greater than or equal to 8 characters."]
+        self.assertEqual(8, length["BNF var1 Normalized"])
+        self.assertEqual("characters", length["BNF var1 Normalized Unit"])
+        # a rule without variables
+        no_variables = rows.loc["Users must not store passwords online in automated scripts."]
+        for column in ("BNF var1 Value", "BNF var1 Normalized", "BNF var2 Value", "BNF var2 Normalized"):
+            self.assertIs(pandas.NA, no_variables[column])
+
+        # our only policy, so each of its metrics is on every rule
+        self.assertEqual({8}, set(df["Min Length"]))
+        self.assertEqual({4}, set(df["Lockout Threshold"]))
+        self.assertEqual({90}, set(df["Expiry Days"]))
+
+    def test_policy_metrics(self):
+        df = PolicyToCSV.build_BNFdf(os.path.join(TEST_DIRECTORIES, "Test Files 2"), metrics=True).df
+        metrics = df.groupby("File Name", observed=True)[["Min Length", "Lockout Threshold"]].first(skipna=False)
+
+        # prohibited lengths are not minimums, and CustomerFacing4 has no required length
+        self.assertEqual([6, 6, 8], metrics["Min Length"].iloc[:3].tolist())
+        self.assertIs(pandas.NA, metrics.loc["CustomerFacing4", "Min Length"])
+        self.assertTrue(metrics["Lockout Threshold"].isna().all())
+
+    def test_vectorized_engine(self):
+        for name in DIRECTORIES_WITHOUT_METADATA + [DIRECTORY_WITH_METADATA]:
+            with self.subTest(directory=name):
+                BNF_df = PolicyToCSV.build_BNFdf(os.path.join(TEST_DIRECTORIES, name), engine="vectorized")
+                self.assert_expected_csv(BNF_df, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Checks that ParseCache gives back the rows it was given, and that it only
+ever removes its own stale version directories from our cache location.
+
+Run from "Python Preprocessing Files":
+    python3 -m pytest tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+
+import ParseCache  # noqa: E402
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+COMPLETED_FILE = "Users must create passwords with length greater than or equal to 8 characters.\n"
+ROWS = [["must", "Users create passwords with length greater than or equal to 8 characters"]]
+
+
+class ParseCacheTest(unittest.TestCase):
+    """
+    Builds caches in a temporary directory.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_location = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_put_and_get(self):
+        cache = ParseCache.ParseCache(self.cache_location)
+        self.assertIsNone(cache.get(COMPLETED_FILE))
+        cache.put(COMPLETED_FILE, ROWS)
+        self.assertEqual(ROWS, cache.get(COMPLETED_FILE))
+
+    def test_foreign_directories_survive(self):
+        foreign_locations = [os.path.join(self.cache_location, name) for name in ("policies", "important_data")]
+        for foreign_location in foreign_locations:
+            os.makedirs(foreign_location)
+            with open(os.path.join(foreign_location, "Policy1"), "w") as foreign_file:
+                foreign_file.write(COMPLETED_FILE)
+
+        cache = ParseCache.ParseCache(self.cache_location)
+        cache.put(COMPLETED_FILE, ROWS)
+        cache.clear()
+        cache.evict()
+
+        for foreign_location in foreign_locations:
+            self.assertTrue(os.path.isfile(os.path.join(foreign_location, "Policy1")))
+
+    def test_other_fuzzy_distances_are_kept(self):
+        cache = ParseCache.ParseCache(self.cache_location)
+        cache.put(COMPLETED_FILE, ROWS)
+        fuzzy_cache = ParseCache.ParseCache(self.cache_location, fuzzy_distance=1)
+        self.assertNotEqual(cache.version, fuzzy_cache.version)
+
+        self.assertEqual(ROWS, ParseCache.ParseCache(self.cache_location).get(COMPLETED_FILE))
+
+    def test_stale_versions_are_removed(self):
+        stale_versions = [ParseCache.CACHE_FORMAT_VERSION + "-" + "0" * 40 + "-0",
+                          str(int(ParseCache.CACHE_FORMAT_VERSION) + 1) + "-" + "0" * 40 + "-0",
+                          ParseCache.CACHE_FORMAT_VERSION + "-" + "0" * 40]
+        for stale_version in stale_versions:
+            os.makedirs(os.path.join(self.cache_location, stale_version))
+
+        ParseCache.ParseCache(self.cache_location)
+
+        for stale_version in stale_versions:
+            self.assertFalse(os.path.exists(os.path.join(self.cache_location, stale_version)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Checks that the HTTP protocol of PolicyService answers bad Content-Lengths
+straight away, and that a client that never sends its body does not stop
+our service from answering others.
+
+Run from "Python Preprocessing Files":
+    python3 -m pytest tests
+"""
+
+import os
+import sys
+import json
+import socket
+import threading
+import unittest
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRECTORY))
+
+import PolicyService  # noqa: E402
+
+__author__ = "Elijah Peake"
+__email__ = "elijah.peake@gmail.com"
+
+POLICY = b"Users must create passwords with length greater than or equal to 8 characters.\n"
+# seconds we wait for any response, far longer than any of our responses take
+TIMEOUT = 10
+
+
+class PolicyServiceTest(unittest.TestCase):
+    """
+    Serves HTTP on a free port, in a thread, for each of our tests.
+    """
+
+    def setUp(self):
+        self.server = PolicyService.PolicyService().get_http_server(port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def connect(self):
+        """
+        Opens a connection to our server.
+
+        :return: socket.socket.  Our connection.
+        """
+        connection = socket.create_connection(self.server.server_address[:2], timeout=TIMEOUT)
+        self.addCleanup(connection.close)
+        return connection
+
+    def request(self, head, body=b""):
+        """
+        Sends a raw request and reads its whole response.
+
+        :param head: String.  Our request line and headers, without the blank line that ends them.
+        :param body: Bytes.  Our body.
+        :return: Tupple.  Our status and the JSON of our response.
+        """
+        connection = self.connect()
+        connection.sendall(head.encode("ascii") + b"\r\nConnection: close\r\n\r\n" + body)
+
+        return self.read_response(connection)
+
+    def read_response(self, connection):
+        """
+        Reads a whole response, until our server closes our connection.
+
+        :param connection: socket.socket.  Our connection.
+        :return: Tupple.  Our status and the JSON of our response.
+        """
+        response = b""
+        while True:
+            data = connection.recv(65536)
+            if data == b"":
+                break
+            response += data
+        status_line, _, rest = response.partition(b"\r\n")
+        headers, _, body = rest.partition(b"\r\n\r\n")
+
+        return int(status_line.split()[1]), json.loads(body)
+
+    def test_parse(self):
+        status, response = self.request("POST /parse HTTP/1.1\r\nContent-Length: %d" % len(POLICY), POLICY)
+        self.assertEqual(200, status)
+        self.assertEqual(1, len(response["rows"]))
+
+    def test_bad_content_lengths(self):
+        for content_length, expected_status in (("-1", 400), ("abc", 400),
+                                                (str(PolicyService.MAX_BODY_BYTES + 1), 413)):
+            with self.subTest(content_length=content_length):
+                status, response = self.request("POST /parse HTTP/1.1\r\nContent-Length: " + content_length)
+                self.assertEqual(expected_status, status)
+                self.assertIn("error", response)
+
+    def test_slow_client_does_not_block_health(self):
+        slow_connection = self.connect()
+        slow_connection.sendall(b"POST /parse HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n"
+                                % len(POLICY) + POLICY[:5])
+
+        status, response = self.request("GET /health HTTP/1.1")
+        self.assertEqual(200, status)
+        self.assertEqual("ok", response["status"])
+
+        # our slow client is still answered once its body arrives
+        slow_connection.sendall(POLICY[5:])
+        status, response = self.read_response(slow_connection)
+        self.assertEqual(200, status)
+
+
+if __name__ == "__main__":
+    unittest.main()
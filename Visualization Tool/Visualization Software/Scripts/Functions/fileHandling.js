@@ -482,23 +482,17 @@ function calculateStats(data, uploadIndex) {
       uniqueCount: [[0, 0], [0, 0], [0, 0], [0, 0], [0, 0], [0, 0]]
     };
 
-    // if rules are equal, increment overlap count
-    for (i = 0; i < statistics.rules[0].length; i++) {
-      let r1 = statistics.rules[0][i].verb + statistics.rules[0][i].child0 + statistics.rules[0][i].child1 + statistics.rules[0][i].child2 + statistics.rules[0][i].child3 + statistics.rules[0][i].child4 + statistics.rules[0][i].child5;
-      for (j = 0; j < statistics.rules[1].length; j++) {
-        let r2 = statistics.rules[1][j].verb + statistics.rules[1][j].child0 + statistics.rules[1][j].child1 + statistics.rules[1][j].child2 + statistics.rules[1][j].child3 + statistics.rules[1][j].child4 + statistics.rules[1][j].child5;
-
-        if (r1 == r2) {
-          let rule = statistics.rules[1][j];
-          let branchIndex = treeCategories.indexOf(rule.child1) + 1;
-
-          jointStatistics.matchCount[0] += 1;
-          jointStatistics.matchCount[branchIndex] += 1;
-
-          break;
-        }
+    // if rules are equal, increment overlap count.  keys of our second file are looked up in a set, instead of
+    // comparing every pair of rules
+    let ruleKeys = new Set(statistics.rules[1].map(ruleKey));
+    statistics.rules[0].forEach(function(rule) {
+      if (ruleKeys.has(ruleKey(rule))) {
+        let branchIndex = treeCategories.indexOf(rule.child1) + 1;
+
+        jointStatistics.matchCount[0] += 1;
+        jointStatistics.matchCount[branchIndex] += 1;
       }
-    }
+    });
 
     // unique = total - overalp for every verb and each file
     for (i = 0; i < statistics.rules.length; i++) {
@@ -519,6 +513,15 @@ function calculateStats(data, uploadIndex) {
   }
 }
 
+/**
+* gets the key of a rule, its verb and children, equal for rules that are the same path of our tree
+* @param {parsed csv row} rule
+* @returns {string}
+*/
+function ruleKey(rule) {
+  return rule.verb + rule.child0 + rule.child1 + rule.child2 + rule.child3 + rule.child4 + rule.child5;
+}
+
 /**
 * gets the statistics used in the redraw stats file and returns our new file name
 * @param {string} id - which input button do the stats correspond to